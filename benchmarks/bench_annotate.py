@@ -0,0 +1,47 @@
+"""Time annotating a column of timestamps with holiday columns, with
+Series.map(kr.get) and with annotate().
+
+Series.map is timed on a sample of the column and extrapolated.
+
+Usage: python benchmarks/bench_annotate.py [size] [sample]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from holidays import KR, annotate
+
+START, END = 1960, 2040
+
+
+def main(size=10_000_000, sample=200_000):
+    rng = np.random.default_rng(0)
+    first = pd.Timestamp(f"{START}-01-01", tz="UTC").value
+    last = pd.Timestamp(f"{END}-12-31", tz="UTC").value
+    values = pd.Series(
+        pd.to_datetime(rng.integers(first, last, size), utc=True)
+    )
+    print(f"{size} timezone-aware timestamps, {START}-{END}")
+
+    kr = KR()
+    kr.populate_range(START, END)
+    picked = values.iloc[:sample]
+    t0 = time.perf_counter()
+    names = picked.dt.tz_convert("Asia/Seoul").dt.date.map(kr.get)
+    per_value = (time.perf_counter() - t0) * size / sample
+
+    t0 = time.perf_counter()
+    frame = annotate(values, country=kr)
+    vectorized = time.perf_counter() - t0
+
+    got = frame["holiday_name"].iloc[:sample].astype(object)
+    assert got.fillna("").tolist() == names.fillna("").tolist()
+    print(f"  Series.map(kr.get) (extrapolated) {per_value:8.2f} s")
+    print(f"  annotate                          {vectorized:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""Compare per-row ``in`` checks against :meth:`HolidayBase.is_holiday_array`
+and :meth:`HolidayBase.holiday_names_array` on an array of dates.
+
+Usage: python benchmarks/bench_arrays.py [rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from holidays import KR
+
+
+def main(rows=1_000_000):
+    rng = np.random.default_rng(0)
+    start = np.datetime64("1990-01-01").astype("int64")
+    end = np.datetime64("2030-12-31").astype("int64")
+    values = rng.integers(start, end, rows).astype("datetime64[D]")
+    kr = KR(years=range(1990, 2031))
+
+    sample = values[: rows // 10].tolist()
+    t0 = time.perf_counter()
+    for value in sample:
+        value in kr
+    loop = (time.perf_counter() - t0) * 10
+
+    t0 = time.perf_counter()
+    kr.is_holiday_array(values)
+    membership = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    kr.holiday_names_array(values)
+    names = time.perf_counter() - t0
+
+    print(f"{rows} dates, 1990-2030")
+    print(f"  per-row 'in' (extrapolated): {loop:8.3f} s")
+    print(f"  is_holiday_array:            {membership:8.3f} s")
+    print(f"  holiday_names_array:         {names:8.3f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,62 @@
+"""Time counting and adding business days on a column of dates, one date at
+a time with HolidayBase.business_days_between/add_business_days, and with
+np.busday_count/np.busday_offset on the exported busdaycalendar.
+
+The per-date methods are timed on a sample of the column and extrapolated.
+
+Usage: python benchmarks/bench_busday.py [size] [sample]
+"""
+
+import sys
+import time
+from datetime import timedelta
+
+import numpy as np
+
+from holidays import KR
+
+START, END = 1960, 2040
+DAYS = 30
+
+
+def main(size=1_000_000, sample=2_000):
+    kr = KR()
+    t0 = time.perf_counter()
+    calendar = kr.to_busdaycalendar(START, END)
+    export = time.perf_counter() - t0
+    print(f"Export {START}-{END}: {export * 1000:.1f} ms "
+          f"({len(calendar.holidays)} holidays)")
+
+    rng = np.random.default_rng(0)
+    first = np.datetime64(f"{START}-01-01")
+    last = np.datetime64(f"{END - 1}-12-01")
+    days = first + rng.integers(0, (last - first).astype(np.int64), size)
+
+    print(f"{size} dates, business days in the next {DAYS} days "
+          f"and {DAYS} business days later")
+    t0 = time.perf_counter()
+    counts = np.busday_count(days, days + DAYS, busdaycal=calendar)
+    # add_business_days does not count the start date, so a start date
+    # that is not a business day rolls back before moving forward.
+    offsets = np.busday_offset(
+        days, DAYS, roll="backward", busdaycal=calendar
+    )
+    vectorized = time.perf_counter() - t0
+
+    picked = days[:sample].tolist()
+    t0 = time.perf_counter()
+    sample_counts = [
+        kr.business_days_between(day, day + timedelta(days=DAYS))
+        for day in picked
+    ]
+    sample_offsets = [kr.add_business_days(day, DAYS) for day in picked]
+    per_date = (time.perf_counter() - t0) * size / sample
+
+    assert sample_counts == counts[:sample].tolist()
+    assert sample_offsets == offsets[:sample].tolist()
+    print(f"  per date (extrapolated) {per_date:8.2f} s")
+    print(f"  numpy busdaycalendar    {vectorized:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
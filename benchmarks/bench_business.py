@@ -0,0 +1,61 @@
+"""Compare business-day arithmetic through :class:`BusinessDays` against a
+day by day loop over ``d in kr`` and a weekday check.
+
+Usage: python benchmarks/bench_business.py [queries]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from holidays import KR
+
+
+def loop_add(kr, day, n):
+    while n > 0:
+        day += timedelta(days=1)
+        if day.weekday() < 5 and day not in kr:
+            n -= 1
+    return day
+
+
+def loop_between(kr, start, end):
+    return sum(
+        1
+        for i in range((end - start).days)
+        if (start + timedelta(days=i)).weekday() < 5
+        and start + timedelta(days=i) not in kr
+    )
+
+
+def main(queries=2000):
+    random.seed(0)
+    days = [
+        date(1990, 1, 1) + timedelta(days=random.randrange(365 * 40))
+        for _ in range(queries)
+    ]
+    offsets = [random.randrange(1, 250) for _ in range(queries)]
+    kr = KR(years=range(1989, 2032))
+
+    t0 = time.perf_counter()
+    for day, n in zip(days, offsets):
+        loop_add(kr, day, n)
+    for day, n in zip(days, offsets):
+        loop_between(kr, day, day + timedelta(days=n))
+    loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for day, n in zip(days, offsets):
+        kr.add_business_days(day, n)
+    for day, n in zip(days, offsets):
+        kr.business_days_between(day, day + timedelta(days=n))
+    engine = time.perf_counter() - t0
+
+    print(f"{queries} add_business_days + business_days_between queries")
+    print(f"  day by day loop:  {loop:8.3f} s")
+    print(f"  BusinessDays:     {engine:8.3f} s (including the first build)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
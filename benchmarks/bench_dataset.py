@@ -0,0 +1,43 @@
+"""Time a cold start (a fresh process) answering holiday lookups from the
+precompiled dataset against calculating the same years.
+
+Usage: python benchmarks/bench_dataset.py [runs]
+"""
+
+import subprocess
+import sys
+import time
+
+SETUP = "import time\nfrom holidays import KR\nt0 = time.perf_counter()\n"
+QUERIES = (
+    "[kr.get(f'{year}-09-17') for year in range(1950, 2051)]\n"
+    "print(time.perf_counter() - t0)\n"
+)
+SCRIPTS = {
+    "calculated": SETUP + "kr = KR()\n" + QUERIES,
+    "dataset": SETUP + "kr = KR.from_dataset()\n" + QUERIES,
+}
+
+
+def main(runs=5):
+    print(f"Cold start and 101 lookups over 1950-2050, best of {runs}")
+    for label, script in SCRIPTS.items():
+        best = best_lookups = float("inf")
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            best = min(best, time.perf_counter() - t0)
+            best_lookups = min(best_lookups, float(output))
+        print(
+            f"  {label:<11} process {best * 1000:8.1f} ms, "
+            f"after import {best_lookups * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,89 @@
+"""Time dispatching tasks that take a KR() calendar of 1950-2050 to a process
+pool, with the calendar pickled into every task as a plain dict (the former
+pickle format), in the compact pickle format, as a frozen calendar, and as a
+shared-memory calendar that the workers attach to by name.
+
+Each task looks up a few dates, so the time per task is mostly the cost of
+shipping the calendar. All the variants must give the same answers.
+
+Usage: python benchmarks/bench_dispatch.py [tasks] [workers] [lookups]
+"""
+
+import pickle
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+from holidays import KR
+from holidays.holiday_base import HolidayBase
+
+START, END = 1950, 2050
+
+
+class LegacyKR(KR):
+    """KR pickled as a dict of dates, as before the compact format."""
+
+    def __reduce__(self):
+        reconstructor, args, state = super(HolidayBase, self).__reduce__()
+        state = dict(state)
+        state["_ordinals"] = list(self._ordinals)
+        for key in ("_business_days", "_exports", "_guards", "_read_only"):
+            state.pop(key, None)
+        return reconstructor, args, state
+
+
+def count_holidays(calendar, days):
+    return sum(day in calendar for day in days)
+
+
+def run(pool, calendar, batches):
+    t0 = time.perf_counter()
+    counts = list(
+        pool.map(count_holidays, [calendar] * len(batches), batches)
+    )
+    return time.perf_counter() - t0, counts
+
+
+def main(tasks=2_000, workers=2, lookups=10):
+    rng = random.Random(0)
+    first = date(START, 1, 1)
+    batches = [
+        [
+            first + timedelta(days=rng.randrange(365 * (END - START)))
+            for _ in range(lookups)
+        ]
+        for _ in range(tasks)
+    ]
+    kr = KR(years=range(START, END + 1))
+    legacy = LegacyKR(years=range(START, END + 1))
+    shared = kr.share()
+    variants = (
+        ("dict pickle", legacy),
+        ("compact pickle", kr),
+        ("frozen", kr.freeze()),
+        ("shared memory", shared),
+    )
+    print(f"{tasks} tasks of {lookups} lookups on {workers} workers")
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            # Start the workers before timing.
+            list(pool.map(count_holidays, [()] * workers, [[]] * workers))
+            expected = None
+            for label, calendar in variants:
+                size = len(pickle.dumps(calendar))
+                elapsed, counts = run(pool, calendar, batches)
+                if expected is None:
+                    expected = counts
+                assert counts == expected, label
+                print(
+                    f"  {label:<15} {size:8} bytes pickled  "
+                    f"{elapsed / tasks * 1e6:8.1f} us/task"
+                )
+    finally:
+        shared.unlink()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
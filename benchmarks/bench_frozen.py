@@ -0,0 +1,38 @@
+"""Compare the memory of populated KR calendars with their frozen copies,
+and the speed of lookups in both.
+
+Usage: python benchmarks/bench_frozen.py [instances]
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+
+from holidays import KR
+
+
+def main(instances=20):
+    years = range(1950, 2051)
+    calendars = [
+        KR(years=years, en_name=bool(i % 2)) for i in range(instances)
+    ]
+    frozen = [calendar.freeze() for calendar in calendars]
+    dict_size = sum(calendar.memory_footprint() for calendar in calendars)
+    frozen_size = sum(calendar.memory_footprint() for calendar in frozen)
+    print(f"{instances} KR calendars for {years.start}-{years.stop - 1}")
+    print(f"  dict:   {dict_size / 1024:10.1f} KiB")
+    print(f"  frozen: {frozen_size / 1024:10.1f} KiB")
+
+    days = [date(1950, 1, 1) + timedelta(days=i) for i in range(36890)]
+    for label, calendar in (("dict", calendars[0]), ("frozen", frozen[0])):
+        t0 = time.perf_counter()
+        for day in days:
+            day in calendar
+        elapsed = time.perf_counter() - t0
+        print(
+            f"  {label:<7} {len(days)} lookups: {elapsed * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,41 @@
+"""Time rendering a months_graph PNG for every year of a range: one call
+per year, each calculating its own statistics, against months_graphs,
+which calculates them once from one populated calendar; then the same
+charts again, served from the render cache.
+
+Usage: python benchmarks/bench_graphs.py [start] [end]
+"""
+
+import sys
+import time
+
+from holidays import graph_cache_clear, months_graph, months_graphs
+
+
+def main(start=2000, end=2009):
+    years = range(start, end + 1)
+
+    def per_year():
+        return {year: months_graph(year, format="png") for year in years}
+
+    def batch():
+        return months_graphs(start, end, format="png")
+
+    print(f"months_graph PNG for {start}-{end}")
+    results = []
+    for label, run in (
+        ("one call per year", per_year),
+        ("months_graphs", batch),
+    ):
+        graph_cache_clear()
+        t0 = time.perf_counter()
+        results.append(run())
+        print(f"  {label:<20} {time.perf_counter() - t0:8.3f} s")
+    t0 = time.perf_counter()
+    batch()
+    print(f"  {'cached':<20} {time.perf_counter() - t0:8.3f} s")
+    assert results[0] == results[1], "charts differ"
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
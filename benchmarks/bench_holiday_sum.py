@@ -0,0 +1,69 @@
+"""Time adding KR and four custom calendars together over 100 years,
+merging one year at a time, against re-inserting the operands' whole
+dicts every year as HolidaySum used to.
+
+Usage: python benchmarks/bench_holiday_sum.py [years]
+"""
+
+import sys
+import time
+from datetime import date
+
+from holidays import KR, HolidayBase, HolidaySum
+
+
+class Custom(HolidayBase):
+    """A calendar with a holiday on the given day of every month."""
+
+    country = None
+    day = 1
+
+    def _populate(self, year):
+        for month in range(1, 13):
+            self[date(year, month, self.day)] = f"Custom day {self.day}"
+
+
+def custom(day):
+    return type(f"Custom{day}", (Custom,), {"day": day})()
+
+
+class LegacySum(HolidaySum):
+    def _populate(self, year):
+        for h in self.holidays[::-1]:
+            if not h._read_only:
+                h._populate(year)
+            self.update(h)
+
+
+def operands():
+    return [KR(), custom(1), custom(5), custom(15), custom(25)]
+
+
+def add(calendars, cls):
+    total = cls(calendars[0], calendars[1])
+    for calendar in calendars[2:]:
+        total = cls(total, calendar)
+    return total
+
+
+def main(years=100):
+    span = range(1950, 1950 + years)
+    print(f"Sum of 5 calendars over {span.start}-{span.stop - 1}")
+    results = {}
+    for label, cls in (
+        ("per-year re-insert", LegacySum),
+        ("merge", HolidaySum),
+    ):
+        total = add(operands(), cls)
+        t0 = time.perf_counter()
+        for year in span:
+            date(year, 6, 1) in total
+        elapsed = time.perf_counter() - t0
+        results[label] = dict(total)
+        print(f"  {label:<20} {elapsed * 1000:10.1f} ms")
+    first, second = results.values()
+    assert first == second, "results differ"
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
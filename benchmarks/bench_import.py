@@ -0,0 +1,62 @@
+"""Check the cost of ``import holidays`` with ``python -X importtime``.
+
+Fails (exit status 1) if the import exceeds the time budget or loads any
+of the heavy optional dependencies, which must only be imported by the
+functions that need them.
+
+Usage: python benchmarks/bench_import.py [budget_ms]
+"""
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib")
+
+
+def import_time():
+    """Return the cumulative import time of holidays in microseconds and
+    the names of all the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import holidays"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.append(name.strip())
+        if name.strip() == "holidays":
+            total = int(cumulative)
+    return total, modules
+
+
+def main(budget_ms=150.0, runs=5):
+    timings = []
+    for _ in range(runs):
+        total, modules = import_time()
+        timings.append(total)
+    best = min(timings) / 1e3
+    heavy = sorted(
+        {
+            module
+            for module in modules
+            if module.split(".")[0] in HEAVY_MODULES
+        }
+    )
+    print(
+        f"import holidays: {best:.1f} ms (best of {runs}), "
+        f"budget {budget_ms} ms"
+    )
+    print(f"  modules imported: {len(modules)}")
+    if heavy:
+        print(f"  heavy modules imported: {', '.join(heavy)}")
+    if heavy or best > budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:2]))
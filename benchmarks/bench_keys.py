@@ -0,0 +1,35 @@
+"""Time ``key in kr`` for each supported key type, with
+:func:`dateutil.parser.parse` for reference.
+
+Usage: python benchmarks/bench_keys.py
+"""
+
+import timeit
+from datetime import date, datetime
+
+from dateutil.parser import parse
+
+from holidays import KR
+
+
+def main(number=100_000):
+    kr = KR(years=2024)
+    keys = {
+        "date": date(2024, 9, 17),
+        "datetime": datetime(2024, 9, 17, 9, 30),
+        "ISO str": "2024-09-17",
+        "ISO datetime str": "2024-09-17T09:30:00",
+        "other str": "09/17/2024",
+        "int timestamp": 1726531200,
+        "float timestamp": 1726531200.5,
+    }
+    print(f"'key in kr', {number} lookups each")
+    for label, key in keys.items():
+        seconds = timeit.timeit(lambda: key in kr, number=number)
+        print(f"  {label:18} {seconds / number * 1e6:8.2f} us")
+    seconds = timeit.timeit(lambda: parse("2024-09-17"), number=number // 10)
+    print(f"  {'dateutil parse':18} {seconds / (number // 10) * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
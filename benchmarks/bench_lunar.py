@@ -0,0 +1,67 @@
+"""Compare ``Korea._populate`` per year using the precomputed lunar table
+against the previous per-call :class:`KoreanLunarCalendar` conversion.
+
+Usage: python benchmarks/bench_lunar.py [start] [end]
+"""
+
+import sys
+import timeit
+from datetime import date
+
+from korean_lunar_calendar import KoreanLunarCalendar
+
+from holidays import KR
+from holidays.lunar import lunar_to_solar
+
+
+class ConverterKR(KR):
+    """Korea with the lunar dates converted by korean_lunar_calendar."""
+
+    def get_solar_date(self, year, month, day):
+        korean_cal = KoreanLunarCalendar()
+        korean_cal.setLunarDate(year, month, day, False)
+        return date(
+            korean_cal.solarYear, korean_cal.solarMonth, korean_cal.solarDay
+        )
+
+
+def per_year(cls, years, number=5):
+    def run():
+        for year in years:
+            cls(years=year)
+
+    return min(timeit.repeat(run, number=number, repeat=3)) / (
+        number * len(years)
+    )
+
+
+def main(start=1950, end=2050):
+    years = [year for year in range(start, end + 1) if year != 1960]
+    table = per_year(KR, years)
+    converter = per_year(ConverterKR, years)
+    print(f"Korea._populate per year, {start}-{end}")
+    print(f"  korean_lunar_calendar: {converter * 1e6:9.1f} us")
+    print(f"  lunar table:           {table * 1e6:9.1f} us")
+    print(f"  speedup:               {converter / table:9.1f}x")
+
+    conversions = [(year, 8, 15) for year in years]
+    converter_cal = KoreanLunarCalendar()
+
+    def convert_converter():
+        for year, month, day in conversions:
+            converter_cal.setLunarDate(year, month, day, False)
+
+    def convert_table():
+        for year, month, day in conversions:
+            lunar_to_solar(year, month, day)
+
+    converter = min(timeit.repeat(convert_converter, number=20, repeat=3))
+    table = min(timeit.repeat(convert_table, number=20, repeat=3))
+    n = 20 * len(conversions)
+    print("Single lunar to solar conversion")
+    print(f"  korean_lunar_calendar: {converter / n * 1e6:9.2f} us")
+    print(f"  lunar table:           {table / n * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,46 @@
+"""Microbenchmark of Korea._populate per year: committing the year's
+holidays through the year builder against setting them one by one with
+__setitem__.
+
+Usage: python benchmarks/bench_populate.py [repeat]
+"""
+
+import sys
+import time
+
+from holidays import KR
+from holidays.countries.korea import _KOREA_PLAN
+
+
+class SetItemKR(KR):
+    def _populate(self, year):
+        for day, name in _KOREA_PLAN.evaluate_year(
+            year, self.en_name, self.get_solar_date
+        ):
+            self[day] = name
+
+
+def per_year(cls, years, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        calendar = cls(expand=False)
+        t0 = time.perf_counter()
+        for year in years:
+            calendar._populate(year)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(years), calendar
+
+
+def main(repeat=20):
+    years = range(1950, 2051)
+    print(f"Korea._populate, {years.start}-{years.stop - 1}, best of {repeat}")
+    results = []
+    for label, cls in (("__setitem__", SetItemKR), ("year builder", KR)):
+        elapsed, calendar = per_year(cls, years, repeat)
+        results.append(list(dict.items(calendar)))
+        print(f"  {label:<13} {elapsed * 1e6:8.1f} us/year")
+    assert results[0] == results[1], "results differ"
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,55 @@
+"""Time populating every year from 1391 to 2050 one year at a time, with
+populate_range() in one batched pass, and with populate_range() split
+across a process pool. The shared year cache is disabled so every run
+calculates.
+
+Usage: python benchmarks/bench_populate_range.py [workers] [repeat]
+"""
+
+import os
+import sys
+import time
+
+from holidays import KR, year_cache
+
+START, END = 1391, 2050
+
+
+def per_year():
+    kr = KR()
+    for year in range(START, END + 1):
+        kr.years.add(year)
+        kr._populate_year(year)
+    return kr
+
+
+def batched(workers=None):
+    kr = KR()
+    kr.populate_range(START, END, workers=workers)
+    return kr
+
+
+def main(workers=os.cpu_count() or 1, repeat=5):
+    year_cache.maxsize = 0
+    runs = [
+        ("per-year loop", per_year),
+        ("populate_range", batched),
+        (f"populate_range, {workers} workers", lambda: batched(workers)),
+    ]
+    print(f"KR {START}-{END}, best of {repeat}")
+    expected = None
+    for label, run in runs:
+        elapsed = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            kr = run()
+            elapsed = min(elapsed, time.perf_counter() - t0)
+        items = list(dict.items(kr))
+        if expected is None:
+            expected = items
+        assert items == expected, label
+        print(f"  {label:<32} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,43 @@
+"""Compare slice queries through the sorted holiday index against walking
+every day of the range, as slices used to.
+
+Usage: python benchmarks/bench_slices.py
+"""
+
+import timeit
+from datetime import date, timedelta
+
+from holidays import KR
+
+
+def walk(kr, start, stop):
+    days = []
+    for delta_days in range((stop - start).days):
+        day = start + timedelta(days=delta_days)
+        if day in kr:
+            days.append(day)
+    return days
+
+
+def main(number=20):
+    kr = KR(years=range(1961, 2051))
+    print(f"Slice queries, best of 3 x {number}")
+    for first, last in ((2024, 2024), (2000, 2009), (1961, 2050)):
+        start, stop = date(first, 1, 1), date(last, 12, 31)
+        assert kr[start:stop] == walk(kr, start, stop)
+        indexed = min(
+            timeit.repeat(lambda: kr[start:stop], number=number, repeat=3)
+        )
+        walked = min(
+            timeit.repeat(
+                lambda: walk(kr, start, stop), number=number, repeat=3
+            )
+        )
+        print(
+            f"  {first}-{last}: walk {walked / number * 1e3:8.3f} ms, "
+            f"index {indexed / number * 1e3:8.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
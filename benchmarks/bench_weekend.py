@@ -0,0 +1,63 @@
+"""Time counting the Saturdays and Sundays of every year from 1950 to 2100
+by checking every day, with count_sat/count_sun, and with the vectorized
+weekend counts.
+
+Usage: python benchmarks/bench_weekend.py [repeat]
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+
+from holidays import count_sat, count_sun
+from holidays.constants import SAT, SUN
+from holidays.weekend import weekend_counts
+
+START, END = 1950, 2100
+
+
+def day_by_day():
+    counts = []
+    for year in range(START, END + 1):
+        day = date(year, 1, 1)
+        count = 0
+        while day.year == year:
+            if day.weekday() in (SAT, SUN):
+                count += 1
+            day += timedelta(days=1)
+        counts.append(count)
+    return counts
+
+
+def count_functions():
+    return [
+        count_sat(year)[0] + count_sun(year)[0]
+        for year in range(START, END + 1)
+    ]
+
+
+def vectorized():
+    return weekend_counts(START, END).tolist()
+
+
+def main(repeat=5):
+    print(f"Weekend days of each year {START}-{END}, best of {repeat}")
+    expected = None
+    for label, run in (
+        ("day by day", day_by_day),
+        ("count_sat + count_sun", count_functions),
+        ("weekend_counts", vectorized),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            counts = run()
+            best = min(best, time.perf_counter() - t0)
+        if expected is None:
+            expected = counts
+        assert counts == expected, label
+        print(f"  {label:<22} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
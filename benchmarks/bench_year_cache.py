@@ -0,0 +1,34 @@
+"""Time creating many ``KR`` instances for the same years with the shared
+year cache enabled and disabled.
+
+Usage: python benchmarks/bench_year_cache.py [instances]
+"""
+
+import sys
+import time
+
+from holidays import KR, year_cache
+
+
+def main(instances=100):
+    years = range(1990, 2031)
+
+    def build():
+        t0 = time.perf_counter()
+        for _ in range(instances):
+            KR(years=years)
+        return time.perf_counter() - t0
+
+    maxsize = year_cache.maxsize
+    year_cache.maxsize = 0
+    uncached = build()
+    year_cache.maxsize = maxsize
+    year_cache.clear()
+    cached = build()
+    print(f"{instances} KR instances for {years.start}-{years.stop - 1}")
+    print(f"  without year cache: {uncached:8.3f} s")
+    print(f"  with year cache:    {cached:8.3f} s  {year_cache.info()}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
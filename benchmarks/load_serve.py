@@ -0,0 +1,147 @@
+"""Load-test the holiday HTTP server (holidays.serve) on localhost over
+kept-alive connections, and report the throughput and p50/p99 latency of
+single-date GETs and of batched POSTs.
+
+Unless --port is given, a server is started on a free port for the test.
+
+Usage: python benchmarks/load_serve.py [--port PORT] [--connections N]
+       [--requests N] [--batch N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def request(reader, writer, method, target, body=b""):
+    writer.write(
+        (
+            f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode()
+        + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    payload = await reader.readexactly(length)
+    assert status == 200, (status, payload)
+    return json.loads(payload)
+
+
+async def client(port, count, make_request, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            method, target, body = make_request()
+            t0 = time.perf_counter()
+            await request(reader, writer, method, target, body)
+            latencies.append(time.perf_counter() - t0)
+    finally:
+        writer.close()
+
+
+def random_day(rng):
+    return date(1950, 1, 1) + timedelta(days=rng.randrange(36500))
+
+
+async def run(port, connections, requests, batch):
+    rng = random.Random(0)
+
+    def single():
+        return "GET", f"/holiday?date={random_day(rng)}", b""
+
+    def batched():
+        body = json.dumps(
+            [{"date": str(random_day(rng))} for _ in range(batch)]
+        ).encode()
+        return "POST", "/holiday", body
+
+    for label, make_request, per_request in (
+        ("GET /holiday", single, 1),
+        (f"POST /holiday x{batch}", batched, batch),
+    ):
+        latencies = []
+        per_connection = max(1, requests // connections // per_request)
+        t0 = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client(port, per_connection, make_request, latencies)
+                for _ in range(connections)
+            )
+        )
+        elapsed = time.perf_counter() - t0
+        print(
+            f"  {label:<20} {len(latencies) / elapsed:9.0f} req/s "
+            f"{len(latencies) * per_request / elapsed:9.0f} dates/s  "
+            f"p50 {percentile(latencies, 0.5) * 1000:6.2f} ms  "
+            f"p99 {percentile(latencies, 0.99) * 1000:6.2f} ms"
+        )
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, help="port of a running server")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "holidays.serve", "--port", str(port)],
+            cwd=root,
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        wait_for(port)
+        print(
+            f"{args.connections} kept-alive connections, "
+            f"~{args.requests} dates per test"
+        )
+        asyncio.run(run(port, args.connections, args.requests, args.batch))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+__version__ = "0.0.2"
+
 from holidays.countries import *
 from holidays.constants import MON, TUE, WED, THU, FRI, SAT, SUN, WEEKEND
 from holidays.constants import (
@@ -17,12 +19,17 @@ from holidays.constants import (
 from holidays.holiday_base import *  # * import required for IDE docstrings
 from holidays.utils import (
     CountryHoliday,
+    cached_country_holidays,
     country_holidays,
     list_supported_countries,
     sorted_series_countries,
     count_sun,
     count_sat,
     count_holidays,
+    holiday_stats,
+    annotate,
     years_graph,
     months_graph,
+    months_graphs,
+    graph_cache_clear,
 )
\ No newline at end of file
@@ -0,0 +1,3 @@
+from holidays.stream import main
+
+main()
@@ -0,0 +1,321 @@
+"""Benchmarks of the holidays hot paths.
+
+Usage: python -m holidays.bench [-k PATTERN] [--repeat N] [--json FILE]
+[--compare FILE] [--list]
+
+Each benchmark is timed **repeat** times, each time over enough calls to
+last at least :data:`MIN_TIME` seconds, and reported as the time of one
+operation (a call, or a year for the populate benchmarks). ``--json``
+saves the results with the versions of holidays and Python, and
+``--compare`` shows the ratio of each time to that of an earlier run, so
+that runs can be compared across versions.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+MIN_TIME = 0.05
+"""The shortest duration, in seconds, of one timing of a benchmark."""
+
+_START, _END = 1950, 2050
+
+
+class _Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    units: int
+    unit: str
+    timed: bool
+
+
+_CASES: List[_Case] = []
+
+
+def _case(
+    name: str, units: int = 1, unit: str = "call", timed: bool = True
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register a benchmark. Its function prepares the data and returns
+    the callable to time, whose call performs **units** operations; if not
+    **timed**, it takes the number of repeats and returns the seconds of
+    each."""
+
+    def register(setup: Callable[..., Any]) -> Callable[..., Any]:
+        _CASES.append(_Case(name, setup, units, unit, timed))
+        return setup
+
+    return register
+
+
+def _full_calendar(en_name: bool = False) -> Any:
+    from holidays import KR
+
+    return KR(years=range(_START, _END + 1), en_name=en_name)
+
+
+def _populate(en_name: bool) -> Callable[[], Any]:
+    from holidays import KR
+
+    def populate() -> None:
+        calendar = KR(expand=False, en_name=en_name)
+        for year in range(_START, _END + 1):
+            calendar._populate(year)
+
+    return populate
+
+
+@_case("populate", units=_END - _START + 1, unit="year")
+def _bench_populate() -> Callable[[], Any]:
+    return _populate(False)
+
+
+@_case("populate_en_name", units=_END - _START + 1, unit="year")
+def _bench_populate_en_name() -> Callable[[], Any]:
+    return _populate(True)
+
+
+def _contains(key: Any) -> Callable[[], Any]:
+    from holidays import KR
+
+    calendar = KR(years=2024)
+    return lambda: key in calendar
+
+
+@_case("contains_date")
+def _bench_contains_date() -> Callable[[], Any]:
+    return _contains(date(2024, 9, 17))
+
+
+@_case("contains_datetime")
+def _bench_contains_datetime() -> Callable[[], Any]:
+    return _contains(datetime(2024, 9, 17, 9, 30))
+
+
+@_case("contains_str")
+def _bench_contains_str() -> Callable[[], Any]:
+    return _contains("2024-09-17")
+
+
+@_case("contains_int")
+def _bench_contains_int() -> Callable[[], Any]:
+    return _contains(1726531200)
+
+
+@_case("slice_10_years")
+def _bench_slice_10_years() -> Callable[[], Any]:
+    calendar = _full_calendar()
+    return lambda: calendar["2015-01-01":"2025-01-01"]
+
+
+@_case("slice_100_years_step")
+def _bench_slice_100_years_step() -> Callable[[], Any]:
+    calendar = _full_calendar()
+    return lambda: calendar[date(_START, 1, 1) : date(_END, 12, 31) : 7]
+
+
+@_case("holiday_sum")
+def _bench_holiday_sum() -> Callable[[], Any]:
+    first, second = _full_calendar(), _full_calendar(en_name=True)
+    return lambda: first + second
+
+
+@_case("get_named")
+def _bench_get_named() -> Callable[[], Any]:
+    calendar = _full_calendar()
+    return lambda: calendar.get_named("추석")
+
+
+@_case("count_holidays")
+def _bench_count_holidays() -> Callable[[], Any]:
+    from holidays import KR, count_holidays
+
+    calendar = KR(years=2024)
+    return lambda: count_holidays(calendar, 2024, True, True)
+
+
+@_case("count_sun")
+def _bench_count_sun() -> Callable[[], Any]:
+    from holidays import count_sun
+
+    return lambda: count_sun(2024)
+
+
+@_case("country_holidays")
+def _bench_country_holidays() -> Callable[[], Any]:
+    from holidays import country_holidays
+
+    return lambda: country_holidays("KR")
+
+
+@_case("import", unit="import", timed=False)
+def _bench_import(repeat: int) -> List[float]:
+    # Timed in a fresh interpreter: this one has imported holidays already.
+    code = (
+        "import time; t = time.perf_counter(); import holidays; "
+        "print(time.perf_counter() - t)"
+    )
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+
+
+def _time(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= MIN_TIME:
+            break
+        number *= 2 if elapsed <= 0 else min(10, int(MIN_TIME / elapsed) + 1)
+    samples = [elapsed]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append(time.perf_counter() - t0)
+    return {"number": number, "samples": samples}
+
+
+def run(
+    pattern: Optional[str] = None,
+    repeat: int = 5,
+    report: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks and return their results.
+
+    :param pattern:
+        Only run the benchmarks whose name contains it.
+
+    :param repeat:
+        The number of timings of each benchmark.
+
+    :param report:
+        Called with the name and result of each benchmark once timed.
+
+    :return:
+        The versions of holidays and Python, the date, and the result of
+        each benchmark by name: the ``min``, ``median``, ``mean`` and
+        ``stdev`` time of one operation in seconds, the ``unit`` of
+        operation, and the ``number`` of operations per timing.
+    """
+    from holidays import __version__
+
+    results: Dict[str, Any] = {}
+    for case in _CASES:
+        if pattern and pattern not in case.name:
+            continue
+        if case.timed:
+            timing = _time(case.setup(), repeat)
+            number = timing["number"] * case.units
+            samples = [sample / number for sample in timing["samples"]]
+        else:
+            number = 1
+            samples = case.setup(repeat)
+        result = {
+            "unit": case.unit,
+            "number": number,
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.mean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+        results[case.name] = result
+        if report is not None:
+            report(case.name, result)
+    return {
+        "holidays": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m holidays.bench",
+        description="Benchmark the holidays hot paths.",
+    )
+    parser.add_argument(
+        "-k", dest="pattern", help="only run the benchmarks matching PATTERN"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="timings of each benchmark (default: 5)",
+    )
+    parser.add_argument(
+        "--json", metavar="FILE", help="save the results as JSON to FILE"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="compare the results with those saved in FILE",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the benchmarks and exit"
+    )
+    args = parser.parse_args(argv)
+    if args.list:
+        for case in _CASES:
+            print(case.name)
+        return
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    baseline: Dict[str, Any] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(
+            f"Compared with holidays {baseline['holidays']} "
+            f"(Python {baseline['python']}, {baseline['date']})"
+        )
+    previous = baseline.get("benchmarks", {})
+
+    def report(name: str, result: Dict[str, Any]) -> None:
+        line = (
+            f"{name:<22} {_format_time(result['min'])}/{result['unit']:<6}"
+            f" median {_format_time(result['median'])}"
+        )
+        if name in previous:
+            line += f"  x{result['min'] / previous[name]['min']:.2f}"
+        print(line, flush=True)
+
+    results = run(args.pattern, args.repeat, report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
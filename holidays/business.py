@@ -0,0 +1,216 @@
+from array import array
+from bisect import bisect_left
+from datetime import date
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+from holidays.constants import WEEKEND
+
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
+
+
+class BusinessDays:
+    """
+    Business-day arithmetic over a :class:`HolidayBase` calendar. A business
+    day is a day that is neither a weekend day nor a holiday.
+
+    The object keeps a cumulative count of business days over a range of
+    whole years, so counting the business days between two dates is a
+    subtraction and moving by a number of business days is a binary search.
+    The range grows on demand, one year at a time, as queries reach dates
+    outside of it; those years are calculated in the holiday calendar as
+    well, unless its **expand** attribute is False. Any other change to
+    the holiday calendar is picked up on the next query.
+
+    It is generally used through :meth:`HolidayBase.is_business_day`,
+    :meth:`HolidayBase.add_business_days` and
+    :meth:`HolidayBase.business_days_between`.
+
+    Queries are safe from several threads: the counts are extended under a
+    lock, and each query works on one consistent copy of them.
+
+    Example usage:
+
+    >>> from datetime import date
+    >>> from holidays import KR
+    >>> from holidays.business import BusinessDays
+    >>> kr_business = BusinessDays(KR())
+    >>> kr_business.add_business_days(date(2024, 9, 13), 1)
+    datetime.date(2024, 9, 19)
+    >>> kr_business.business_days_between(
+    ...     date(2024, 9, 1), date(2024, 10, 1)
+    ... )
+    18
+    """
+
+    holidays: "HolidayBase"
+    """The holiday calendar."""
+    weekend: frozenset
+    """The weekdays (:data:`holidays.constants.MON` to
+    :data:`holidays.constants.SUN`) that are not business days."""
+
+    def __init__(
+        self, holidays: "HolidayBase", weekend: Iterable[int] = WEEKEND
+    ) -> None:
+        """
+        :param holidays:
+            The holiday calendar.
+
+        :param weekend:
+            The weekdays that are not business days, Saturday and Sunday by
+            default.
+        """
+        self.holidays = holidays
+        self.weekend = frozenset(weekend)
+        self._first_year: Optional[int] = None
+        self._last_year: Optional[int] = None
+        # (start, counts, first_year, last_year, version): counts[i] is the
+        # number of business days in [start, start + i), over the years
+        # first_year to last_year of that version of the holidays. Readers
+        # take the tuple once, so they see counts and bounds that match; it
+        # is replaced as a whole, or its counts only appended to, under the
+        # lock.
+        self._table: Tuple[int, array, int, int, Optional[int]] = (
+            0,
+            array("l", [0]),
+            0,
+            -1,
+            None,
+        )
+        self._version: Optional[int] = None
+        self._lock = Lock()
+
+    def _build(self, first_year: int, last_year: int) -> Tuple[int, array]:
+        """Count the business days from **first_year** to **last_year** (or
+        more, if the counts already cover more years overlapping or next to
+        these and the holidays did not change), appending to the current
+        counts when they start on the same year and the holidays did not
+        change since they were built.
+
+        :return:
+            The resulting (start, counts).
+        """
+        holidays = self.holidays
+        if holidays.expand:
+            holidays._expand_years(range(first_year, last_year + 1))
+        with self._lock:
+            return self._count(first_year, last_year)
+
+    def _count(self, first_year: int, last_year: int) -> Tuple[int, array]:
+        holidays = self.holidays
+        version = holidays._version
+        # Only years the caller expanded, or the current counts cover, may
+        # be counted: years between the two were maybe never calculated.
+        unchanged = (
+            self._version == version
+            and first_year <= self._last_year + 1
+            and self._first_year <= last_year + 1
+        )
+        if unchanged:
+            first_year = min(first_year, self._first_year)
+            last_year = max(last_year, self._last_year)
+            if (first_year, last_year) == (self._first_year, self._last_year):
+                return self._table[:2]
+        appending = unchanged and first_year == self._first_year
+
+        start = date(first_year, 1, 1).toordinal()
+        end = date(last_year + 1, 1, 1).toordinal()
+        if appending:
+            counts = self._table[1]
+            begin = start + len(counts) - 1
+        else:
+            counts = array("l", [0])
+            begin = start
+        ordinals = holidays._ordinals
+        holiday_ordinals = set(
+            ordinals[bisect_left(ordinals, begin) : bisect_left(ordinals, end)]
+        )
+        weekend = self.weekend
+        total = counts[-1]
+        for ordinal in range(begin, end):
+            # date.fromordinal(1) is a Monday.
+            weekday = (ordinal - 1) % 7
+            if weekday not in weekend and ordinal not in holiday_ordinals:
+                total += 1
+            counts.append(total)
+
+        self._table = (start, counts, first_year, last_year, version)
+        self._first_year = first_year
+        self._last_year = last_year
+        self._version = version
+        return start, counts
+
+    def _covering(self, *days: date) -> Tuple[int, array]:
+        """Return the (start, counts) covering the years of **days**,
+        growing them (or rebuilding them if the holidays changed) as
+        needed."""
+        first_year = min(day.year for day in days)
+        last_year = max(day.year for day in days)
+        start, counts, first, last, version = self._table
+        if (
+            version == self.holidays._version
+            and first <= first_year
+            and last_year <= last
+        ):
+            return start, counts
+        return self._build(first_year, last_year)
+
+    def is_business_day(self, day: date) -> bool:
+        """Return True if **day** is neither a weekend day nor a holiday."""
+        start, counts = self._covering(day)
+        index = day.toordinal() - start
+        return counts[index + 1] > counts[index]
+
+    def business_days_between(self, start: date, end: date) -> int:
+        """Return the number of business days from **start** (included) to
+        **end** (excluded), negative if **end** is before **start**, like
+        :func:`numpy.busday_count`."""
+        first, counts = self._covering(start, end)
+        return (
+            counts[end.toordinal() - first] - counts[start.toordinal() - first]
+        )
+
+    def add_business_days(self, day: date, n: int) -> date:
+        """Return the **n**-th business day after **day** (before it if
+        **n** is negative). **day** itself is not counted, so it does not
+        need to be a business day; with **n** of 0, **day** is returned if it
+        is a business day, else the next business day."""
+        first, counts = self._covering(day)
+        ordinal = day.toordinal()
+        while True:
+            index = ordinal - first
+            # Grow to the year the result can first fall in: it is at least
+            # as many days past the counts as business days are missing, so
+            # years the result cannot land in are never calculated.
+            if n > 0:
+                target = counts[index + 1] + n
+                if target <= counts[-1]:
+                    return date.fromordinal(
+                        first + bisect_left(counts, target) - 1
+                    )
+                last = first + len(counts) - 2 + target - counts[-1]
+                years = (
+                    date.fromordinal(first).year,
+                    date.fromordinal(last).year,
+                )
+            elif n < 0:
+                target = counts[index] + n
+                if target >= 0:
+                    return date.fromordinal(
+                        first + bisect_left(counts, target + 1) - 1
+                    )
+                years = (
+                    date.fromordinal(first + target).year,
+                    date.fromordinal(first + len(counts) - 2).year,
+                )
+            else:
+                if counts[index] < counts[-1]:
+                    return date.fromordinal(
+                        first + bisect_left(counts, counts[index] + 1) - 1
+                    )
+                years = (
+                    date.fromordinal(first).year,
+                    date.fromordinal(first + len(counts) - 2).year + 1,
+                )
+            first, counts = self._build(*years)
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+YearEntries = Tuple[Tuple[date, str], ...]
+"""The holidays calculated for one year, as (date, name) pairs in the order
+they were set."""
+
+
+class YearCache:
+    """
+    A process-wide, size-limited cache of the holidays calculated for one
+    year, shared by all the instances of the classes that set
+    :attr:`HolidayBase.cache_years`.
+
+    Entries are keyed by ``(class, year, en_name, observed, subdiv)``, so a
+    year is calculated once per process for each combination of those, and
+    the least recently used entries are dropped beyond :attr:`maxsize`.
+
+    Example usage:
+
+    >>> from holidays import KR, year_cache
+    >>> year_cache.clear()
+    >>> kr_2024 = KR(years=2024)
+    >>> kr_2024_again = KR(years=2024)
+    >>> year_cache.info()
+    {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 1024}
+    >>> year_cache.invalidate(KR)
+    1
+    """
+
+    hits: int
+    """The number of lookups that found the year in the cache."""
+    misses: int
+    """The number of lookups that did not."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        :param maxsize:
+            The maximum number of years kept, 0 to disable the cache.
+        """
+        self._entries: "OrderedDict[Hashable, YearEntries]" = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of years kept; lowering it drops the least
+        recently used ones, 0 disables the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[YearEntries]:
+        """Return the entries cached for **key**, or None, counting a hit or
+        a miss."""
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return entries
+
+    def put(self, key: Hashable, entries: YearEntries) -> None:
+        """Cache the entries calculated for **key**."""
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._entries[key] = entries
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, cls: Optional[type] = None, year: Optional[int] = None
+    ) -> int:
+        """Drop the entries of class **cls** (and its subclasses) and/or of
+        **year**, or all the entries if neither is given.
+
+        :return:
+            The number of entries dropped.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (cls is None or issubclass(key[0], cls))
+                and (year is None or key[1] == year)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Return the hit and miss counters, the number of years cached and
+        the size limit."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+        }
+
+
+year_cache = YearCache()
+"""The cache shared by all the holiday calendars of the process."""
@@ -0,0 +1,337 @@
+"""Precompiled holiday datasets.
+
+A dataset file holds the holidays a :class:`HolidayBase` class calculates
+over a span of years, in every language, so they can be looked up straight
+from a memory-mapped file with no calculation at all. Build one with::
+
+    python -m holidays.dataset KR 1950 2050
+
+The file is made of a header (:data:`HEADER`) followed by
+
+* the day ordinals (:meth:`datetime.date.toordinal`) of the holidays, as
+  sorted little-endian int32;
+* for each language, the little-endian uint16 index of each holiday's name
+  in the string table (:data:`NO_NAME` if the holiday does not exist in
+  that language);
+* the string table: the little-endian uint32 offsets of the names, plus the
+  end offset, followed by the UTF-8 encoded names.
+
+The header's checksum is the CRC-32 of everything after the header.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime
+from typing import Any, Iterator, List, Optional, Type, Union
+
+from holidays.holiday_base import HolidayBase, _to_date, get_country_class
+
+MAGIC = b"HLDS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHhhIIII")
+"""magic, version, flags, languages, reserved, start year, end year,
+number of holidays, number of names, size of the names, checksum."""
+FLAG_OBSERVED = 1
+NO_NAME = 0xFFFF
+LANGUAGES = (False, True)
+"""The **en_name** values stored, in order."""
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def dataset_path(country: str) -> str:
+    """Return the path of the dataset shipped for a country code."""
+    return os.path.join(DATA_DIR, f"{country}.bin")
+
+
+def build_dataset(
+    cls: Type[HolidayBase],
+    path: str,
+    start: int,
+    end: int,
+    observed: bool = True,
+) -> int:
+    """Calculate the holidays of **cls** from **start** to **end** in every
+    language and write them to a dataset file at **path**.
+
+    :return:
+        The number of holidays written.
+    """
+    calendars = [
+        cls(years=range(start, end + 1), observed=observed, en_name=en_name)
+        for en_name in LANGUAGES
+    ]
+    ordinals = sorted(
+        {day.toordinal() for calendar in calendars for day in calendar}
+    )
+    names: List[str] = []
+    name_codes = {}
+    codes = []
+    for calendar in calendars:
+        language_codes = array("H")
+        for ordinal in ordinals:
+            name = dict.get(calendar, date.fromordinal(ordinal))
+            if name is None:
+                language_codes.append(NO_NAME)
+                continue
+            if name not in name_codes:
+                name_codes[name] = len(names)
+                names.append(name)
+            language_codes.append(name_codes[name])
+        codes.append(language_codes)
+    if len(names) >= NO_NAME:
+        raise ValueError(f"Too many holiday names ({len(names)})")
+
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = array("I", [0])
+    for name in encoded:
+        offsets.append(offsets[-1] + len(name))
+    sections = [array("i", ordinals), *codes, offsets]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+    payload = b"".join(section.tobytes() for section in sections)
+    payload += b"".join(encoded)
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        FLAG_OBSERVED if observed else 0,
+        len(LANGUAGES),
+        0,
+        start,
+        end,
+        len(ordinals),
+        len(names),
+        offsets[-1],
+        zlib.crc32(payload),
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    return len(ordinals)
+
+
+class MappedHolidays:
+    """
+    A read-only holiday calendar answering membership and name queries
+    from a memory-mapped dataset file. Dates outside of the span of years
+    covered by the file are answered by a regular calendar of the country
+    class, created on first use.
+
+    It is generally created with :meth:`HolidayBase.from_dataset`:
+
+    >>> from holidays import KR
+    >>> kr_holidays = KR.from_dataset()
+    >>> '2024-09-17' in kr_holidays
+    True
+    >>> kr_holidays.get('2024-09-17')
+    '추석'
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cls: Optional[Type[HolidayBase]] = None,
+        en_name: bool = False,
+    ) -> None:
+        """
+        :param path:
+            The dataset file.
+
+        :param cls:
+            The country class used outside of the span of the file, looked
+            up from the file name (e.g. ``KR.bin``) if not given.
+
+        :param en_name:
+            Whether to use English holiday names.
+
+        :raise:
+            ValueError if the file is not a valid dataset.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        try:
+            if len(buffer) < HEADER.size:
+                raise ValueError(f"{path} is not a holiday dataset")
+            (
+                magic,
+                version,
+                flags,
+                languages,
+                _,
+                self.start_year,
+                self.end_year,
+                count,
+                names_count,
+                names_size,
+                checksum,
+            ) = HEADER.unpack_from(buffer)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a holiday dataset")
+            if version != VERSION:
+                raise ValueError(
+                    f"{path} has dataset version {version}, "
+                    f"expected {VERSION}"
+                )
+            size = (
+                HEADER.size
+                + 4 * count
+                + 2 * count * languages
+                + 4 * (names_count + 1)
+                + names_size
+            )
+            if len(buffer) != size:
+                raise ValueError(f"{path} is truncated or corrupt")
+            if zlib.crc32(buffer[HEADER.size :]) != checksum:
+                raise ValueError(f"{path} fails its checksum")
+        except ValueError:
+            buffer.release()
+            self._mmap.close()
+            raise
+
+        self.observed = bool(flags & FLAG_OBSERVED)
+        self.en_name = en_name
+        language = LANGUAGES.index(en_name)
+        offset = HEADER.size
+        self._ordinals = self._section(buffer, offset, "i", count)
+        offset += 4 * count + 2 * count * language
+        self._codes = self._section(buffer, offset, "H", count)
+        offset += 2 * count * (languages - language)
+        self._offsets = self._section(buffer, offset, "I", names_count + 1)
+        self._names = buffer[offset + 4 * (names_count + 1) :]
+
+        if cls is None:
+            cls = get_country_class(
+                os.path.splitext(os.path.basename(path))[0]
+            )
+        self._cls = cls
+        self._fallback: Optional[HolidayBase] = None
+        self._first = date(self.start_year, 1, 1).toordinal()
+        self._last = date(self.end_year, 12, 31).toordinal()
+
+    @staticmethod
+    def _section(buffer: memoryview, offset: int, typecode: str, count: int):
+        size = array(typecode).itemsize
+        section = buffer[offset : offset + size * count]
+        if sys.byteorder == "little":
+            return section.cast(typecode)
+        # The file is little-endian: copy and swap on big-endian machines.
+        swapped = array(typecode, section.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    @property
+    def fallback(self) -> HolidayBase:
+        """The calendar used for dates outside of the file's span."""
+        if self._fallback is None:
+            self._fallback = self._cls(
+                observed=self.observed, en_name=self.en_name
+            )
+        return self._fallback
+
+    def _name(self, ordinal: int) -> Optional[str]:
+        ordinals = self._ordinals
+        index = bisect_left(ordinals, ordinal)
+        if index == len(ordinals) or ordinals[index] != ordinal:
+            return None
+        code = self._codes[index]
+        if code == NO_NAME:
+            return None
+        return str(
+            self._names[self._offsets[code] : self._offsets[code + 1]],
+            "utf-8",
+        )
+
+    def get(
+        self,
+        key: Union[date, datetime, str, float],
+        default: Optional[Any] = None,
+    ) -> Optional[str]:
+        """Return the holiday name for a date if date is a holiday, else
+        default. See :meth:`HolidayBase.get`."""
+        day = _to_date(key)
+        ordinal = day.toordinal()
+        if not self._first <= ordinal <= self._last:
+            return self.fallback.get(day, default)
+        name = self._name(ordinal)
+        return default if name is None else name
+
+    def __contains__(self, key: Union[date, datetime, str, float]) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: Union[date, datetime, str, float]) -> str:
+        name = self.get(key)
+        if name is None:
+            raise KeyError(key)
+        return name
+
+    def get_list(self, key: Union[date, datetime, str, float]) -> List[str]:
+        """Return a list of all holiday names for a date. See
+        :meth:`HolidayBase.get_list`."""
+        return [h for h in self.get(key, "").split(", ") if h]
+
+    def __iter__(self) -> Iterator[date]:
+        """Iterate over the holiday dates of the file, in order."""
+        for index, ordinal in enumerate(self._ordinals):
+            if self._codes[index] != NO_NAME:
+                yield date.fromordinal(ordinal)
+
+    def __len__(self) -> int:
+        """Return the number of holidays in the file."""
+        return sum(1 for code in self._codes if code != NO_NAME)
+
+    def close(self) -> None:
+        """Release the memory-mapped file."""
+        for view in (self._ordinals, self._codes, self._offsets, self._names):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedHolidays":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<MappedHolidays {self._cls.country} "
+            f"{self.start_year}-{self.end_year}>"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m holidays.dataset",
+        description="Build a precompiled holiday dataset file.",
+    )
+    parser.add_argument("country", help="country class name or code")
+    parser.add_argument("start", type=int, help="first year")
+    parser.add_argument("end", type=int, help="last year")
+    parser.add_argument(
+        "-o", "--output", help="output file (default: the shipped dataset)"
+    )
+    parser.add_argument(
+        "--no-observed",
+        action="store_true",
+        help="leave out the dates when holidays are observed",
+    )
+    args = parser.parse_args(argv)
+    cls = get_country_class(args.country)
+    path = args.output or dataset_path(cls.country)
+    count = build_dataset(
+        cls, path, args.start, args.end, observed=not args.no_observed
+    )
+    print(f"Wrote {count} holidays ({args.start}-{args.end}) to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from holidays.holiday_base import (
+    _code_array,
+    _ordinal_range,
+    _step_days,
+    _to_date,
+)
+
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
+
+class FrozenHolidays:
+    """
+    An immutable, compact copy of the holidays of a :class:`HolidayBase`,
+    as returned by :meth:`HolidayBase.freeze`.
+
+    The dates are kept as a sorted :class:`array.array` of day ordinals and
+    the names as indices into the distinct names of the calendar, instead
+    of a :class:`datetime.date` object and a string per holiday. The names
+    are interned, so calendars with the same names share the strings,
+    which are freed with the last calendar using them. Lookups are binary searches; keys are accepted in the same
+    types as :meth:`HolidayBase.get`. A frozen calendar never calculates:
+    dates of years that were not calculated in the original are not
+    holidays.
+
+    Iteration is in date order.
+
+    Example usage:
+
+    >>> from holidays import KR
+    >>> kr_holidays = KR(years=range(1950, 2051)).freeze()
+    >>> '2024-09-17' in kr_holidays
+    True
+    >>> for day in kr_holidays['2024-09-16':'2024-09-19']:
+    ...     print(day, kr_holidays[day])
+    2024-09-16 추석 연휴
+    2024-09-17 추석
+    2024-09-18 추석 연휴
+    >>> kr_holidays.memory_footprint() < KR(
+    ...     years=range(1950, 2051)
+    ... ).memory_footprint()
+    True
+    """
+
+    __slots__ = (
+        "country",
+        "subdiv",
+        "observed",
+        "en_name",
+        "strict",
+        "years",
+        "_ordinals",
+        "_codes",
+        "_names",
+    )
+
+    country: Optional[str]
+    subdiv: Optional[str]
+    observed: bool
+    en_name: bool
+    strict: bool
+    years: frozenset
+
+    def __init__(self, holidays: "HolidayBase") -> None:
+        """
+        :param holidays:
+            The holidays to copy.
+        """
+        ordinals = array("i", holidays._ordinals)
+        name_codes: Dict[str, int] = {}
+        codes = [
+            name_codes.setdefault(
+                dict.__getitem__(holidays, day), len(name_codes)
+            )
+            for day in map(date.fromordinal, ordinals)
+        ]
+        self._init(
+            getattr(holidays, "country", None),
+            holidays.subdiv,
+            holidays.observed,
+            holidays.en_name,
+            holidays.strict,
+            frozenset(holidays.years),
+            ordinals,
+            _code_array(codes),
+            tuple(map(sys.intern, name_codes)),
+        )
+
+    def _init(self, *values: Any) -> None:
+        for slot, value in zip(FrozenHolidays.__slots__, values):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} object is immutable")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{type(self).__name__} object is immutable")
+
+    def _index(self, key: Union[date, datetime, str, float]) -> int:
+        """Return the position of a date in the ordinals, or -1."""
+        ordinal = _to_date(key, self.strict).toordinal()
+        ordinals = self._ordinals
+        index = bisect_left(ordinals, ordinal)
+        if index < len(ordinals) and ordinals[index] == ordinal:
+            return index
+        return -1
+
+    def __contains__(self, key: Union[date, datetime, str, float]) -> bool:
+        return self._index(key) >= 0
+
+    def __getitem__(self, key: Union[date, datetime, str, float]) -> Any:
+        if isinstance(key, slice):
+            return self.get_range(key.start, key.stop, key.step)
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(_to_date(key, self.strict))
+        return self._names[self._codes[index]]
+
+    def get(
+        self,
+        key: Union[date, datetime, str, float],
+        default: Optional[Any] = None,
+    ) -> Any:
+        """Return the holiday name for a date if date is a holiday, else
+        default. See :meth:`HolidayBase.get`."""
+        index = self._index(key)
+        if index < 0:
+            return default
+        return self._names[self._codes[index]]
+
+    def get_list(self, key: Union[date, datetime, str, float]) -> List[str]:
+        """Return a list of all holiday names for a date. See
+        :meth:`HolidayBase.get_list`."""
+        return [h for h in self.get(key, "").split(", ") if h]
+
+    def get_range(
+        self,
+        start: Union[date, datetime, str, float],
+        stop: Union[date, datetime, str, float],
+        step: Optional[Union[int, timedelta]] = None,
+        inclusive: bool = False,
+    ) -> List[date]:
+        """Return the holiday dates from **start** to **stop**. See
+        :meth:`HolidayBase.get_range`."""
+        if not start or not stop:
+            raise ValueError("Both start and stop must be given.")
+        start = _to_date(start, self.strict)
+        stop = _to_date(stop, self.strict)
+        return _ordinal_range(
+            self._ordinals,
+            start.toordinal(),
+            stop.toordinal(),
+            _step_days(step),
+            inclusive,
+        )
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def keys(self) -> Iterator[date]:
+        """Iterate over the holiday dates, in order."""
+        return iter(self)
+
+    def values(self) -> Iterator[str]:
+        """Iterate over the holiday names, in date order."""
+        names = self._names
+        return (names[code] for code in self._codes)
+
+    def items(self) -> Iterator[Tuple[date, str]]:
+        """Iterate over the (date, name) holidays, in date order."""
+        return zip(self.keys(), self.values())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenHolidays):
+            return NotImplemented
+        return (
+            self.country == other.country
+            and self.subdiv == other.subdiv
+            and self.observed == other.observed
+            and self.en_name == other.en_name
+            and self.years == other.years
+            and self._ordinals == other._ordinals
+            and list(self.values()) == list(other.values())
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.years, self._ordinals.tobytes()))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            _restore,
+            (
+                self.country,
+                self.subdiv,
+                self.observed,
+                self.en_name,
+                self.strict,
+                self.years,
+                self._ordinals.tobytes(),
+                list(self._names),
+                self._codes.tolist(),
+            ),
+        )
+
+    def memory_footprint(self) -> int:
+        """Return the approximate memory, in bytes, of this calendar,
+        including its names, although calendars with the same names share
+        them."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.years)
+            + sys.getsizeof(self._ordinals)
+            + sys.getsizeof(self._codes)
+            + sys.getsizeof(self._names)
+            + sum(sys.getsizeof(name) for name in self._names)
+        )
+
+    def __repr__(self) -> str:
+        return f"<FrozenHolidays {self.country} ({len(self)} holidays)>"
+
+
+def _restore(
+    country: Optional[str],
+    subdiv: Optional[str],
+    observed: bool,
+    en_name: bool,
+    strict: bool,
+    years: frozenset,
+    ordinals: bytes,
+    names: List[str],
+    codes: List[int],
+) -> FrozenHolidays:
+    frozen = FrozenHolidays.__new__(FrozenHolidays)
+    ordinal_array = array("i")
+    ordinal_array.frombytes(ordinals)
+    frozen._init(
+        country,
+        subdiv,
+        observed,
+        en_name,
+        strict,
+        years,
+        ordinal_array,
+        _code_array(codes),
+        tuple(map(sys.intern, names)),
+    )
+    return frozen
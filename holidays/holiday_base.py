@@ -1,23 +1,228 @@
+import re
+import sys
 import warnings
-import pandas as pd
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from datetime import timedelta, datetime, date
+from functools import lru_cache
+from heapq import merge
+from itertools import accumulate, groupby
+from operator import itemgetter
+from threading import Lock, RLock, local
 from typing import (
     Any,
     Dict,
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     TYPE_CHECKING,
     Tuple,
+    Type,
     Union,
 )
 
 from dateutil.parser import parse
 
+from holidays import instrument
+from holidays.business import BusinessDays
+from holidays.cache import YearEntries, year_cache
+from holidays.constants import WEEKEND
+
 if TYPE_CHECKING:
+    from holidays.dataset import MappedHolidays
+    from holidays.frozen import FrozenHolidays
+    from holidays.shared import SharedHolidays
     from holidays.utils import country_holidays  # required by docstring
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Country classes by class name, and by country code and alias.
+_COUNTRY_CLASSES: Dict[str, Type["HolidayBase"]] = {}
+_COUNTRY_ALIASES: Dict[str, Type["HolidayBase"]] = {}
+
+# Serializes the changes made while calculating years (see _YearGuards), and
+# the creation of the guards themselves.
+_COMMIT_LOCK = Lock()
+
+# A date in ISO 8601 extended format, optionally followed by a time.
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ].+)?")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(key: str, strict: bool = False) -> date:
+    """Parse a date string, reading ISO 8601 dates directly and handing
+    anything else to :func:`dateutil.parser.parse` unless **strict**."""
+    if _ISO_DATE.fullmatch(key):
+        try:
+            return datetime.fromisoformat(key).date()
+        except ValueError:
+            if strict:
+                raise
+    elif strict:
+        raise ValueError("Not an ISO 8601 date")
+    with instrument.timed("dateutil", None, key):
+        return parse(key).date()
+
+
+def _to_date(
+    key: Union[date, datetime, str, float], strict: bool = False
+) -> date:
+    """Convert a date, datetime, date string or POSIX timestamp to a date,
+    as described in :meth:`HolidayBase.__keytransform__`."""
+    key_type = type(key)
+    if key_type is date:
+        return key
+    elif key_type is str:
+        try:
+            return _parse_date(key, strict)
+        except (ValueError, OverflowError):
+            raise ValueError("Cannot parse date from string '%s'" % key)
+    elif isinstance(key, datetime):
+        return key.date()
+    elif isinstance(key, date):
+        return key
+    elif key_type is int:
+        return date.fromordinal(_EPOCH_ORDINAL + key // 86400)
+    elif isinstance(key, int) or isinstance(key, float):
+        return datetime.utcfromtimestamp(key).date()
+    elif isinstance(key, str):
+        try:
+            return _parse_date(str(key), strict)
+        except (ValueError, OverflowError):
+            raise ValueError("Cannot parse date from string '%s'" % key)
+    else:
+        raise TypeError("Cannot convert type '%s' to date." % type(key))
+
+
+def _step_days(step: Optional[Union[int, timedelta]]) -> int:
+    """Return the number of days of a range step, 1 if it is None."""
+    if step is None:
+        return 1
+    if isinstance(step, timedelta):
+        step = step.days
+    elif not isinstance(step, int):
+        raise TypeError("Cannot convert type '%s' to int." % type(step))
+    if step == 0:
+        raise ValueError("Step value must not be zero.")
+    return step
+
+
+def _ordinal_range(
+    ordinals: Sequence[int], first: int, last: int, step: int, inclusive: bool
+) -> List[date]:
+    """Return the dates of the sorted day **ordinals** from **first** to
+    **last** a multiple of **step** days from **first**, found by binary
+    search, in the direction of the range."""
+    step = abs(step)
+    if first <= last:
+        found = ordinals[
+            bisect_left(ordinals, first) : (
+                bisect_right(ordinals, last)
+                if inclusive
+                else bisect_left(ordinals, last)
+            )
+        ]
+    else:
+        found = ordinals[
+            (
+                bisect_left(ordinals, last)
+                if inclusive
+                else bisect_right(ordinals, last)
+            ) : bisect_right(ordinals, first)
+        ][::-1]
+    return [
+        date.fromordinal(ordinal)
+        for ordinal in found
+        if (ordinal - first) % step == 0
+    ]
+
+
+def _merge_names(old_value: str, value: str) -> str:
+    """Return the name of a holiday set on a date that already has one:
+    both names, the new one first, unless one contains the other, in which
+    case the old name is kept."""
+    if old_value.find(value) < 0 and value.find(old_value) < 0:
+        return "%s, %s" % (value, old_value)
+    return old_value
+
+
+class YearBuilder:
+    """
+    Collects the holidays :meth:`HolidayBase._populate` calculates for a
+    year and commits them to the calendar in one step, with the same name
+    merging as setting them one by one, but without the key conversion and
+    index upkeep of :meth:`HolidayBase.__setitem__` for every entry. Keys
+    must be :class:`datetime.date` objects.
+
+    Used as a context manager, it commits on exit:
+
+    >>> from datetime import date
+    >>> from holidays import HolidayBase
+    >>> class Example(HolidayBase):
+    ...     def _populate(self, year):
+    ...         with self._year_builder() as builder:
+    ...             builder[date(year, 1, 1)] = "New Year's Day"
+    ...             builder[date(year, 1, 1)] = "Founding Day"
+    >>> Example(years=2024)
+    {datetime.date(2024, 1, 1): "Founding Day, New Year's Day"}
+    """
+
+    __slots__ = ("holidays", "_entries")
+
+    def __init__(self, holidays: Optional["HolidayBase"] = None) -> None:
+        """
+        :param holidays:
+            The calendar to commit to, if any.
+        """
+        self.holidays = holidays
+        self._entries: Dict[date, str] = {}
+
+    def __setitem__(self, day: date, name: str) -> None:
+        entries = self._entries
+        old_name = entries.get(day)
+        entries[day] = name if old_name is None else _merge_names(
+            old_name, name
+        )
+
+    def entries(self) -> YearEntries:
+        """Return the (date, name) holidays collected, in the order their
+        dates were first set."""
+        return tuple(self._entries.items())
+
+    def commit(self) -> None:
+        """Set the holidays collected in the calendar and start over."""
+        if self.holidays is not None and self._entries:
+            self.holidays._commit(self._entries.items())
+        self._entries = {}
+
+    def __enter__(self) -> "YearBuilder":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            self.commit()
+
+
+class _YearGuards:
+    """The lock under which a calendar calculates years, and the years each
+    thread is calculating, for :meth:`HolidayBase._expand_years`."""
+
+    __slots__ = ("lock", "building")
+
+    def __init__(self) -> None:
+        self.lock = RLock()
+        # The years being calculated by the current thread, in a set only
+        # that thread reads and writes, and only under the lock.
+        self.building = local()
+
+    def years(self) -> Set[int]:
+        years = getattr(self.building, "years", None)
+        if years is None:
+            years = self.building.years = set()
+        return years
+
 
 class HolidayBase(dict):
     """
@@ -158,14 +363,72 @@ class HolidayBase(dict):
     """The years calculated."""
     expand: bool
     """Whether the entire year is calculated when one date from that year
-    is requested."""
+    is requested. Threads may share a calendar for lookups: each year is
+    calculated once, and lookups of calculated years do not lock."""
     observed: bool
     """Whether dates when public holiday are observed are included."""
     subdiv: Optional[str] = None
     """The subdiv requested."""
+    strict: bool = False
+    """Whether string dates must be in ISO 8601 format."""
+    aliases: Tuple[str, ...] = ()
+    """Other names, besides the class name and the country code, that
+    :func:`country_holidays` accepts for the country."""
+    substitute_suffixes: Tuple[Tuple[str, str], ...] = ()
+    """The suffixes ending the names of substitute holidays, in the local
+    language and in English."""
+    cache_years: bool = False
+    """Whether the holidays calculated for a year are kept in the
+    process-wide :data:`holidays.cache.year_cache` and reused by other
+    instances with the same **en_name**, **observed** and **subdiv**. Only
+    classes whose :meth:`_populate` depends on nothing else may set it."""
     _deprecated_subdivisions: List[str] = []
     """Other subdivisions whose names are deprecated or aliases of the official
     ones."""
+    _version: int = 0
+    """Incremented on every change to the holidays, so that data derived from
+    them (e.g. :class:`holidays.business.BusinessDays`) can tell when it is
+    out of date."""
+    _business_days: Optional[BusinessDays] = None
+    _exports: Optional[Dict[Tuple[Any, ...], Tuple[int, Any]]] = None
+    """NumPy and pandas calendars exported from the holidays, by kind and
+    span, with the :attr:`_version` they were built from."""
+    _guards: Optional[_YearGuards] = None
+    """The lock making sure each year is calculated once when threads share
+    the calendar, created on first use."""
+    _read_only: bool = False
+    """Whether changing the holidays raises a TypeError, for calendars
+    shared by :func:`holidays.utils.cached_country_holidays`."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register the country classes of :mod:`holidays.countries`
+        (those with a **country** code) for
+        :func:`holidays.utils.country_holidays` under their class name,
+        their country code and their **aliases**. Classes defined elsewhere,
+        such as user subclasses, are not registered, so they cannot replace
+        a country. A name, code or alias maps to the first class that
+        claimed it; only its subclasses may claim it again.
+
+        :raise:
+            ValueError if a code or alias is already claimed by an
+            unrelated class.
+        """
+        super().__init_subclass__(**kwargs)
+        country = getattr(cls, "country", None)
+        if not isinstance(country, str) or not cls.__module__.startswith(
+            "holidays.countries."
+        ):
+            return
+        for alias in (country, *cls.aliases):
+            registered = _COUNTRY_ALIASES.get(alias)
+            if registered is not None and not issubclass(cls, registered):
+                raise ValueError(
+                    f"Country code or alias {alias!r} of {cls.__name__} is "
+                    f"already used by {registered.__name__}"
+                )
+        _COUNTRY_CLASSES.setdefault(cls.__name__, cls)
+        for alias in (country, *cls.aliases):
+            _COUNTRY_ALIASES.setdefault(alias, cls)
 
     def __init__(
         self,
@@ -175,7 +438,8 @@ class HolidayBase(dict):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,  # deprecated
         state: Optional[str] = None,  # deprecated
-        en_name : bool = False
+        en_name : bool = False,
+        strict: bool = False,
     ) -> None:
         """
         :param years:
@@ -200,14 +464,22 @@ class HolidayBase(dict):
             (e.g. a holiday falling on a Sunday being observed the
             following Monday). This doesn't work for all countries.
 
+        :param strict:
+            Whether string dates must be in ISO 8601 format (e.g.
+            ``'2014-01-01'`` or ``'2014-01-01T09:00:00'``); otherwise any
+            format recognized by :func:`dateutil.parser.parse` is accepted.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
         super().__init__()
+        # Sorted day ordinals of the holiday dates, kept in step with the keys.
+        self._ordinals: List[int] = []
         self.observed = observed
         self.expand = expand
         self.subdiv = subdiv or prov or state
         self.en_name = en_name
+        self.strict = strict
         if prov or state:
             warnings.warn(
                 "Arguments prov and state are deprecated, use subdiv="
@@ -228,11 +500,11 @@ class HolidayBase(dict):
             self.years = {years}
         else:
             self.years = set(years) if years is not None else set()
-        for year in self.years.copy():
-            self._populate(year)
+        self._populate_years(list(self.years))
 
     def __setattr__(self, key: str, value: Any) -> None:
         if key == "observed" and len(self) > 0:
+            self._check_writable()
             dict.__setattr__(self, key, value)
             if value is True:
                 # Add (Observed) dates
@@ -240,7 +512,7 @@ class HolidayBase(dict):
                 self.years = set()
                 self.clear()
                 for year in years:
-                    self._populate(year)
+                    self._populate_year(year)
             else:
                 # Remove (Observed) dates
                 for k, v in list(self.items()):
@@ -255,27 +527,20 @@ class HolidayBase(dict):
         * :class:`datetime.date`,
         * :class:`datetime.datetime`,
         * a :class:`str` of any format recognized by
-          :func:`dateutil.parser.parse`,
+          :func:`dateutil.parser.parse` (only ISO 8601 if **strict**),
         * or a :class:`float` or :class:`int` representing a POSIX timestamp
 
-        to :class:`datetime.date`, which is how it's stored by the class."""
-        if isinstance(key, datetime):
-            out_key = key.date()
-        elif isinstance(key, date):
+        to :class:`datetime.date`, which is how it's stored by the class.
+
+        ISO 8601 strings are read without :func:`dateutil.parser.parse`, and
+        the most recently used strings are cached."""
+        if type(key) is date:
             out_key = key
-        elif isinstance(key, int) or isinstance(key, float):
-            out_key = datetime.utcfromtimestamp(key).date()
-        elif isinstance(key, str):
-            try:
-                out_key = parse(key).date()
-            except (ValueError, OverflowError):
-                raise ValueError("Cannot parse date from string '%s'" % key)
         else:
-            raise TypeError("Cannot convert type '%s' to date." % type(key))
+            out_key = _to_date(key, self.strict)
 
         if self.expand and out_key.year not in self.years:
-            self.years.add(out_key.year)
-            self._populate(out_key.year)
+            self._expand_years((out_key.year,))
         return out_key
 
     def __contains__(  # type: ignore[override]
@@ -302,50 +567,113 @@ class HolidayBase(dict):
         ],
     ) -> str:
         if isinstance(key, slice):
-            if not key.start or not key.stop:
-                raise ValueError("Both start and stop must be given.")
-
-            start = self.__keytransform__(key.start)
-            stop = self.__keytransform__(key.stop)
-
-            if key.step is None:
-                step = 1
-            elif isinstance(key.step, timedelta):
-                step = key.step.days
-            elif isinstance(key.step, int):
-                step = key.step
-            else:
-                raise TypeError(
-                    "Cannot convert type '%s' to int." % type(key.step)
+            return self.get_range(key.start, key.stop, key.step)
+        return dict.__getitem__(self, self.__keytransform__(key))
+
+    def get_range(
+        self,
+        start: Union[date, datetime, str, float],
+        stop: Union[date, datetime, str, float],
+        step: Optional[Union[int, timedelta]] = None,
+        inclusive: bool = False,
+    ) -> List[date]:
+        """Return the holiday dates from **start** to **stop**, the same way
+        as the slice ``self[start:stop:step]``. Every year in the range is
+        calculated (if **expand** is set), and the dates are found by binary
+        search in the sorted holiday dates, so the cost depends on the number
+        of holidays returned rather than on the length of the range.
+
+        :param start:
+            The first date, in any of the types accepted by :meth:`get`.
+
+        :param stop:
+            The date where the range ends, in any of the types accepted by
+            :meth:`get`. The range runs backwards if it is before **start**.
+
+        :param step:
+            Only return the dates a multiple of **step** days (an
+            :class:`int` or a :class:`datetime.timedelta`) away from
+            **start**. Its sign is ignored.
+
+        :param inclusive:
+            Whether **stop** is included in the range.
+
+        :return:
+            The holiday dates, in the direction of the range.
+        """
+        if not start or not stop:
+            raise ValueError("Both start and stop must be given.")
+
+        start = self.__keytransform__(start)
+        stop = self.__keytransform__(stop)
+
+        step = _step_days(step)
+
+        if self.expand:
+            self._expand_years(
+                range(
+                    min(start.year, stop.year), max(start.year, stop.year) + 1
                 )
+            )
 
-            if step == 0:
-                raise ValueError("Step value must not be zero.")
-
-            date_diff = stop - start
-            if date_diff.days < 0 <= step or date_diff.days >= 0 > step:
-                step *= -1
-
-            days_in_range = []
-            for delta_days in range(0, date_diff.days, step):
-                day = start + timedelta(days=delta_days)
-                try:
-                    self.__getitem__(day)
-                    days_in_range.append(day)
-                except KeyError:
-                    pass
-            return days_in_range
-        return dict.__getitem__(self, self.__keytransform__(key))
+        with instrument.timed("slice", None, (start, stop)):
+            return _ordinal_range(
+                self._ordinals,
+                start.toordinal(),
+                stop.toordinal(),
+                step,
+                inclusive,
+            )
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise TypeError(
+                f"{type(self).__name__} object is read-only; "
+                "copy it to make changes"
+            )
 
     def __setitem__(
         self, key: Union[date, datetime, str, float], value
     ) -> None:
-        if key in self:
-            if self.get(key).find(value) < 0 and value.find(self.get(key)) < 0:
-                value = "%s, %s" % (value, self.get(key))
-            else:
-                value = self.get(key)
-        return dict.__setitem__(self, self.__keytransform__(key), value)
+        if self._read_only:
+            self._check_writable()
+        key = self.__keytransform__(key)
+        if dict.__contains__(self, key):
+            value = _merge_names(dict.__getitem__(self, key), value)
+        else:
+            insort(self._ordinals, key.toordinal())
+        self._version += 1
+        return dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Union[date, datetime, str, float]) -> None:
+        self._check_writable()
+        key = self.__keytransform__(key)
+        dict.__delitem__(self, key)
+        self._remove_ordinal(key)
+
+    def _remove_ordinal(self, key: date) -> None:
+        ordinals = self._ordinals
+        del ordinals[bisect_left(ordinals, key.toordinal())]
+        self._version += 1
+
+    def clear(self) -> None:
+        self._check_writable()
+        dict.clear(self)
+        self._ordinals.clear()
+        self._version += 1
+
+    def popitem(self) -> Tuple[date, str]:
+        self._check_writable()
+        item = dict.popitem(self)
+        self._remove_ordinal(item[0])
+        return item
+
+    def setdefault(  # type: ignore[override]
+        self, key: Union[date, datetime, str, float], default: str = "Holiday"
+    ) -> str:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, self.__keytransform__(key))
 
     def update(self, *args) -> None:  # type: ignore[override]
         # TODO: fix arguments; should not be *args (cannot properly Type hint)
@@ -428,6 +756,108 @@ class HolidayBase(dict):
         """
         return [h for h in self.get(key, "").split(", ") if h]
 
+    def _epoch_day_index(self) -> Tuple[Any, Any]:
+        """Return the holiday dates as a sorted :mod:`numpy` int64 array of
+        days since 1970-01-01, with the matching names array."""
+        import numpy as np
+
+        keys = sorted(dict.keys(self))
+        days = np.fromiter(
+            (key.toordinal() - _EPOCH_ORDINAL for key in keys),
+            dtype="int64",
+            count=len(keys),
+        )
+        names = np.empty(len(keys), dtype=object)
+        names[:] = [dict.__getitem__(self, key) for key in keys]
+        return days, names
+
+    def _lookup_array(self, values: Any) -> Tuple[Any, Any]:
+        """Return, for each date in **values**, the position of its holiday
+        in the names array of :meth:`_epoch_day_index` (-1 if it is not a
+        holiday), along with that names array.
+
+        The dates are turned into day numbers and every year present is
+        calculated once (if **expand** is set); each day is then looked up
+        in the sorted holiday days with a binary search, so the memory used
+        grows with the number of dates and holidays, not with the span of
+        days between the earliest and the latest date."""
+        import numpy as np
+
+        days = np.asarray(values).astype("datetime64[D]").ravel()
+        days = days.view("int64")
+        valid = days != np.iinfo("int64").min  # NaT
+        codes = np.full(len(days), -1, dtype="int32")
+        if not valid.any():
+            return codes, self._epoch_day_index()[1]
+        offsets = days[valid]
+
+        if self.expand:
+            years = np.unique(
+                offsets.astype("datetime64[D]").astype("datetime64[Y]")
+            )
+            self._expand_years(
+                year
+                for year in (years.view("int64") + 1970).tolist()
+                if year not in self.years
+            )
+
+        index, names = self._epoch_day_index()
+        if len(index):
+            found = np.searchsorted(index, offsets)
+            np.minimum(found, len(index) - 1, out=found)
+            codes[valid] = np.where(index[found] == offsets, found, -1)
+        return codes, names
+
+    def is_holiday_array(self, values: Any) -> Any:
+        """Return a boolean :mod:`numpy` array telling, for each date in
+        **values**, whether it is a holiday. The years present are all
+        calculated once up front (if **expand** is set) and the dates are
+        then matched as day numbers in a single vectorized lookup.
+
+        :param values:
+            A :class:`numpy.ndarray` of ``datetime64``, a
+            :class:`pandas.DatetimeIndex` or :class:`pandas.Series` of
+            datetimes, or any sequence of :class:`datetime.date` or
+            :class:`datetime.datetime`. NaT is never a holiday.
+
+        :return:
+            A flat boolean array aligned with **values**.
+        """
+        return self._lookup_array(values)[0] >= 0
+
+    def holiday_names_array(
+        self, values: Any, categorical: bool = False
+    ) -> Any:
+        """Return the holiday name for each date in **values**, or None for
+        dates that are not holidays. See :meth:`is_holiday_array`.
+
+        :param values:
+            The dates, as accepted by :meth:`is_holiday_array`.
+
+        :param categorical:
+            Return a :class:`pandas.Categorical` (with NaN for dates that
+            are not holidays) instead of an object array.
+
+        :return:
+            A flat :mod:`numpy` object array (or :class:`pandas.Categorical`)
+            aligned with **values**.
+        """
+        import numpy as np
+
+        codes, names = self._lookup_array(values)
+        found = codes >= 0
+        if categorical:
+            import pandas as pd
+
+            categories, inverse = np.unique(
+                names.astype(str), return_inverse=True
+            )
+            codes[found] = inverse[codes[found]]
+            return pd.Categorical.from_codes(codes, categories)
+        result = np.full(len(codes), None, dtype=object)
+        result[found] = names[codes[found]]
+        return result
+
     def get_named(self, name: str) -> List[date]:
         """Return a list of all holiday dates matching the provided holiday
         name. The match will be made case insensitively and partial matches
@@ -474,9 +904,16 @@ class HolidayBase(dict):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        self._check_writable()
+        key = self.__keytransform__(key)
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
-        return dict.pop(self, self.__keytransform__(key), default)
+            value = dict.pop(self, key)
+        elif not dict.__contains__(self, key):
+            return default
+        else:
+            value = dict.pop(self, key)
+        self._remove_ordinal(key)
+        return value
 
     def pop_named(self, name: str) -> List[date]:
         """Remove (no longer treat at as holiday) all dates matching the
@@ -502,11 +939,259 @@ class HolidayBase(dict):
             self.pop(key)
         return to_pop
 
+    def _get_business_days(self) -> BusinessDays:
+        if self._business_days is None:
+            self._business_days = BusinessDays(self, WEEKEND)
+        return self._business_days
+
+    def is_business_day(self, key: Union[date, datetime, str, float]) -> bool:
+        """Return True if the date is neither a Saturday, a Sunday nor a
+        holiday.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+        """
+        return self._get_business_days().is_business_day(
+            self.__keytransform__(key)
+        )
+
+    def add_business_days(
+        self, key: Union[date, datetime, str, float], n: int
+    ) -> date:
+        """Return the date **n** business days after the given date (before
+        it if **n** is negative); business days are neither Saturdays,
+        Sundays nor holidays. The given date is not counted, so it does not
+        need to be a business day itself.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :param n:
+            The number of business days to move by. With 0, the date is
+            returned if it is a business day, else the next business day.
+
+        :return:
+            The resulting business day.
+        """
+        return self._get_business_days().add_business_days(
+            self.__keytransform__(key), n
+        )
+
+    def business_days_between(
+        self,
+        start: Union[date, datetime, str, float],
+        end: Union[date, datetime, str, float],
+    ) -> int:
+        """Return the number of business days (neither Saturdays, Sundays nor
+        holidays) from **start**, included, to **end**, excluded. The result
+        is negative if **end** is before **start**.
+
+        :param start:
+            The first date, in any of the types accepted by :meth:`get`.
+
+        :param end:
+            The date after the last one, in any of the types accepted by
+            :meth:`get`.
+        """
+        return self._get_business_days().business_days_between(
+            self.__keytransform__(start), self.__keytransform__(end)
+        )
+
+    def _export(self, key: Tuple[Any, ...], build: Any) -> Any:
+        """Return the export cached under **key**, calling **build** to
+        (re)build it if it is missing or the holidays changed since."""
+        if self._exports is None:
+            self._exports = {}
+        cached = self._exports.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        version = self._version
+        value = build()
+        self._exports[key] = (version, value)
+        return value
+
+    def _span_days(self, start: int, end: int) -> Tuple[Any, List[str]]:
+        """Calculate the years **start** to **end** (if **expand** is set)
+        and return their holiday dates as a NumPy ``datetime64[D]`` array,
+        in order, with their names."""
+        import numpy as np
+
+        if self.expand and not self._read_only:
+            self.populate_range(start, end)
+        ordinals = self._ordinals
+        found = ordinals[
+            bisect_left(ordinals, date(start, 1, 1).toordinal()) : (
+                bisect_left(ordinals, date(end + 1, 1, 1).toordinal())
+            )
+        ]
+        days = (
+            np.array(found, dtype=np.int64) - _EPOCH_ORDINAL
+        ).astype("datetime64[D]")
+        names = [dict.__getitem__(self, date.fromordinal(o)) for o in found]
+        return days, names
+
+    def to_busdaycalendar(
+        self, start: int, end: int, weekend: Iterable[int] = WEEKEND
+    ) -> Any:
+        """Return a :class:`numpy.busdaycalendar` of the holidays of the
+        years **start** to **end**, for :func:`numpy.busday_offset`,
+        :func:`numpy.busday_count` and :func:`numpy.is_busday`.
+
+        The years are calculated first (if **expand** is set), and the
+        calendar is cached for the span until the holidays change.
+
+        :param start:
+            The first year.
+
+        :param end:
+            The last year.
+
+        :param weekend:
+            The weekdays that are not business days, Saturday and Sunday by
+            default.
+
+        Example:
+
+        >>> import numpy as np
+        >>> from holidays import KR
+        >>> calendar = KR().to_busdaycalendar(2024, 2024)
+        >>> int(
+        ...     np.busday_count('2024-09-01', '2024-10-01', busdaycal=calendar)
+        ... )
+        18
+        """
+        weekend = frozenset(weekend)
+
+        def build() -> Any:
+            import numpy as np
+
+            weekmask = [0 if day in weekend else 1 for day in range(7)]
+            return np.busdaycalendar(
+                weekmask=weekmask, holidays=self._span_days(start, end)[0]
+            )
+
+        return self._export(("busdaycalendar", start, end, weekend), build)
+
+    def to_pandas_calendar(self, start: int, end: int) -> Any:
+        """Return a :class:`pandas.tseries.holiday.AbstractHolidayCalendar`
+        of the holidays of the years **start** to **end** (see
+        :class:`holidays.pandas_calendar.HolidayBaseCalendar`), for
+        :class:`pandas.offsets.CustomBusinessDay` and the like.
+
+        The years are calculated first (if **expand** is set), and the
+        calendar is cached for the span until the holidays change.
+
+        Example:
+
+        >>> import pandas as pd
+        >>> from holidays import KR
+        >>> calendar = KR().to_pandas_calendar(2024, 2024)
+        >>> day = pd.offsets.CustomBusinessDay(calendar=calendar)
+        >>> pd.Timestamp('2024-09-13') + day
+        Timestamp('2024-09-19 00:00:00')
+        """
+
+        def build() -> Any:
+            from holidays.pandas_calendar import HolidayBaseCalendar
+
+            days, names = self._span_days(start, end)
+            return HolidayBaseCalendar(days, names, start, end)
+
+        return self._export(("pandas", start, end), build)
+
+    @classmethod
+    def from_dataset(
+        cls, path: Optional[str] = None, en_name: bool = False
+    ) -> "MappedHolidays":
+        """Return a read-only calendar answering lookups from a precompiled
+        dataset file (see :mod:`holidays.dataset`), memory-mapped instead of
+        calculated. Dates outside of the years covered by the file are
+        calculated by this class.
+
+        :param path:
+            The dataset file, by default the one shipped for this country.
+
+        :param en_name:
+            Whether to use English holiday names.
+
+        :raise:
+            ValueError if the file is not a valid dataset.
+        """
+        from holidays.dataset import MappedHolidays, dataset_path
+
+        if path is None:
+            path = dataset_path(cls.country)
+        return MappedHolidays(path, cls, en_name=en_name)
+
+    def freeze(self) -> "FrozenHolidays":
+        """Return an immutable, compact copy of the holidays calculated so
+        far (see :class:`holidays.frozen.FrozenHolidays`), for keeping many
+        years or many calendars in memory."""
+        from holidays.frozen import FrozenHolidays
+
+        return FrozenHolidays(self)
+
+    def share(self, name: Optional[str] = None) -> "SharedHolidays":
+        """Return an immutable copy of the holidays calculated so far in a
+        block of shared memory (see :class:`holidays.shared.SharedHolidays`),
+        which worker processes attach to instead of unpickling a copy.
+
+        :param name:
+            The name of the block; a unique name is chosen if not given.
+        """
+        from holidays.shared import SharedHolidays
+
+        return SharedHolidays(self, name)
+
+    def memory_footprint(self) -> int:
+        """Return the approximate memory, in bytes, of the holidays: the
+        dict itself, its date keys and name values, and the sorted index of
+        the dates, to compare with :meth:`FrozenHolidays.memory_footprint`.
+        """
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.years)
+            + sys.getsizeof(self._ordinals)
+            + sum(sys.getsizeof(ordinal) for ordinal in self._ordinals)
+            + sum(sys.getsizeof(day) for day in dict.keys(self))
+            + sum(
+                sys.getsizeof(name)
+                for name in {id(name): name for name in self.values()}.values()
+            )
+        )
+
+    def _public_attributes(self) -> Dict[str, Any]:
+        # Private attributes hold caches and bookkeeping, not settings.
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith("_")
+        }
+
     def __eq__(self, other: object) -> bool:
-        return dict.__eq__(self, other) and self.__dict__ == other.__dict__
+        if not isinstance(other, HolidayBase):
+            return dict.__eq__(self, other)
+        return (
+            dict.__eq__(self, other)
+            and self._public_attributes() == other._public_attributes()
+        )
 
     def __ne__(self, other: object) -> bool:
-        return dict.__ne__(self, other) or self.__dict__ != other.__dict__
+        return not self == other
 
     def __add__(
         self, other: Union[int, "HolidayBase", "HolidaySum"]
@@ -544,8 +1229,229 @@ class HolidayBase(dict):
         """meta: public"""
         pass
 
+    def populate_range(
+        self, start: int, end: int, workers: Optional[int] = None
+    ) -> None:
+        """Calculate the holidays of every year from **start** to **end**
+        (both included) that is not calculated yet.
+
+        For classes that set :attr:`cache_years`, the years missing from the
+        shared year cache are calculated together in one pass (see
+        :meth:`_compute_years`), and with **workers** the span is split into
+        that many chunks calculated by a pool of processes, the results
+        being merged into this object in year order. Other classes populate
+        one year at a time, in this process.
+
+        :param start:
+            The first year.
+
+        :param end:
+            The last year.
+
+        :param workers:
+            The number of processes to split the calculation across; by
+            default (or with 1) everything is calculated in this process.
+        """
+        self.populate_years(range(start, end + 1), workers)
+
+    def populate_years(
+        self, years: Iterable[int], workers: Optional[int] = None
+    ) -> None:
+        """Calculate the holidays of the given years that are not calculated
+        yet, together, as :meth:`populate_range` does.
+
+        :param years:
+            The years, in any order; they do not need to be contiguous.
+
+        :param workers:
+            The number of processes to split the calculation across.
+        """
+        self._check_writable()
+        self._expand_years(years, workers)
+
+    def _expand_years(
+        self, years: Iterable[int], workers: Optional[int] = None
+    ) -> None:
+        """Calculate the given years that are not calculated yet, each only
+        once even when threads share the calendar, and publish them.
+
+        Reads of calculated years never lock. Years missing from
+        :attr:`years` are calculated under the calendar's lock, checking
+        again once it is held, and only added to :attr:`years` once all of
+        their holidays are set, so that another thread either sees a whole
+        year or waits for it. The lock is re-entrant: a thread that needs
+        more years while calculating some (as :meth:`_populate` setting a
+        date of another year does) calculates them too, skipping only the
+        years it is calculating itself. With one lock per calendar, threads
+        never wait on each other in a cycle."""
+        missing = sorted({year for year in years if year not in self.years})
+        if not missing:
+            return
+        guards = self._guards
+        if guards is None:
+            with _COMMIT_LOCK:
+                if self._guards is None:
+                    self._guards = _YearGuards()
+            guards = self._guards
+        with guards.lock:
+            building = guards.years()
+            todo = [
+                year
+                for year in missing
+                if year not in self.years and year not in building
+            ]
+            if not todo:
+                return
+            building.update(todo)
+            try:
+                self._populate_years(todo, workers)
+                self.years.update(todo)
+            finally:
+                building.difference_update(todo)
+
+    def _year_key(self, year: int) -> Tuple[Any, ...]:
+        return (type(self), year, self.en_name, self.observed, self.subdiv)
+
+    def _populate_year(self, year: int) -> None:
+        """Add the holidays of **year**, from the shared year cache if the
+        class sets :attr:`cache_years`, else by calling :meth:`_populate`.
+        Callers keep :attr:`years` up to date."""
+        if not self.cache_years:
+            self._populate(year)
+            return
+        key = self._year_key(year)
+        entries = year_cache.get(key)
+        if entries is None:
+            entries = self._compute_year(year)
+            year_cache.put(key, entries)
+        self._commit(entries)
+
+    def _populate_years(
+        self, years: List[int], workers: Optional[int] = None
+    ) -> None:
+        """Add the holidays of **years**, in order, as
+        :meth:`_populate_year` does, calculating the years missing from the
+        shared year cache together (see :meth:`populate_range`)."""
+        if not years:
+            return
+        with instrument.timed("populate", None, tuple(years), len(years)):
+            self._add_years(years, workers)
+
+    def _add_years(self, years: List[int], workers: Optional[int]) -> None:
+        if not self.cache_years or len(years) < 2:
+            for year in years:
+                self._populate_year(year)
+            return
+        computed: Dict[int, YearEntries] = {}
+        missing = []
+        for year in years:
+            entries = year_cache.get(self._year_key(year))
+            if entries is None:
+                missing.append(year)
+            else:
+                computed[year] = entries
+        if workers is not None and workers > 1 and len(missing) > 1:
+            computed.update(self._compute_years_in_pool(missing, workers))
+        elif missing:
+            computed.update(self._compute_years(missing))
+        for year in missing:
+            year_cache.put(self._year_key(year), computed[year])
+        self._commit(
+            entry for year in years for entry in computed[year]
+        )
+
+    def _compute_years_in_pool(
+        self, years: List[int], workers: int
+    ) -> Dict[int, YearEntries]:
+        from concurrent.futures import ProcessPoolExecutor
+
+        settings = {
+            "observed": self.observed,
+            "subdiv": self.subdiv,
+            "en_name": self.en_name,
+        }
+        size = -(-len(years) // workers)
+        chunks = [years[i : i + size] for i in range(0, len(years), size)]
+        computed: Dict[int, YearEntries] = {}
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(_compute_years, type(self), settings, chunk)
+                for chunk in chunks
+            ]
+            for future in futures:
+                computed.update(future.result())
+        return computed
+
+    def _year_builder(self) -> "YearBuilder":
+        """Return a :class:`YearBuilder` committing into this object, for
+        :meth:`_populate`."""
+        return YearBuilder(self)
+
+    def _commit(self, entries: Iterable[Tuple[date, str]]) -> None:
+        """Set the (date, name) **entries** as ``self[day] = name`` would,
+        one after the other, in one step: the dates must be
+        :class:`datetime.date` objects, new dates are added to the sorted
+        index together and :attr:`_version` is bumped once."""
+        if self._read_only:
+            self._check_writable()
+        with _COMMIT_LOCK:
+            new = []
+            for day, name in entries:
+                old_name = dict.get(self, day)
+                if old_name is None:
+                    new.append(day.toordinal())
+                else:
+                    name = _merge_names(old_name, name)
+                dict.__setitem__(self, day, name)
+            if new:
+                ordinals = self._ordinals
+                if ordinals and min(new) <= ordinals[-1]:
+                    # Sorting in place would show other threads an empty
+                    # index meanwhile: replace the index instead.
+                    self._ordinals = sorted(ordinals + new)
+                else:
+                    new.sort()
+                    ordinals.extend(new)
+            self._version += 1
+
+    def _scratch(self) -> "HolidayBase":
+        """Return an empty calendar with the same settings."""
+        return type(self)(
+            expand=False,
+            observed=self.observed,
+            subdiv=self.subdiv,
+            en_name=self.en_name,
+        )
+
+    def _compute_year(self, year: int) -> YearEntries:
+        """Return the holidays :meth:`_populate` sets for **year** on an
+        empty calendar with the same settings."""
+        scratch = self._scratch()
+        scratch._populate(year)
+        return tuple(dict.items(scratch))
+
+    def _compute_years(self, years: List[int]) -> Dict[int, YearEntries]:
+        """Return the holidays of each of **years** as :meth:`_compute_year`
+        does. Classes that can calculate many years in one pass override
+        it."""
+        return {year: self._compute_year(year) for year in years}
+
     def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
-        return super(HolidayBase, self).__reduce__()
+        # The holidays are pickled compactly (see _pack_holidays) and the
+        # index is rebuilt from them. Copies must not share the years with
+        # the original; derived data referring to the original is rebuilt
+        # on demand.
+        state = dict(vars(self))
+        state["years"] = set(self.years)
+        for key in (
+            "_ordinals",
+            "_business_days",
+            "_exports",
+            "_guards",
+            "_read_only",
+        ):
+            state.pop(key, None)
+        return _unpack_holidays, (type(self), _pack_holidays(self)), state
 
     def __repr__(self):
         if len(self) == 0:
@@ -558,10 +1464,116 @@ class HolidayBase(dict):
 
     def __str__(self):
         if len(self) == 0:
-            return str(self.__dict__)
+            return str(self._public_attributes())
         return super(HolidayBase, self).__str__()
 
 
+_keytransform = HolidayBase.__keytransform__
+
+
+def _counted_keytransform(
+    self: HolidayBase, key: Union[date, datetime, str, float]
+) -> date:
+    """:meth:`HolidayBase.__keytransform__` counting and timing the keys by
+    type, in its place while :mod:`holidays.instrument` is enabled."""
+    with instrument.timed("key", type(key).__name__, key):
+        return _keytransform(self, key)
+
+
+def _code_array(codes: Sequence[int]) -> array:
+    """Return **codes** in the smallest unsigned array type holding them."""
+    top = max(codes, default=0)
+    return array("B" if top <= 0xFF else "H" if top <= 0xFFFF else "I", codes)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+_PackedHolidays = Tuple[int, str, bytes, List[str], str, bytes]
+
+
+def _pack_holidays(holidays: HolidayBase) -> _PackedHolidays:
+    """Return the holidays of a calendar in the compact form it is pickled
+    in: the day ordinal of the first date, the differences between the
+    ordinals of consecutive dates, the distinct names, and the index of
+    each holiday's name among them. The dates are kept in the order of the
+    dict, and the arrays are stored little-endian."""
+    ordinals = [day.toordinal() for day in dict.keys(holidays)]
+    deltas = [b - a for a, b in zip(ordinals, ordinals[1:])]
+    small = all(-0x8000 <= delta < 0x8000 for delta in deltas)
+    names = list(dict.fromkeys(dict.values(holidays)))
+    name_codes = {name: code for code, name in enumerate(names)}
+    codes = _code_array([name_codes[name] for name in dict.values(holidays)])
+    return (
+        ordinals[0] if ordinals else 0,
+        "h" if small else "i",
+        _little_endian(array("h" if small else "i", deltas)),
+        names,
+        codes.typecode,
+        _little_endian(codes),
+    )
+
+
+def _unpack_holidays(
+    cls: Type[HolidayBase], packed: _PackedHolidays
+) -> HolidayBase:
+    """Recreate a calendar from :func:`_pack_holidays`; pickle then sets
+    its attributes."""
+    first, delta_type, deltas, names, code_type, codes = packed
+    holidays = cls.__new__(cls)
+    ordinals = (
+        list(accumulate(_from_little_endian(delta_type, deltas), initial=first))
+        if names
+        else []
+    )
+    dict.update(
+        holidays,
+        zip(
+            map(date.fromordinal, ordinals),
+            map(names.__getitem__, _from_little_endian(code_type, codes)),
+        ),
+    )
+    holidays._ordinals = sorted(ordinals)
+    return holidays
+
+
+def _compute_years(
+    cls: Type[HolidayBase], settings: Dict[str, Any], years: List[int]
+) -> Dict[int, YearEntries]:
+    """Calculate **years** of a country class in a worker process, for
+    :meth:`HolidayBase.populate_range`."""
+    return cls(expand=False, **settings)._compute_years(years)
+
+
+def get_country_class(country: str) -> Type[HolidayBase]:
+    """Return the country class registered under **country**, which is
+    either a class name (e.g. ``'Korea'``), a country code (e.g. ``'KR'``)
+    or an alias of one of the country classes.
+
+    :raise:
+        NotImplementedError if no country class has that name.
+    """
+    try:
+        return _COUNTRY_CLASSES[country]
+    except KeyError:
+        pass
+    try:
+        return _COUNTRY_ALIASES[country]
+    except KeyError:
+        raise NotImplementedError(f"Country {country} not available")
+
+
 class HolidaySum(HolidayBase):
     """
     Returns a :class:`dict`-like object resulting from the addition of two or
@@ -569,7 +1581,10 @@ class HolidaySum(HolidayBase):
     are available as a :class:`list` in the attribute :attr:`holidays,` and
     :attr:`country` and :attr:`subdiv` attributes are added
     together and could become :class:`list` s. Holiday names, when different,
-    are merged. All years are calculated (expanded) for all operands.
+    are merged. Each year is calculated (expanded) for all the operands
+    missing it, except read-only ones (such as those of
+    :func:`holidays.utils.cached_country_holidays`), which only contribute
+    the years they already have.
     """
 
     country: Union[str, List[str]]  # type: ignore[assignment]
@@ -629,6 +1644,7 @@ country_holidays('CA') + country_holidays('MX')
         kwargs["years"] = h1.years | h2.years
         kwargs["expand"] = h1.expand or h2.expand
         kwargs["observed"] = h1.observed or h2.observed
+        kwargs["strict"] = h1.strict and h2.strict
         # join country and subdivisions data
         # TODO this way makes no sense: joining Italy Catania (IT, CA) with
         # USA Mississippi (US, MS) and USA Michigan (US, MI) yields
@@ -657,10 +1673,62 @@ country_holidays('CA') + country_holidays('MX')
                     h2, attr, None
                 )
         self.country = kwargs.pop("country")
+        # The years each operand had, and the first year calculated, which
+        # decide the order of the merged names (see _populate).
+        self._prior_years = [frozenset(h.years) for h in self.holidays]
+        self._first_year = min(kwargs["years"], default=None)
 
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year: int) -> None:
-        for h in self.holidays[::-1]:
-            h._populate(year)
-            self.update(h)
+        """Calculate **year** in the operands that are missing it, then merge
+        their holidays of that year, and only those, into this object: the
+        sorted dates of the operands are merged, and the names of each date
+        are folded in one pass, in the order they were merged in when each
+        year calculated merged all the holidays of the operands, the last
+        operand first: the operands that had the year before this object
+        merged its names with the first year calculated, before the others
+        calculated it. Read-only operands missing the year are skipped
+        rather than calculated."""
+        first = date(year, 1, 1).toordinal()
+        end = date(year + 1, 1, 1).toordinal()
+        operands = self.holidays[::-1]
+        if year != self._first_year:
+            priors = self._prior_years[::-1]
+            operands = [
+                operands[rank]
+                for rank in sorted(
+                    range(len(operands)),
+                    key=lambda rank: year not in priors[rank],
+                )
+            ]
+        streams = []
+        for rank, h in enumerate(operands):
+            if not h._read_only and year not in h.years:
+                h._expand_years((year,))
+            ordinals = h._ordinals
+            streams.append(
+                [
+                    (ordinal, rank)
+                    for ordinal in ordinals[
+                        bisect_left(ordinals, first) : bisect_left(
+                            ordinals, end
+                        )
+                    ]
+                ]
+            )
+        with _COMMIT_LOCK:
+            for ordinal, group in groupby(
+                merge(*streams), key=itemgetter(0)
+            ):
+                day = date.fromordinal(ordinal)
+                name = dict.get(self, day)
+                if name is None:
+                    insort(self._ordinals, ordinal)
+                for _, rank in group:
+                    value = dict.__getitem__(operands[rank], day)
+                    name = (
+                        value if name is None else _merge_names(name, value)
+                    )
+                dict.__setitem__(self, day, name)
+            self._version += 1
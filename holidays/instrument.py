@@ -0,0 +1,224 @@
+"""Opt-in instrumentation of the calculations and lookups of the calendars,
+to find out why a lookup was slow.
+
+While enabled, the following events are counted and timed process-wide,
+and passed to the hooks registered with :func:`add_hook`:
+
+``populate``
+    Years calculated (from the shared year cache or not), with the years
+    as detail; counted per year.
+``key``
+    Keys transformed to dates by :meth:`HolidayBase.__keytransform__`, by
+    type name, timed including any year calculated for them.
+``dateutil``
+    Strings parsed with :func:`dateutil.parser.parse` rather than read as
+    ISO 8601 (strings already parsed are cached and not counted).
+``lunar``
+    Lunar dates converted to solar dates, by source: the precomputed
+    ``table`` or ``korean_lunar_calendar``.
+``slice``
+    Ranges of dates scanned by :meth:`HolidayBase.get_range` and slices.
+
+The slow paths are wrapped in :func:`timed`, which returns a shared
+context doing nothing while disabled. The key lookups cost nothing while
+disabled: enabling swaps in a counting and timing
+:meth:`HolidayBase.__keytransform__`.
+
+Example usage:
+
+>>> from holidays import KR, instrument
+>>> instrument.enable()
+>>> kr_holidays = KR(years=2024)
+>>> '2024-09-17' in kr_holidays
+True
+>>> snapshot = instrument.stats()
+>>> snapshot['key']['by']
+{'str': 1}
+>>> snapshot['populate']['count']
+1
+>>> instrument.disable()
+>>> instrument.reset()
+"""
+
+from collections import defaultdict
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+EVENTS = ("populate", "key", "dateutil", "lunar", "slice")
+"""The names of the events."""
+
+enabled = False
+"""Whether events are counted; see :func:`enable`."""
+
+
+class Event(NamedTuple):
+    """An instrumented event, as passed to the hooks."""
+
+    name: str
+    """One of :data:`EVENTS`."""
+    label: Optional[str]
+    """The key type, or the source of a lunar conversion, else None."""
+    detail: Any
+    """What the event was about: the years populated, the string parsed,
+    the lunar date converted, or the start and stop of the range."""
+    count: int
+    """The number of years, keys, strings or dates of the event."""
+    seconds: float
+    """How long the event took."""
+
+
+Hook = Callable[[Event], None]
+
+_lock = Lock()
+_counts: Dict[str, int] = defaultdict(int)
+_seconds: Dict[str, float] = defaultdict(float)
+_labels: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+_hooks: Dict[str, List[Hook]] = {name: [] for name in EVENTS}
+
+
+def enable() -> None:
+    """Start counting events and calling the hooks."""
+    global enabled
+    from holidays import holiday_base
+
+    with _lock:
+        enabled = True
+        holiday_base.HolidayBase.__keytransform__ = (  # type: ignore
+            holiday_base._counted_keytransform
+        )
+
+
+def disable() -> None:
+    """Stop counting events and calling the hooks; the counts are kept
+    until :func:`reset`."""
+    global enabled
+    from holidays import holiday_base
+
+    with _lock:
+        enabled = False
+        holiday_base.HolidayBase.__keytransform__ = (  # type: ignore
+            holiday_base._keytransform
+        )
+
+
+def reset() -> None:
+    """Clear the counts and timings."""
+    with _lock:
+        _counts.clear()
+        _seconds.clear()
+        _labels.clear()
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot of the counts, by event name: the ``count``, the
+    cumulative ``seconds``, and the counts ``by`` label, if any."""
+    with _lock:
+        return {
+            name: {
+                "count": _counts[name],
+                "seconds": _seconds[name],
+                "by": dict(_labels[name]),
+            }
+            for name in EVENTS
+        }
+
+
+def add_hook(hook: Hook, events: Optional[List[str]] = None) -> None:
+    """
+    Call **hook** with an :class:`Event` on each instrumented event while
+    enabled, in the thread where it happens.
+
+    :param hook:
+        The callable to call; it should be quick, and must not raise.
+
+    :param events:
+        The names of the events to pass to it, all of them by default.
+    """
+    for name in events or EVENTS:
+        if name not in _hooks:
+            raise ValueError(f"Unknown event {name!r}")
+    with _lock:
+        for name in events or EVENTS:
+            _hooks[name] = _hooks[name] + [hook]
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling **hook**."""
+    with _lock:
+        for name, hooks in _hooks.items():
+            _hooks[name] = [h for h in hooks if h is not hook]
+
+
+def emit(
+    name: str,
+    label: Optional[str] = None,
+    detail: Any = None,
+    count: int = 1,
+    seconds: float = 0.0,
+) -> None:
+    """Count an event and pass it to the hooks; called by :func:`timed`
+    when :data:`enabled`."""
+    with _lock:
+        _counts[name] += count
+        _seconds[name] += seconds
+        if label is not None:
+            _labels[name][label] += count
+        hooks = _hooks[name]
+    if hooks:
+        event = Event(name, label, detail, count, seconds)
+        for hook in hooks:
+            hook(event)
+
+
+class _Timer:
+    """Times the block it manages and emits its event on exit."""
+
+    __slots__ = ("name", "label", "detail", "count", "start")
+
+    def __init__(
+        self, name: str, label: Optional[str], detail: Any, count: int
+    ) -> None:
+        self.name = name
+        self.label = label
+        self.detail = detail
+        self.count = count
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        emit(
+            self.name,
+            self.label,
+            self.detail,
+            self.count,
+            perf_counter() - self.start,
+        )
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NO_TIMER = _NoTimer()
+
+
+def timed(
+    name: str,
+    label: Optional[str] = None,
+    detail: Any = None,
+    count: int = 1,
+) -> Union[_Timer, _NoTimer]:
+    """Return a context manager emitting the event **name** with the time
+    spent in its block, if enabled; the instrumented code wraps its slow
+    paths in it. Disabled, it returns a shared context doing nothing."""
+    if not enabled:
+        return _NO_TIMER
+    return _Timer(name, label, detail, count)
@@ -0,0 +1,335 @@
+"""Korean lunisolar calendar conversions backed by a precomputed table.
+
+The table holds one packed integer per lunar year from
+:data:`LUNAR_MIN_YEAR` to :data:`LUNAR_MAX_YEAR`, following the data
+published by KASI (Korea Astronomy and Space Science Institute):
+
+* bits 0-11: the size of the regular months, month 1 in bit 11 down to
+  month 12 in bit 0 (set for a 30 day month, clear for a 29 day month);
+* bits 12-15: the leap (intercalary) month, 0 if the year has none;
+* bit 16: the size of the leap month.
+
+The first day of every lunar year is accumulated once at import time, so
+converting a lunar date to a solar date is a constant time offset lookup.
+Solar dates before 1582-10-15 are given in the Julian calendar, exactly as
+:class:`korean_lunar_calendar.KoreanLunarCalendar` returns them.
+"""
+
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Tuple
+
+LUNAR_MIN_YEAR = 1391
+"""The first lunar year covered by the table."""
+LUNAR_MAX_YEAR = 2050
+"""The last lunar year covered by the table."""
+
+# Lunar years 1391 to 2050, eight per line.
+# fmt: off
+_LUNAR_DATA = array("l", (
+    0x00653, 0x1c6a9, 0x005aa, 0x00ab5, 0x092bd, 0x002b6, 0x00c37, 0x0552e,
+    0x00c96, 0x00e4b, 0x03752, 0x00daa, 0x1b5b4, 0x0056d, 0x002ae, 0x07a3d,
+    0x00a2d, 0x00d15, 0x04d95, 0x00b52, 0x0cb69, 0x00ada, 0x0055d, 0x1925b,
+    0x0045b, 0x00a2b, 0x05aab, 0x00a95, 0x00b52, 0x01eaa, 0x00ab6, 0x0c55b,
+    0x004b7, 0x00457, 0x07537, 0x0052b, 0x00695, 0x14695, 0x005aa, 0x0c9b5,
+    0x00a6e, 0x004ae, 0x08a5e, 0x00a56, 0x00d2a, 0x06eaa, 0x00d55, 0x0056a,
+    0x1295a, 0x0095e, 0x0b4af, 0x0049b, 0x00a4d, 0x07d2e, 0x00b2a, 0x00b55,
+    0x045d5, 0x002da, 0x0095b, 0x11157, 0x0049b, 0x09a4f, 0x0064b, 0x006a9,
+    0x06aea, 0x006b5, 0x002b6, 0x02aae, 0x00937, 0x1b496, 0x00c96, 0x00e4b,
+    0x076b2, 0x00daa, 0x005ad, 0x0336d, 0x0026e, 0x0092e, 0x02d2d, 0x00c95,
+    0x09d4d, 0x00b4a, 0x00b69, 0x1655a, 0x0055b, 0x0025d, 0x02a5b, 0x0092b,
+    0x0aa97, 0x00695, 0x0074a, 0x08b5a, 0x00ab6, 0x0053b, 0x042b7, 0x00257,
+    0x0052b, 0x01d2b, 0x00695, 0x096ad, 0x005aa, 0x00ab5, 0x054ed, 0x004ae,
+    0x00a57, 0x1344e, 0x00d2a, 0x1bd94, 0x00b55, 0x0056a, 0x0797a, 0x0095d,
+    0x004ae, 0x04a9b, 0x00a4d, 0x00d25, 0x11aaa, 0x00b55, 0x0956d, 0x002da,
+    0x0095b, 0x054b7, 0x00497, 0x00a4b, 0x04b4b, 0x006a9, 0x0cad5, 0x005b5,
+    0x002b6, 0x0895e, 0x0092f, 0x00497, 0x04696, 0x00d4a, 0x0cea5, 0x00d69,
+    0x0056d, 0x1a2b5, 0x0026e, 0x0052e, 0x06cad, 0x00c95, 0x00d4a, 0x02f4a,
+    0x00b59, 0x0c56d, 0x0055b, 0x0025d, 0x0793b, 0x0092b, 0x00a95, 0x15b15,
+    0x006ca, 0x00ad5, 0x112b6, 0x004bb, 0x0925f, 0x00257, 0x0052b, 0x06aaa,
+    0x00e95, 0x006aa, 0x03baa, 0x00ab5, 0x0b4b7, 0x004ae, 0x00a57, 0x0752d,
+    0x00d26, 0x00d95, 0x055d5, 0x0056a, 0x0096d, 0x0255d, 0x004ae, 0x0aa4f,
+    0x00a4d, 0x00d25, 0x06d69, 0x00b55, 0x0035a, 0x02aba, 0x0095b, 0x1c49b,
+    0x00497, 0x00a4b, 0x08b2b, 0x006a5, 0x006d4, 0x14ab5, 0x002b6, 0x00937,
+    0x0252f, 0x00497, 0x0964e, 0x00d4a, 0x00ea5, 0x166a9, 0x0056d, 0x002b6,
+    0x1385e, 0x0092e, 0x0bc97, 0x00a95, 0x00d4a, 0x08daa, 0x00b4d, 0x0056b,
+    0x042db, 0x0025d, 0x0092d, 0x02d33, 0x00a95, 0x09b4d, 0x006aa, 0x00ad5,
+    0x06575, 0x004bb, 0x0025b, 0x13457, 0x0052b, 0x1ba94, 0x00e95, 0x006aa,
+    0x08ada, 0x009b5, 0x004b6, 0x04aae, 0x00a4f, 0x00526, 0x12d26, 0x00d55,
+    0x1a5a9, 0x0056a, 0x0096d, 0x1649d, 0x0049e, 0x00a4d, 0x04d4d, 0x00d25,
+    0x0bd53, 0x00b54, 0x00b5a, 0x1895a, 0x0095b, 0x0049b, 0x04a97, 0x00a4b,
+    0x00aa5, 0x01ea5, 0x006d4, 0x0badb, 0x002b6, 0x00937, 0x064af, 0x00497,
+    0x0064b, 0x0374a, 0x00da5, 0x0b6b5, 0x0056d, 0x002ba, 0x0793e, 0x0092e,
+    0x00c96, 0x15d15, 0x00d4a, 0x00da5, 0x13555, 0x0056a, 0x07a7a, 0x00a5d,
+    0x0092d, 0x06aab, 0x00a95, 0x00b4a, 0x04baa, 0x00ad5, 0x0055a, 0x128ba,
+    0x00a5b, 0x07537, 0x0052b, 0x00693, 0x15715, 0x006aa, 0x00ad9, 0x035b5,
+    0x004b6, 0x08a5e, 0x00a4e, 0x00d26, 0x06ea6, 0x00d52, 0x00daa, 0x1466a,
+    0x0056d, 0x004ae, 0x03a9d, 0x00a4d, 0x07d2b, 0x00b25, 0x00d52, 0x15d54,
+    0x00b5a, 0x0055d, 0x0355b, 0x0049d, 0x07657, 0x00a4b, 0x00aa5, 0x06b65,
+    0x006d2, 0x00ada, 0x045b6, 0x00937, 0x00497, 0x03697, 0x00a4d, 0x076aa,
+    0x00da5, 0x005aa, 0x05aec, 0x00aae, 0x0092e, 0x03d2e, 0x00c96, 0x18d45,
+    0x00d4a, 0x00d55, 0x16595, 0x0056a, 0x00a6d, 0x0455d, 0x0052d, 0x00a95,
+    0x03e95, 0x00b4a, 0x17b4a, 0x009d5, 0x0055a, 0x15a3a, 0x00a5b, 0x0052b,
+    0x14a17, 0x00693, 0x096ab, 0x006aa, 0x00ab5, 0x064f5, 0x004b6, 0x00a57,
+    0x0452e, 0x00d16, 0x00e93, 0x03752, 0x00daa, 0x175aa, 0x0056d, 0x004ae,
+    0x15a1b, 0x00a2d, 0x00d15, 0x04da5, 0x00b52, 0x09d6a, 0x00ada, 0x0055d,
+    0x1629b, 0x0045b, 0x00a2b, 0x05b2b, 0x00a95, 0x00b52, 0x12ab2, 0x00ad6,
+    0x17556, 0x00537, 0x00457, 0x05657, 0x0052b, 0x00695, 0x03795, 0x005aa,
+    0x0aab6, 0x00a6d, 0x004ae, 0x0696e, 0x00a56, 0x00d2a, 0x05eaa, 0x00d55,
+    0x005aa, 0x03b6a, 0x00a6d, 0x074bd, 0x004ab, 0x00a8d, 0x05d55, 0x00b2a,
+    0x00b55, 0x045d5, 0x004da, 0x0095d, 0x02557, 0x0049b, 0x06a97, 0x0064b,
+    0x006a9, 0x04baa, 0x006b5, 0x002ba, 0x02ab6, 0x00937, 0x0652e, 0x00d16,
+    0x00e4b, 0x056d2, 0x00da9, 0x005b5, 0x0336d, 0x002ae, 0x00a2e, 0x02e2d,
+    0x00c95, 0x06d55, 0x00b52, 0x00b69, 0x045da, 0x0055d, 0x0025d, 0x03a5b,
+    0x00a2b, 0x17a8b, 0x00a95, 0x00b4a, 0x15b2a, 0x00ad5, 0x0055b, 0x042b7,
+    0x00257, 0x0952f, 0x0052b, 0x00695, 0x066d5, 0x005aa, 0x00ab5, 0x0456d,
+    0x004ae, 0x00a57, 0x13456, 0x00d2a, 0x17e8a, 0x00d55, 0x005aa, 0x05ada,
+    0x0095d, 0x004ae, 0x04aab, 0x00a4d, 0x08d2b, 0x00b29, 0x00b55, 0x07575,
+    0x002da, 0x0095d, 0x054d7, 0x0049b, 0x00a4b, 0x13a4b, 0x006a9, 0x08ad9,
+    0x006b5, 0x002b6, 0x15936, 0x00937, 0x00497, 0x04696, 0x00e4a, 0x0aea6,
+    0x00da9, 0x005ad, 0x162ad, 0x002ae, 0x0092e, 0x05cad, 0x00c95, 0x00d4a,
+    0x13d4a, 0x00b69, 0x0757a, 0x0055b, 0x0025d, 0x0595b, 0x0092b, 0x00a95,
+    0x04d95, 0x00b4a, 0x00b55, 0x026d5, 0x0055b, 0x06277, 0x00257, 0x0052b,
+    0x05aaa, 0x00e95, 0x006aa, 0x03baa, 0x00ab5, 0x084bd, 0x004ae, 0x00a57,
+    0x0554d, 0x00d26, 0x00d95, 0x14655, 0x0056a, 0x009ad, 0x0255d, 0x004ae,
+    0x06a5b, 0x00a4d, 0x00d25, 0x05da9, 0x00b55, 0x0056a, 0x02ada, 0x0095d,
+    0x074bb, 0x0049b, 0x00a4b, 0x05b4b, 0x006a9, 0x00ad4, 0x04bb5, 0x002b6,
+    0x0095b, 0x02537, 0x00497, 0x06656, 0x00e4a, 0x00ea5, 0x156a9, 0x005b5,
+    0x002b6, 0x138ae, 0x0092e, 0x17c8d, 0x00c95, 0x00d4a, 0x16d8a, 0x00b69,
+    0x0056d, 0x1425b, 0x0025d, 0x0092d, 0x02d2b, 0x00a95, 0x07d55, 0x00b4a,
+    0x00b55, 0x15555, 0x004db, 0x0025b, 0x13857, 0x0052b, 0x08a9b, 0x00695,
+    0x006aa, 0x06aea, 0x00ab5, 0x004b6, 0x04aae, 0x00a57, 0x00527, 0x03726,
+    0x00d95, 0x076b5, 0x0056a, 0x009ad, 0x054dd, 0x004ae, 0x00a4e, 0x04d4d,
+    0x00d25, 0x08d59, 0x00b54, 0x00d6a, 0x1695a, 0x0095b, 0x0049b, 0x04a9b,
+    0x00a4b, 0x0ab27, 0x006a5, 0x006d4, 0x06b75, 0x002b6, 0x0095b, 0x054b7,
+    0x00497, 0x0064b, 0x0374a, 0x00ea5, 0x086d9, 0x005ad, 0x002b6, 0x0596e,
+    0x0092e, 0x00c96, 0x04e95, 0x00d4a, 0x00da5, 0x02755, 0x0056c, 0x07abb,
+    0x0025d, 0x0092d, 0x05cab, 0x00a95, 0x00b4a, 0x13b4a, 0x00b55, 0x0955d,
+    0x004ba, 0x00a5b, 0x05557, 0x0052b, 0x00a95, 0x04b95, 0x006aa, 0x00ad5,
+    0x026b5, 0x004b6, 0x06a6e, 0x00a57, 0x00527, 0x056a6, 0x00d93, 0x005aa,
+    0x03b6a, 0x0096d, 0x0b4af, 0x004ae, 0x00a4d, 0x16d0d, 0x00d25, 0x00d52,
+    0x05dd4, 0x00b6a, 0x0096d, 0x0255b, 0x0049b, 0x07a57, 0x00a4b, 0x00b25,
+    0x15b25, 0x006d4, 0x00ada, 0x138b6,
+))
+# fmt: on
+
+# Day number (proleptic Gregorian ordinal) of lunar 1391-01-01, which is
+# 1391-02-05 in the Julian calendar.
+_LUNAR_EPOCH = 507731
+_GREGORIAN_START = 577736  # date(1582, 10, 15).toordinal()
+
+
+def _year_days(data: int) -> int:
+    days = 348 + bin(data & 0xFFF).count("1")
+    if data & 0xF000:
+        days += 29 + (data >> 16 & 1)
+    return days
+
+
+def _new_year_days() -> array:
+    days = array("l")
+    day = _LUNAR_EPOCH
+    for data in _LUNAR_DATA:
+        days.append(day)
+        day += _year_days(data)
+    return days
+
+
+_NEW_YEAR_DAYS = _new_year_days()
+
+
+def _julian_ymd(ordinal: int) -> Tuple[int, int, int]:
+    # Julian day number to Julian calendar date (Richards' algorithm).
+    c = ordinal + 1721425 + 32082
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    year = d - 4800 + m // 10
+    return year, m + 3 - 12 * (m // 10), e - (153 * m + 2) // 5 + 1
+
+
+def leap_month(year: int) -> int:
+    """Return the leap month of a lunar year, or 0 if it has none.
+
+    :param year:
+        The lunar year, between :data:`LUNAR_MIN_YEAR` and
+        :data:`LUNAR_MAX_YEAR`.
+    """
+    return _LUNAR_DATA[year - LUNAR_MIN_YEAR] >> 12 & 0xF
+
+
+def lunar_to_ordinal(
+    year: int, month: int, day: int, leap: bool = False
+) -> int:
+    """Return the day number of a lunar date, on the same scale as
+    :meth:`datetime.date.toordinal`.
+
+    :param year:
+        The lunar year, between :data:`LUNAR_MIN_YEAR` and
+        :data:`LUNAR_MAX_YEAR`.
+
+    :param month:
+        The lunar month (1-12).
+
+    :param day:
+        The day of the lunar month (1-30).
+
+    :param leap:
+        Whether the date is in the leap month following **month**.
+
+    :raise:
+        ValueError if the date is outside the table or does not exist.
+    """
+    if not LUNAR_MIN_YEAR <= year <= LUNAR_MAX_YEAR:
+        raise ValueError(
+            f"Lunar year {year} out of range "
+            f"{LUNAR_MIN_YEAR}-{LUNAR_MAX_YEAR}"
+        )
+    if not 1 <= month <= 12:
+        raise ValueError(f"Lunar month {month} out of range 1-12")
+    data = _LUNAR_DATA[year - LUNAR_MIN_YEAR]
+    intercalation = data >> 12 & 0xF
+    if leap and intercalation != month:
+        raise ValueError(f"Lunar year {year} has no leap month {month}")
+
+    # Regular months 1 to month - 1 sit in bits 11 to 13 - month.
+    days = 29 * (month - 1) + bin((data & 0xFFF) >> (13 - month)).count("1")
+    if intercalation and intercalation < month:
+        days += 29 + (data >> 16 & 1)
+    month_days = 29 + (data >> (12 - month) & 1)
+    if leap:
+        days += month_days
+        month_days = 29 + (data >> 16 & 1)
+    if not 1 <= day <= month_days:
+        raise ValueError(f"Lunar month {year}-{month} has no day {day}")
+    return _NEW_YEAR_DAYS[year - LUNAR_MIN_YEAR] + days + day - 1
+
+
+def ordinal_to_solar(ordinal: int) -> date:
+    """Return the solar date of a day number as returned by
+    :func:`lunar_to_ordinal`, in the Julian calendar before 1582-10-15."""
+    if ordinal < _GREGORIAN_START:
+        return date(*_julian_ymd(ordinal))
+    return date.fromordinal(ordinal)
+
+
+def lunar_to_solar(
+    year: int, month: int, day: int, leap: bool = False
+) -> date:
+    """Convert a Korean lunar date to its solar date.
+
+    :param year:
+        The lunar year, between :data:`LUNAR_MIN_YEAR` and
+        :data:`LUNAR_MAX_YEAR`.
+
+    :param month:
+        The lunar month (1-12).
+
+    :param day:
+        The day of the lunar month (1-30).
+
+    :param leap:
+        Whether the date is in the leap month following **month**.
+
+    :return:
+        The solar date (Julian calendar before 1582-10-15).
+
+    :raise:
+        ValueError if the date is outside the table or does not exist.
+    """
+    return ordinal_to_solar(lunar_to_ordinal(year, month, day, leap))
+
+
+def lunar_to_solar_many(
+    years: Iterable[int], month_days: Iterable[Tuple[int, int]]
+) -> Dict[Tuple[int, int, int], date]:
+    """Convert the same regular-month lunar dates for many years at once,
+    working out the start of each month once per year.
+
+    :param years:
+        The lunar years, between :data:`LUNAR_MIN_YEAR` and
+        :data:`LUNAR_MAX_YEAR`.
+
+    :param month_days:
+        The (month, day) lunar dates.
+
+    :return:
+        The solar dates, by (year, month, day).
+
+    :raise:
+        ValueError if a date is outside the table or does not exist.
+    """
+    month_days = tuple(month_days)
+    for month, _ in month_days:
+        if not 1 <= month <= 12:
+            raise ValueError(f"Lunar month {month} out of range 1-12")
+    solar_dates = {}
+    for year in years:
+        if not LUNAR_MIN_YEAR <= year <= LUNAR_MAX_YEAR:
+            raise ValueError(
+                f"Lunar year {year} out of range "
+                f"{LUNAR_MIN_YEAR}-{LUNAR_MAX_YEAR}"
+            )
+        data = _LUNAR_DATA[year - LUNAR_MIN_YEAR]
+        intercalation = data >> 12 & 0xF
+        # The first day of each regular month and its number of days.
+        starts = [0] * 13
+        sizes = [0] * 13
+        day = _NEW_YEAR_DAYS[year - LUNAR_MIN_YEAR]
+        for month in range(1, 13):
+            starts[month] = day
+            sizes[month] = 29 + (data >> (12 - month) & 1)
+            day += sizes[month]
+            if month == intercalation:
+                day += 29 + (data >> 16 & 1)
+        for month, day in month_days:
+            if not 1 <= day <= sizes[month]:
+                raise ValueError(
+                    f"Lunar month {year}-{month} has no day {day}"
+                )
+            solar_dates[year, month, day] = ordinal_to_solar(
+                starts[month] + day - 1
+            )
+    return solar_dates
+
+
+def verify_table(
+    start: int = LUNAR_MIN_YEAR, end: int = LUNAR_MAX_YEAR
+) -> None:
+    """Check the table against :mod:`korean_lunar_calendar` for the first,
+    middle and last day of every month (leap months included) of the lunar
+    years **start** to **end**.
+
+    :raise:
+        ValueError naming the first lunar date that does not match.
+    """
+    from korean_lunar_calendar import KoreanLunarCalendar
+
+    converter = KoreanLunarCalendar()
+    for year in range(start, end + 1):
+        for month in range(1, 13):
+            for leap in (False, True):
+                if leap and leap_month(year) != month:
+                    continue
+                for day in (1, 15, 29):
+                    if not converter.setLunarDate(year, month, day, leap):
+                        continue
+                    expected = (
+                        converter.solarYear,
+                        converter.solarMonth,
+                        converter.solarDay,
+                    )
+                    ordinal = lunar_to_ordinal(year, month, day, leap)
+                    if ordinal < _GREGORIAN_START:
+                        # Julian leap days may not exist as a date object.
+                        actual = _julian_ymd(ordinal)
+                    else:
+                        solar = date.fromordinal(ordinal)
+                        actual = (solar.year, solar.month, solar.day)
+                    if actual != expected:
+                        raise ValueError(
+                            f"Lunar {year}-{month}-{day}"
+                            f"{' (leap)' if leap else ''}: table gives "
+                            f"{actual}, korean_lunar_calendar gives "
+                            f"{expected}"
+                        )
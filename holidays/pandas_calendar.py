@@ -0,0 +1,53 @@
+from typing import Any, List, Optional
+
+import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar
+
+
+class HolidayBaseCalendar(AbstractHolidayCalendar):
+    """
+    A pandas holiday calendar holding holidays exported from a
+    :class:`holidays.holiday_base.HolidayBase` over a span of years, as
+    returned by :meth:`HolidayBase.to_pandas_calendar`.
+
+    pandas calendars usually generate their holidays from rules; this one
+    holds the dates themselves, so :meth:`holidays` is a slice of an index
+    rather than an evaluation of every rule.
+    """
+
+    def __init__(
+        self, days: Any, names: List[str], start: int, end: int
+    ) -> None:
+        """
+        :param days:
+            The holiday dates, sorted, as a NumPy ``datetime64`` array.
+
+        :param names:
+            The holiday names, in the same order.
+
+        :param start:
+            The first year covered.
+
+        :param end:
+            The last year covered.
+        """
+        super().__init__(name=f"holidays {start}-{end}", rules=[])
+        self.start_date = pd.Timestamp(start, 1, 1)
+        self.end_date = pd.Timestamp(end, 12, 31)
+        self._names = pd.Series(names, index=pd.DatetimeIndex(days))
+
+    def holidays(
+        self,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        return_name: bool = False,
+    ) -> Any:
+        """Return the holidays from **start** to **end** (both included,
+        the whole span by default) as a :class:`pandas.DatetimeIndex`, or a
+        :class:`pandas.Series` of their names if **return_name**."""
+        start = self.start_date if start is None else pd.Timestamp(start)
+        end = self.end_date if end is None else pd.Timestamp(end)
+        names = self._names[start:end]
+        if return_name:
+            return names
+        return names.index
@@ -0,0 +1,273 @@
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+MIN_YEAR = date.min.year
+MAX_YEAR = date.max.year
+
+Names = Tuple[str, str]
+"""A holiday name in the local language and in English, in the order of the
+**en_name** values False and True."""
+
+SolarDateFunc = Callable[[int, int, int], date]
+"""A function returning the solar date of a (year, month, day) lunar date."""
+
+
+class Solar(NamedTuple):
+    """A day of the (solar) Gregorian calendar."""
+
+    month: int
+    day: int
+
+    def resolve(self, year: int, solar_date: SolarDateFunc) -> date:
+        return date(year, self.month, self.day)
+
+
+class Lunar(NamedTuple):
+    """A day of the lunar calendar, converted with the calendar's
+    **solar_date** function."""
+
+    month: int
+    day: int
+
+    def resolve(self, year: int, solar_date: SolarDateFunc) -> date:
+        return solar_date(year, self.month, self.day)
+
+
+class Span(NamedTuple):
+    """A day of a holiday, **offset** days from its anchor date, named after
+    the holiday followed by **suffix**, from **start** to **end** (both
+    included)."""
+
+    offset: int
+    suffix: Names = ("", "")
+    start: int = MIN_YEAR
+    end: int = MAX_YEAR
+
+
+class Substitute(NamedTuple):
+    """A substitute holiday policy: from **start**, when the anchor date of
+    the holiday falls on one of the weekdays of **offsets**, the day that
+    many days after the anchor date is a holiday too, named after the
+    holiday followed by **suffix**."""
+
+    offsets: Tuple[Tuple[int, int], ...]
+    suffix: Names
+    start: int = MIN_YEAR
+
+
+class Holiday(NamedTuple):
+    """A recurring holiday on **anchor**, from **start** to **end** (both
+    included). **span** lists the days of the holiday around the anchor
+    date, in the order they are set; **substitute** is its substitute
+    holiday policy, if any."""
+
+    names: Names
+    anchor: Union[Solar, Lunar]
+    start: int = MIN_YEAR
+    end: int = MAX_YEAR
+    span: Tuple[Span, ...] = (Span(0),)
+    substitute: Optional[Substitute] = None
+
+
+class Dated(NamedTuple):
+    """A holiday on a single date, such as an election day."""
+
+    day: date
+    names: Names
+
+    @property
+    def start(self) -> int:
+        return self.day.year
+
+    @property
+    def end(self) -> int:
+        return self.day.year
+
+
+Rule = Union[Holiday, Dated]
+
+# A compiled rule for a range of years: the anchor, the (offset, names) of
+# the days of the span, and the substitute offsets by weekday with their
+# names; or a Dated rule.
+_Step = Union[
+    Tuple[
+        Union[Solar, Lunar],
+        Tuple[Tuple[int, Names], ...],
+        Optional[Tuple[Dict[int, int], Names]],
+    ],
+    Dated,
+]
+
+
+def _join(names: Names, suffix: Names) -> Names:
+    return (names[0] + suffix[0], names[1] + suffix[1])
+
+
+class RulePlan:
+    """
+    The rules of a calendar compiled into the steps each year evaluates.
+
+    The years are cut into segments wherever a rule, a day of a span or a
+    substitute policy starts or ends, and each segment keeps only the steps
+    that apply to it, so evaluating a year costs a binary search and the
+    rules of that year, in the order they were given.
+
+    Example usage:
+
+    >>> from holidays.constants import JAN
+    >>> plan = compile_rules([
+    ...     Holiday(
+    ...         ("신정", "New Year's Day"),
+    ...         Solar(JAN, 1),
+    ...         span=(Span(0), Span(1, (" 연휴", " holidays"), end=1998)),
+    ...     ),
+    ... ])
+    >>> for day, name in plan.evaluate_year(1998, en_name=True):
+    ...     print(day, name)
+    1998-01-01 New Year's Day
+    1998-01-02 New Year's Day holidays
+    >>> plan.evaluate_year(1999)
+    [(datetime.date(1999, 1, 1), '신정')]
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        """
+        :param rules:
+            The rules, in the order their holidays are set in a year.
+        """
+        self.rules: Tuple[Rule, ...] = tuple(rules)
+        bounds = {MIN_YEAR}
+        for rule in self.rules:
+            bounds.update((rule.start, rule.end + 1))
+            if isinstance(rule, Holiday):
+                for span in rule.span:
+                    bounds.update((span.start, span.end + 1))
+                if rule.substitute is not None:
+                    bounds.add(rule.substitute.start)
+        self._bounds = sorted(year for year in bounds if year <= MAX_YEAR)
+        self._segments = [self._compile(year) for year in self._bounds]
+        self.lunar_anchors: Tuple[Tuple[int, int], ...] = tuple(
+            dict.fromkeys(
+                (rule.anchor.month, rule.anchor.day)
+                for rule in self.rules
+                if isinstance(rule, Holiday) and isinstance(rule.anchor, Lunar)
+            )
+        )
+        """The distinct (month, day) of the :class:`Lunar` anchors, for
+        converting them in bulk before :meth:`evaluate`."""
+        self.substitute_suffixes: Tuple[Names, ...] = tuple(
+            dict.fromkeys(
+                rule.substitute.suffix
+                for rule in self.rules
+                if isinstance(rule, Holiday) and rule.substitute is not None
+            )
+        )
+        """The distinct suffixes of the substitute holiday names."""
+
+    def _compile(self, year: int) -> Tuple[_Step, ...]:
+        """Return the steps of the segment starting on **year**."""
+        steps: List[_Step] = []
+        for rule in self.rules:
+            if not rule.start <= year <= rule.end:
+                continue
+            if isinstance(rule, Dated):
+                steps.append(rule)
+                continue
+            days = tuple(
+                (span.offset, _join(rule.names, span.suffix))
+                for span in rule.span
+                if span.start <= year <= span.end
+            )
+            substitute = rule.substitute
+            if substitute is not None and year >= substitute.start:
+                steps.append(
+                    (
+                        rule.anchor,
+                        days,
+                        (
+                            dict(substitute.offsets),
+                            _join(rule.names, substitute.suffix),
+                        ),
+                    )
+                )
+            else:
+                steps.append((rule.anchor, days, None))
+        return tuple(steps)
+
+    def steps(self, year: int) -> Tuple[_Step, ...]:
+        """Return the compiled steps that apply to **year**."""
+        return self._segments[bisect_right(self._bounds, year) - 1]
+
+    def evaluate_year(
+        self,
+        year: int,
+        en_name: bool = False,
+        solar_date: Optional[SolarDateFunc] = None,
+    ) -> List[Tuple[date, str]]:
+        """Return the (date, name) holidays of **year**, in the order the
+        rules set them; dates may repeat when holidays overlap.
+
+        :param year:
+            The year.
+
+        :param en_name:
+            Whether to use English holiday names.
+
+        :param solar_date:
+            The function converting lunar dates, required when the rules
+            have :class:`Lunar` anchors.
+        """
+        language = 1 if en_name else 0
+        entries = []
+        for step in self.steps(year):
+            if isinstance(step, Dated):
+                entries.append((step.day, step.names[language]))
+                continue
+            anchor, days, substitute = step
+            anchor_date = anchor.resolve(year, solar_date)  # type: ignore
+            for offset, names in days:
+                entries.append(
+                    (anchor_date + timedelta(days=offset), names[language])
+                )
+            if substitute is not None:
+                offset = substitute[0].get(anchor_date.weekday())
+                if offset is not None:
+                    entries.append(
+                        (
+                            anchor_date + timedelta(days=offset),
+                            substitute[1][language],
+                        )
+                    )
+        return entries
+
+    def evaluate(
+        self,
+        years: Iterable[int],
+        en_name: bool = False,
+        solar_date: Optional[SolarDateFunc] = None,
+    ) -> Dict[int, List[Tuple[date, str]]]:
+        """Evaluate many years at once, as :meth:`evaluate_year`.
+
+        :return:
+            The holidays of each year, by year.
+        """
+        return {
+            year: self.evaluate_year(year, en_name, solar_date)
+            for year in years
+        }
+
+
+def compile_rules(rules: Sequence[Rule]) -> RulePlan:
+    """Compile declarative holiday rules into a :class:`RulePlan`."""
+    return RulePlan(rules)
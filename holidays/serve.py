@@ -0,0 +1,340 @@
+"""A small HTTP server answering holiday and business-day queries in JSON.
+
+Usage: python -m holidays.serve [--host HOST] [--port PORT] [--start YEAR]
+[--end YEAR] [--country CODE]
+
+The holidays of the years **start** to **end** are calculated when the
+server starts and kept in an immutable index; dates outside those years are
+rejected. Connections are kept alive (HTTP/1.1). Endpoints, all with GET
+query parameters, ``lang=en`` giving English holiday names:
+
+``/holiday?date=2024-09-17``
+    ``{"date": "2024-09-17", "holiday": true, "name": "추석",
+    "business_day": false}``
+
+``/holidays?start=2024-09-01&end=2024-09-30``
+    The holidays from **start** to **end**, both included:
+    ``{"holidays": [{"date": "2024-09-16", "name": "추석 연휴"}, ...]}``
+
+``/business_day?date=2024-09-13&n=1``
+    The **n**-th business day after **date** (1 by default; before it if
+    negative): ``{"date": "2024-09-13", "n": 1, "result": "2024-09-19"}``
+
+``/business_days?start=2024-09-01&end=2024-10-01``
+    The number of business days from **start** (included) to **end**
+    (excluded): ``{"start": ..., "end": ..., "count": 18}``
+
+A POST to an endpoint with a JSON array of parameter objects as body
+answers each of them, in order, with a JSON array of results; a query that
+fails gives ``{"error": "..."}`` in its place. A failing GET gives a 400
+response with that object, or a 500 response if the error is unexpected.
+"""
+
+import asyncio
+import json
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from holidays.business import BusinessDays
+from holidays.utils import cached_country_holidays
+
+MAX_BODY = 1 << 20
+"""The largest request body accepted, in bytes."""
+IDLE_TIMEOUT = 30.0
+"""Seconds a kept-alive connection may stay idle before being closed."""
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HolidayIndex:
+    """
+    The holidays and business days of a span of years, calculated up front,
+    answering the queries of the server.
+
+    Example usage:
+
+    >>> index = HolidayIndex(start=2024, end=2024)
+    >>> index.holiday({'date': '2024-09-17', 'lang': 'en'})['name']
+    'Chuseok'
+    >>> index.business_day({'date': '2024-09-13'})['result']
+    '2024-09-19'
+    """
+
+    def __init__(
+        self, country: str = "KR", start: int = 1950, end: int = 2050
+    ) -> None:
+        """
+        :param country:
+            The country, as accepted by :func:`country_holidays`.
+
+        :param start:
+            The first year answered.
+
+        :param end:
+            The last year answered.
+        """
+        self.start = start
+        self.end = end
+        years = range(start, end + 1)
+        calendars = {
+            en_name: cached_country_holidays(country, years, en_name=en_name)
+            for en_name in (False, True)
+        }
+        self._frozen = {
+            en_name: calendar.freeze()
+            for en_name, calendar in calendars.items()
+        }
+        self._business = BusinessDays(calendars[False])
+        # The counts of the business days of the years answered, used to
+        # reject queries reaching past them: the calendars must not grow.
+        self._origin, self._counts = self._business._build(start, end)
+        self._first = date(start, 1, 1)
+        self._last = date(end, 12, 31)
+        self.routes: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]
+        self.routes = {
+            "/holiday": self.holiday,
+            "/holidays": self.holidays,
+            "/business_day": self.business_day,
+            "/business_days": self.business_days,
+        }
+
+    def _date(
+        self, params: Dict[str, Any], key: str, past_end: bool = False
+    ) -> date:
+        value = params.get(key)
+        if not isinstance(value, str):
+            raise ValueError(f"Missing {key}")
+        try:
+            day = date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Invalid {key}: {value!r}") from None
+        last = date(self.end + 1, 1, 1) if past_end else self._last
+        if not self._first <= day <= last:
+            raise ValueError(
+                f"{key} out of range ({self.start}-{self.end}): {value}"
+            )
+        return day
+
+    def _frozen_for(self, params: Dict[str, Any]) -> Any:
+        return self._frozen[params.get("lang") == "en"]
+
+    def holiday(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer ``/holiday``: whether a date is a holiday."""
+        day = self._date(params, "date")
+        name = self._frozen_for(params).get(day)
+        return {
+            "date": day.isoformat(),
+            "holiday": name is not None,
+            "name": name,
+            "business_day": self._business.is_business_day(day),
+        }
+
+    def holidays(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer ``/holidays``: the holidays of a range of dates."""
+        start = self._date(params, "start")
+        end = self._date(params, "end")
+        frozen = self._frozen_for(params)
+        return {
+            "holidays": [
+                {"date": day.isoformat(), "name": frozen[day]}
+                for day in frozen.get_range(start, end, inclusive=True)
+            ]
+        }
+
+    def business_day(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer ``/business_day``: the n-th business day after a date."""
+        day = self._date(params, "date")
+        try:
+            n = int(params.get("n", 1))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid n: {params.get('n')!r}") from None
+        if abs(n) > (self.end - self.start + 1) * 366:
+            raise ValueError(f"n out of range: {n}")
+        counts = self._counts
+        index = day.toordinal() - self._origin
+        last = self._last.toordinal() - self._origin + 1
+        if n > 0:
+            # The business days after day, up to the last day answered.
+            available = counts[last] - counts[index + 1]
+        elif n < 0:
+            # The business days before day, from the first day answered.
+            available = counts[index]
+        else:
+            # Day itself or a later day must be a business day.
+            available = counts[last] - counts[index] - 1
+        if abs(n) > available:
+            raise ValueError(
+                f"Result out of range ({self.start}-{self.end})"
+            )
+        result = self._business.add_business_days(day, n)
+        return {"date": day.isoformat(), "n": n, "result": result.isoformat()}
+
+    def business_days(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer ``/business_days``: the business days between dates."""
+        start = self._date(params, "start", past_end=True)
+        end = self._date(params, "end", past_end=True)
+        origin, counts = self._origin, self._counts
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "count": (
+                counts[end.toordinal() - origin]
+                - counts[start.toordinal() - origin]
+            ),
+        }
+
+    def answer(
+        self, method: str, target: str, body: bytes
+    ) -> Tuple[int, Any]:
+        """Return the status and JSON result of a request."""
+        url = urlsplit(target)
+        handler = self.routes.get(url.path)
+        if handler is None:
+            return 404, {"error": f"Unknown path {url.path}"}
+        if method == "GET":
+            try:
+                return 200, handler(dict(parse_qsl(url.query)))
+            except ValueError as e:
+                return 400, {"error": str(e)}
+            except Exception:
+                return 500, {"error": "Internal error"}
+        if method != "POST":
+            return 405, {"error": f"Method {method} not allowed"}
+        try:
+            queries = json.loads(body)
+        except ValueError:
+            return 400, {"error": "Body is not valid JSON"}
+        if not isinstance(queries, list):
+            return 400, {"error": "Body must be a JSON array"}
+        results: List[Any] = []
+        for params in queries:
+            try:
+                if not isinstance(params, dict):
+                    raise ValueError("Query must be a JSON object")
+                results.append(handler(params))
+            except ValueError as e:
+                results.append({"error": str(e)})
+            except Exception:
+                results.append({"error": "Internal error"})
+        return 200, results
+
+
+def _response(status: int, result: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(result, ensure_ascii=False).encode()
+    return (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode() + body
+
+
+async def _handle(
+    index: HolidayIndex,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    try:
+        while True:
+            try:
+                head = await asyncio.wait_for(
+                    reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT
+                )
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                return
+            except asyncio.LimitOverrunError:
+                writer.write(
+                    _response(413, {"error": "Header too large"}, False)
+                )
+                return
+            lines = head.decode("latin-1").split("\r\n")
+            try:
+                method, target, version = lines[0].split(" ")
+            except ValueError:
+                writer.write(_response(400, {"error": "Bad request"}, False))
+                return
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            connection = headers.get("connection", "").lower()
+            keep_alive = (
+                connection != "close"
+                if version == "HTTP/1.1"
+                else connection == "keep-alive"
+            )
+            try:
+                length = int(headers.get("content-length", 0))
+            except ValueError:
+                length = -1
+            if not 0 <= length <= MAX_BODY:
+                writer.write(
+                    _response(413, {"error": "Body too large"}, False)
+                )
+                return
+            body = await reader.readexactly(length) if length else b""
+            status, result = index.answer(method, target, body)
+            writer.write(_response(status, result, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(
+    index: HolidayIndex, host: str = "127.0.0.1", port: int = 8000
+) -> None:
+    """Serve the queries of **index** on **host**:**port** until
+    cancelled."""
+    server = await asyncio.start_server(
+        lambda r, w: _handle(index, r, w), host, port
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m holidays.serve",
+        description="Serve holiday and business-day queries over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="bind address")
+    parser.add_argument("--port", type=int, default=8000, help="port")
+    parser.add_argument(
+        "--country", default="KR", help="country code (default: KR)"
+    )
+    parser.add_argument(
+        "--start", type=int, default=1950, help="first year (default: 1950)"
+    )
+    parser.add_argument(
+        "--end", type=int, default=2050, help="last year (default: 2050)"
+    )
+    args = parser.parse_args(argv)
+    index = HolidayIndex(args.country, args.start, args.end)
+    print(
+        f"Serving {args.country} holidays {args.start}-{args.end} "
+        f"on http://{args.host}:{args.port}",
+        flush=True,
+    )
+    try:
+        asyncio.run(serve(index, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import json
+import struct
+import sys
+from array import array
+from datetime import date
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from holidays.frozen import FrozenHolidays
+from holidays.holiday_base import _code_array
+
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
+
+# A block starts with the magic, the format version and the length of the
+# JSON metadata that follows; the ordinals (int32) and the name codes come
+# next, aligned on 8 bytes, in the byte order of the machine.
+_MAGIC = b"HLSH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+
+# The calendars attached in this process, by block name: unpickling a
+# calendar that is already attached reuses its mapping.
+_ATTACHED: Dict[str, "SharedHolidays"] = {}
+_ATTACHED_LOCK = Lock()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class SharedHolidays(FrozenHolidays):
+    """
+    A :class:`FrozenHolidays` whose holidays live in a block of shared
+    memory (see :mod:`multiprocessing.shared_memory`), as returned by
+    :meth:`HolidayBase.share`.
+
+    Other processes attach to the block by its :attr:`name` with
+    :func:`attach`, reading the dates and names in place instead of
+    copying them. A shared calendar pickles as its name alone, so passing
+    it to the tasks of a process pool costs a few bytes per task, and each
+    worker maps the block once.
+
+    The process that created the calendar owns the block and must
+    :meth:`unlink` it when done, which the context manager does; attached
+    processes may :meth:`close` their mapping. Before Python 3.13, the
+    processes attaching should be started by the owner through
+    :mod:`multiprocessing` (as pool workers are), so that they share its
+    resource tracker.
+
+    Example usage:
+
+    >>> import pickle
+    >>> from holidays import KR
+    >>> with KR(years=range(1950, 2051)).share() as kr_holidays:
+    ...     len(pickle.dumps(kr_holidays)) < 100
+    ...     pickle.loads(pickle.dumps(kr_holidays)).get('2024-09-17')
+    True
+    '추석'
+    """
+
+    __slots__ = ("name", "_shm")
+
+    name: str
+    _shm: Optional[shared_memory.SharedMemory]
+
+    def __init__(
+        self, holidays: "HolidayBase", name: Optional[str] = None
+    ) -> None:
+        """
+        :param holidays:
+            The holidays to copy into shared memory.
+
+        :param name:
+            The name of the block; a unique name is chosen if not given.
+        """
+        ordinals = array("i", holidays._ordinals)
+        names = list(dict.fromkeys(dict.values(holidays)))
+        name_codes = {name: code for code, name in enumerate(names)}
+        codes = _code_array(
+            [
+                name_codes[dict.__getitem__(holidays, day)]
+                for day in map(date.fromordinal, ordinals)
+            ]
+        )
+        metadata = json.dumps(
+            {
+                "country": getattr(holidays, "country", None),
+                "subdiv": holidays.subdiv,
+                "observed": holidays.observed,
+                "en_name": holidays.en_name,
+                "strict": holidays.strict,
+                "years": sorted(holidays.years),
+                "names": names,
+                "count": len(ordinals),
+                "codes": codes.typecode,
+            },
+            ensure_ascii=False,
+        ).encode()
+        start = _align(_HEADER.size + len(metadata))
+        middle = _align(start + len(ordinals) * ordinals.itemsize)
+        shm = shared_memory.SharedMemory(
+            name, create=True, size=middle + len(codes) * codes.itemsize
+        )
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, _VERSION, len(metadata))
+        buf[_HEADER.size : _HEADER.size + len(metadata)] = metadata
+        buf[start : start + len(ordinals) * ordinals.itemsize] = (
+            ordinals.tobytes()
+        )
+        buf[middle : middle + len(codes) * codes.itemsize] = codes.tobytes()
+        del buf
+        self._map(shm)
+        with _ATTACHED_LOCK:
+            _ATTACHED[self.name] = self
+
+    def _map(self, shm: shared_memory.SharedMemory) -> None:
+        magic, version, length = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            shm.close()
+            raise ValueError(f"{shm.name} is not a shared holiday calendar")
+        metadata = json.loads(
+            bytes(shm.buf[_HEADER.size : _HEADER.size + length])
+        )
+        count = metadata["count"]
+        start = _align(_HEADER.size + length)
+        middle = _align(start + count * 4)
+        codes = array(metadata["codes"])
+        # Views of views share the block's buffer: release the slices once
+        # cast, so that close() only has the casts to release.
+        view = shm.buf[start : start + count * 4]
+        ordinals = view.cast("i")
+        view.release()
+        view = shm.buf[middle : middle + count * codes.itemsize]
+        codes_view = view.cast(codes.typecode)
+        view.release()
+        self._init(
+            metadata["country"],
+            metadata["subdiv"],
+            metadata["observed"],
+            metadata["en_name"],
+            metadata["strict"],
+            frozenset(metadata["years"]),
+            ordinals,
+            codes_view,
+            [sys.intern(name) for name in metadata["names"]],
+        )
+        object.__setattr__(self, "name", shm.name)
+        object.__setattr__(self, "_shm", shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedHolidays":
+        """Return the shared calendar in the block **name**, mapping it in
+        this process if it is not already."""
+        with _ATTACHED_LOCK:
+            shared = _ATTACHED.get(name)
+            if shared is None:
+                shm = (
+                    shared_memory.SharedMemory(name, track=False)
+                    if sys.version_info >= (3, 13)
+                    else shared_memory.SharedMemory(name)
+                )
+                shared = cls.__new__(cls)
+                shared._map(shm)
+                _ATTACHED[name] = shared
+        return shared
+
+    def close(self) -> None:
+        """Unmap the block from this process; the calendar can no longer
+        be used. The block itself remains until :meth:`unlink`."""
+        shm = self._shm
+        if shm is None:
+            return
+        with _ATTACHED_LOCK:
+            if _ATTACHED.get(self.name) is self:
+                del _ATTACHED[self.name]
+        self._ordinals.release()
+        self._codes.release()
+        object.__setattr__(self, "_shm", None)
+        shm.close()
+
+    def unlink(self) -> None:
+        """Close the calendar and remove its block, once no process needs
+        it any more. Processes still attached keep their mapping."""
+        shm = self._shm
+        if shm is None:
+            shm = shared_memory.SharedMemory(self.name)
+            shm.close()
+        self.close()
+        shm.unlink()
+
+    def __enter__(self) -> "SharedHolidays":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.unlink()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return attach, (self.name,)
+
+    def memory_footprint(self) -> int:
+        """Return the approximate memory, in bytes, of this calendar in this
+        process: the shared block is not counted."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.years)
+            + sys.getsizeof(self._names)
+            + sum(sys.getsizeof(name) for name in self._names)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SharedHolidays {self.country} ({len(self)} holidays) "
+            f"in {self.name}>"
+        )
+
+
+def attach(name: str) -> SharedHolidays:
+    """Return the shared calendar in the block **name** (see
+    :meth:`SharedHolidays.attach`)."""
+    return SharedHolidays.attach(name)
@@ -0,0 +1,382 @@
+"""Flag the holidays of a column of dates in CSV or JSON Lines data.
+
+Usage: python -m holidays [options] [file ...]
+(or python -m holidays.stream)
+
+The input (the files, or stdin) is read and written in chunks of rows, so
+memory use does not depend on its size. Each row gets three more fields:
+``is_holiday``, ``holiday_name`` and ``is_business_day`` (neither a
+Saturday, a Sunday nor a holiday); they are left empty for rows without a
+date. Dates are read in ISO 8601 format (a date, or a datetime whose date
+part is used) unless a ``strptime`` format is given.
+"""
+
+import csv
+import io
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from holidays.holiday_base import HolidayBase
+from holidays.utils import country_holidays
+
+FIELDS = ("is_holiday", "holiday_name", "is_business_day")
+
+# Results kept per distinct date string; a memo is cleared when it reaches
+# this size, to keep memory bounded.
+_MEMO_SIZE = 100_000
+
+# (is_holiday, holiday_name, is_business_day) of a date.
+_Flags = Tuple[bool, str, bool]
+
+
+class _Annotator:
+    """Parse date strings and look up their holidays, remembering the
+    result for each date."""
+
+    def __init__(
+        self,
+        country: str,
+        en_name: bool,
+        date_format: Optional[str],
+    ) -> None:
+        self.holidays: HolidayBase = country_holidays(
+            country, en_name=en_name
+        )
+        self.date_format = date_format
+        self._days: Dict[date, _Flags] = {}
+        self._strings: Dict[str, date] = {}
+        self._cells: Dict[str, Tuple[str, str, str]] = {}
+
+    def parse(self, value: str) -> date:
+        if self.date_format is None:
+            # An ISO date, or the date part of an ISO datetime.
+            if len(value) > 10 and value[10] not in "T ":
+                raise ValueError(f"Invalid ISO date: {value!r}")
+            return date.fromisoformat(value[:10])
+        day = self._strings.get(value)
+        if day is None:
+            if len(self._strings) >= _MEMO_SIZE:
+                self._strings.clear()
+            day = datetime.strptime(value, self.date_format).date()
+            self._strings[value] = day
+        return day
+
+    def flags(self, value: str) -> Optional[_Flags]:
+        """Return the flags of a date string, None if it is empty."""
+        value = value.strip()
+        if not value:
+            return None
+        day = self.parse(value)
+        flags = self._days.get(day)
+        if flags is None:
+            name = self.holidays.get(day)
+            flags = (
+                name is not None,
+                name or "",
+                self.holidays.is_business_day(day),
+            )
+            if len(self._days) >= _MEMO_SIZE:
+                self._days.clear()
+            self._days[day] = flags
+        return flags
+
+    def cells(self, value: str) -> Tuple[str, str, str]:
+        """Return the CSV cells of a date string."""
+        cells = self._cells.get(value)
+        if cells is None:
+            flags = self.flags(value)
+            if flags is None:
+                cells = ("", "", "")
+            else:
+                cells = (
+                    "true" if flags[0] else "false",
+                    flags[1],
+                    "true" if flags[2] else "false",
+                )
+            if len(self._cells) >= _MEMO_SIZE:
+                self._cells.clear()
+            self._cells[value] = cells
+        return cells
+
+
+# The annotator of a worker process, set up by _init_worker.
+_annotator: Optional[_Annotator] = None
+
+
+def _init_worker(
+    country: str, en_name: bool, date_format: Optional[str]
+) -> None:
+    global _annotator
+    _annotator = _Annotator(country, en_name, date_format)
+
+
+def _annotate_csv(
+    annotator: _Annotator, rows: List[List[str]], index: int, first: int
+) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for number, row in enumerate(rows, first):
+        try:
+            row.extend(
+                annotator.cells(row[index] if index < len(row) else "")
+            )
+        except ValueError as e:
+            raise ValueError(f"row {number}: {e}") from None
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def _annotate_jsonl(
+    annotator: _Annotator, lines: List[str], column: str, first: int
+) -> str:
+    out = []
+    for number, line in enumerate(lines, first):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"row {number}: {e}") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"row {number}: not a JSON object")
+        try:
+            flags = annotator.flags(str(record.get(column) or ""))
+        except ValueError as e:
+            raise ValueError(f"row {number}: {e}") from None
+        if flags is None:
+            record.update(dict.fromkeys(FIELDS))
+        else:
+            record.update(zip(FIELDS, flags))
+        out.append(json.dumps(record, ensure_ascii=False))
+        out.append("\n")
+    return "".join(out)
+
+
+def _annotate_chunk(kind: str, rows: List[Any], key: Any, first: int) -> str:
+    """Annotate a chunk in a worker process."""
+    assert _annotator is not None
+    if kind == "csv":
+        return _annotate_csv(_annotator, rows, key, first)
+    return _annotate_jsonl(_annotator, rows, key, first)
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def annotate_stream(
+    lines: Iterable[str],
+    out: Any,
+    kind: str = "csv",
+    column: str = "date",
+    country: str = "KR",
+    en_name: bool = False,
+    date_format: Optional[str] = None,
+    chunk_size: int = 10_000,
+    workers: Optional[int] = None,
+    header: bool = True,
+) -> int:
+    """
+    Annotate CSV or JSON Lines data with holiday fields, chunk by chunk.
+
+    :param lines:
+        The input lines; CSV data starts with a header row.
+
+    :param out:
+        The text stream the annotated data is written to.
+
+    :param kind:
+        ``'csv'`` or ``'jsonl'``.
+
+    :param column:
+        The name of the column (or JSON field) holding the dates.
+
+    :param country:
+        The country, as accepted by :func:`country_holidays`.
+
+    :param en_name:
+        Whether to write English holiday names.
+
+    :param date_format:
+        A :meth:`datetime.strptime` format for the dates; ISO 8601 by
+        default.
+
+    :param chunk_size:
+        The number of rows read, annotated and written at a time.
+
+    :param workers:
+        The number of processes annotating chunks in parallel; by default
+        (or with 1) everything is done in this process. The output keeps
+        the order of the input.
+
+    :param header:
+        Whether to write the CSV header row, to append to output that has
+        one already.
+
+    :return:
+        The number of rows annotated.
+    """
+    annotator = _Annotator(country, en_name, date_format)
+    if kind == "csv":
+        reader = csv.reader(lines)
+        names = next(reader, None)
+        if names is None:
+            return 0
+        if column not in names:
+            raise ValueError(f"No column {column!r} in the CSV header")
+        key: Any = names.index(column)
+        if header:
+            csv.writer(out, lineterminator="\n").writerow(
+                names + list(FIELDS)
+            )
+        rows: Iterable[Any] = reader
+    elif kind == "jsonl":
+        key = column
+        rows = lines
+    else:
+        raise ValueError(f"Unknown input format {kind!r}")
+
+    count = 0
+    if workers is None or workers <= 1:
+        annotate = _annotate_csv if kind == "csv" else _annotate_jsonl
+        for chunk in _chunks(rows, chunk_size):
+            out.write(annotate(annotator, chunk, key, count + 1))
+            count += len(chunk)
+        return count
+
+    # Keep at most two chunks per worker in flight, writing them in order.
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(country, en_name, date_format),
+    ) as pool:
+        pending: deque = deque()
+        for chunk in _chunks(rows, chunk_size):
+            if len(pending) >= 2 * workers:
+                out.write(pending.popleft().result())
+            pending.append(
+                pool.submit(_annotate_chunk, kind, chunk, key, count + 1)
+            )
+            count += len(chunk)
+        while pending:
+            out.write(pending.popleft().result())
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m holidays",
+        description="Flag the holidays of a column of dates in CSV or JSON "
+        "Lines data, adding the fields " + ", ".join(FIELDS) + ".",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="input files (default: stdin)"
+    )
+    parser.add_argument(
+        "-c", "--column", default="date", help="date column (default: date)"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "jsonl"),
+        help="input format (default: from the file extension, else csv)",
+    )
+    parser.add_argument(
+        "--date-format",
+        help="strptime format of the dates (default: ISO 8601)",
+    )
+    parser.add_argument(
+        "--country", default="KR", help="country code (default: KR)"
+    )
+    parser.add_argument(
+        "--en-name", action="store_true", help="write English holiday names"
+    )
+    parser.add_argument(
+        "-o", "--output", help="output file (default: stdout)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="rows per chunk (default: 10000)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        help="processes annotating chunks in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="do not report the throughput on stderr",
+    )
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    kind = args.format
+    if kind is None:
+        kind = (
+            "jsonl"
+            if args.files
+            and all(f.endswith((".jsonl", ".ndjson")) for f in args.files)
+            else "csv"
+        )
+    out = (
+        open(args.output, "w", newline="", encoding="utf-8")
+        if args.output
+        else sys.stdout
+    )
+    t0 = time.perf_counter()
+    count = 0
+    try:
+        for number, path in enumerate(args.files or [None]):
+            source = (
+                sys.stdin
+                if path is None
+                else open(path, newline="", encoding="utf-8")
+            )
+            with source:
+                count += annotate_stream(
+                    source,
+                    out,
+                    kind=kind,
+                    column=args.column,
+                    country=args.country,
+                    en_name=args.en_name,
+                    date_format=args.date_format,
+                    chunk_size=args.chunk_size,
+                    workers=args.workers,
+                    header=number == 0,
+                )
+    except (OSError, ValueError, NotImplementedError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - t0
+    if not args.quiet:
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{count} rows in {elapsed:.2f} s ({rate:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,21 @@
-import inspect
+import os
 import warnings
-import pandas as pd
-import matplotlib.pyplot as plt
 from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
 
 from holidays.constants import SAT, SUN
+from holidays.weekend import weekday_range, weekend_ranges
 
 from datetime import date, timedelta
 
-import holidays.countries
-from holidays.holiday_base import HolidayBase
+import holidays.countries  # registers the country classes
+from holidays.holiday_base import (
+    _COUNTRY_CLASSES,
+    HolidayBase,
+    get_country_class,
+)
 
 
 def country_holidays(
@@ -23,8 +26,8 @@ def country_holidays(
     observed: bool = True,
     prov: Optional[str] = None,
     state: Optional[str] = None,
-    en_name : bool = False
-    
+    en_name : bool = False,
+    strict: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -55,6 +58,10 @@ def country_holidays(
     :param state:
         *deprecated* use subdiv instead.
 
+    :param strict:
+        Whether string dates must be in ISO 8601 format instead of any
+        format recognized by :func:`dateutil.parser.parse`.
+
     :return: #반환값 : 해당 나라의 HolydayBase(dict) 
         A :py:class:`HolidayBase` object matching the **country**.
 
@@ -160,27 +167,81 @@ def country_holidays(
     :class:`HolidayBase` class and define your own :meth:`_populate` method.
     See documentation for examples.
     """
-    try:
-        country_classes = inspect.getmembers(
-            holidays.countries, inspect.isclass
-        )
-        country_class = next(
-            obj for name, obj in country_classes if name == country
-        )
-        country_holiday = country_class(
-            years=years,
-            subdiv=subdiv,
-            expand=expand,
-            observed=observed,
-            prov=prov,
-            state=state,
-            en_name = en_name
-        )
-    except StopIteration:
-        raise NotImplementedError(f"Country {country} not available")
+    country_class = get_country_class(country)
+    return country_class(
+        years=years,
+        subdiv=subdiv,
+        expand=expand,
+        observed=observed,
+        prov=prov,
+        state=state,
+        en_name = en_name,
+        strict=strict,
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_country_holidays(
+    country_class: Type[HolidayBase],
+    years: Tuple[int, ...],
+    observed: bool,
+    en_name: bool,
+) -> HolidayBase:
+    country_holiday = country_class(
+        years=years, expand=False, observed=observed, en_name=en_name
+    )
+    country_holiday._read_only = True
     return country_holiday
 
 
+def cached_country_holidays(
+    country: str,
+    years: Union[int, Iterable[int]],
+    observed: bool = True,
+    en_name: bool = False,
+) -> HolidayBase:
+    """
+    Returns a shared, read-only :py:class:`HolidayBase` object with the
+    public holidays of the country matching **country** for **years**.
+
+    Calls with the same country class, years and flags return the same
+    object, calculated once, which makes this suitable for calling once
+    per request. The object does not expand to other years, and changing
+    it raises a :class:`TypeError`; make a :func:`copy.copy` of it to get
+    a calendar that can be changed. The most recently used 128 calendars
+    are kept; :func:`cached_country_holidays.cache_clear` drops them all.
+
+    :param country:
+        A country class name, ISO 3166-1 Alpha-2 country code or alias, as
+        accepted by :func:`country_holidays`.
+
+    :param years:
+        The year(s) to calculate public holidays for.
+
+    :param observed:
+        Whether to include the dates of when public holiday are observed.
+
+    :param en_name:
+        Whether to use English holiday names.
+
+    :return:
+        A read-only :py:class:`HolidayBase` object matching the
+        **country**.
+    """
+    if isinstance(years, int):
+        years = (years,)
+    else:
+        years = tuple(sorted(set(years)))
+    return _cached_country_holidays(
+        get_country_class(country), years, observed, en_name
+    )
+
+
+cached_country_holidays.cache_clear = (  # type: ignore[attr-defined]
+    _cached_country_holidays.cache_clear
+)
+
+
 def CountryHoliday(
     country: str,
     subdiv: Optional[str] = None,
@@ -215,14 +276,14 @@ def list_supported_countries() -> Dict[str, List[str]]:
     """
     return {
         obj.country: obj.subdivisions
-        for name, obj in inspect.getmembers(
-            holidays.countries, inspect.isclass
-        )
+        for obj in _COUNTRY_CLASSES.values()
         if obj.__base__ == HolidayBase
     }
 
 
 def sorted_series_countries(base) :
+    import pandas as pd
+
     df = pd.Series(dict(base.items()))
     df = df.sort_index()
     return df
@@ -230,93 +291,299 @@ def sorted_series_countries(base) :
 
 def count_sun(year) : #1 year
     
-    sun_num = 0
-    sun_date = []
+    sun_days = weekday_range(year, SUN)
     
-    for month in range(1,13) :
-        if month in [JAN, MAR, MAY, JUL, AUG, OCT, DEC] :
-            for day in range(1,32) :
-                if date(year,month,day).weekday() == SUN :
-                    sun_num = sun_num + 1
-                    sun_date.append(date(year,month,day))
-        elif month == 2 :
-            if ((year % 4 == 0) and (year % 100 != 0)) or (year % 400 == 0): 
-                for day in range(1,30) :
-                    if date(year,month,day).weekday() == SUN :
-                        sun_num = sun_num + 1
-                        sun_date.append(date(year,month,day))
-            else :
-                for day in range(1,29) :
-                    if date(year,month,day).weekday() == SUN :
-                        sun_num = sun_num + 1
-                        sun_date.append(date(year,month,day))
-        else :
-            for day in range(1,31) :
-                if date(year,month,day).weekday() == SUN :
-                    sun_num = sun_num + 1
-                    sun_date.append(date(year,month,day))
-                    
-                    
-    return sun_num, sun_date
+    return len(sun_days), list(map(date.fromordinal, sun_days))
 
 
 def count_sat(year) : #1 year
     
-    sat_num = 0
-    sat_date = []
+    sat_days = weekday_range(year, SAT)
     
-    for month in range(1,13) :
-        if month in [JAN, MAR, MAY, JUL, AUG, OCT, DEC] :
-            for day in range(1,32) :
-                if date(year,month,day).weekday() == SAT :
-                    sat_num = sat_num + 1
-                    sat_date.append(date(year,month,day))
-        elif month == 2 :
-            if ((year % 4 == 0) and (year % 100 != 0)) or (year % 400 == 0): 
-                for day in range(1,30) :
-                    if date(year,month,day).weekday() == SAT :
-                        sat_num = sat_num + 1
-                        sat_date.append(date(year,month,day))
-            else :
-                for day in range(1,29) :
-                    if date(year,month,day).weekday() == SAT :
-                        sat_num = sat_num + 1
-                        sat_date.append(date(year,month,day))
-        else :
-            for day in range(1,31) :
-                if date(year,month,day).weekday() == SAT :
-                    sat_num = sat_num + 1
-                    sat_date.append(date(year,month,day))
-                    
-                    
-    return sat_num, sat_date
+    return len(sat_days), list(map(date.fromordinal, sat_days))
                  
         
 def count_holidays(base, year, include_sun = False, include_sat = False) : #1 year
     
-    holiday_num, holiday_date = len(base), list(base.keys())
+    holiday_num = len(base)
     
     if include_sun == True :
         
-        sum_num, sun_date = count_sun(year)
+        weekend = [SAT, SUN] if include_sat == True else [SUN]
+        holiday_ordinals = {day.toordinal() for day in base.keys()}
         
-        if include_sat == True :
-            
-            sat_num, sat_date = count_sat(year)
-            net_holiday_date = list(set(holiday_date+sat_date+sun_date))
-            net_holiday_num = len(net_holiday_date)
-            
-            return net_holiday_num
-            
-        net_holiday_date = list(set(holiday_date+sun_date))
-        net_holiday_num = len(net_holiday_date)
+        for weekend_days in weekend_ranges(year, weekend = weekend) :
+            holiday_num += sum(
+                1 for ordinal in weekend_days
+                if ordinal not in holiday_ordinals
+            )
         
-        return net_holiday_num
+        return holiday_num
 
     else :
         return holiday_num
     
 
+def holiday_stats(
+    start: int,
+    end: int,
+    freq: str = "Y",
+    include_sat: bool = False,
+    include_sun: bool = False,
+    country: str = "Korea",
+):
+    """
+    Count the holidays and days off of every year or month of a span.
+
+    The holidays of the span are calculated once, in one calendar, and the
+    counts are grouped over an array of all the days of the span.
+
+    :param start:
+        The first year.
+
+    :param end:
+        The last year.
+
+    :param freq:
+        ``'Y'`` for one row per year, ``'M'`` for one row per month.
+
+    :param include_sat:
+        Whether Saturdays are days off.
+
+    :param include_sun:
+        Whether Sundays are days off.
+
+    :param country:
+        The country, as accepted by :func:`country_holidays`.
+
+    :return:
+        A :class:`pandas.DataFrame` with a ``year`` column (and a ``month``
+        column if **freq** is ``'M'``) and the columns ``holidays`` (the
+        number of holiday dates), ``weekend`` (the number of included
+        weekend days), ``overlap`` (the holidays falling on an included
+        weekend day) and ``off_days`` (the days that are a holiday or an
+        included weekend day). Its ``attrs['weekend']`` records the
+        **include_sat** and **include_sun** it was counted with.
+
+    Example:
+
+    >>> from holidays import holiday_stats
+    >>> holiday_stats(2023, 2024, include_sat=True, include_sun=True)
+       year  holidays  weekend  overlap  off_days
+    0  2023        16      105        5       116
+    1  2024        17      104        3       118
+    """
+    import numpy as np
+    import pandas as pd
+
+    if freq not in ("Y", "M"):
+        raise ValueError(f"freq must be 'Y' or 'M', not {freq!r}")
+
+    base = country_holidays(country)
+    base.populate_range(start, end)
+    first = date(start, 1, 1).toordinal()
+    stop = date(end + 1, 1, 1).toordinal()
+    ordinals = np.asarray(base._ordinals, dtype=np.int64)
+    ordinals = ordinals[(ordinals >= first) & (ordinals < stop)]
+
+    days = np.arange(first, stop, dtype=np.int64)
+    is_holiday = np.zeros(len(days), dtype=bool)
+    is_holiday[ordinals - first] = True
+    weekend = [
+        weekday
+        for weekday, included in ((SAT, include_sat), (SUN, include_sun))
+        if included
+    ]
+    # date.fromordinal(1) is a Monday.
+    is_weekend = np.isin((days - 1) % 7, weekend)
+
+    epoch = date(1970, 1, 1).toordinal()
+    months = (days - epoch).astype("datetime64[D]").astype("datetime64[M]")
+    month_numbers = months.astype(np.int64)
+    columns = {"year": month_numbers // 12 + 1970}
+    if freq == "M":
+        columns["month"] = month_numbers % 12 + 1
+    frame = pd.DataFrame(columns)
+    frame["holidays"] = is_holiday
+    frame["weekend"] = is_weekend
+    frame["overlap"] = is_holiday & is_weekend
+    frame["off_days"] = is_holiday | is_weekend
+    stats = (
+        frame.groupby(list(columns), sort=True)
+        .sum()
+        .astype(np.int64)
+        .reset_index()
+    )
+    stats.attrs["weekend"] = {
+        "include_sat": bool(include_sat),
+        "include_sun": bool(include_sun),
+    }
+    return stats
+
+
+def _day_ordinals(values, tz):
+    """Return the day ordinals of a slice of date-like values as an int32
+    NumPy array, -1 for missing values; timezone-aware timestamps are
+    converted to **tz** first, naive ones are taken as local dates."""
+    import numpy as np
+    import pandas as pd
+
+    values = pd.Series(values, copy=False)
+    if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+        values = pd.to_datetime(values)
+    if getattr(values.dtype, "tz", None) is not None:
+        values = values.dt.tz_convert(tz).dt.tz_localize(None)
+    days = values.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    ordinals = days.astype(np.int64) + date(1970, 1, 1).toordinal()
+    ordinals[np.isnat(days)] = -1
+    return ordinals.astype(np.int32)
+
+
+def annotate(
+    data,
+    column: Optional[str] = None,
+    country: Union[str, HolidayBase] = "Korea",
+    tz: str = "Asia/Seoul",
+    chunk_size: int = 1_000_000,
+):
+    """
+    Tell, for each date of a column, whether it is a holiday, its name and
+    whether it is a substitute holiday.
+
+    The years present in the column are calculated once, together. The
+    dates are converted to integer day ordinals in chunks of **chunk_size**
+    rows, each distinct day is looked up once, and every row then takes the
+    result of its day, so that the memory used beyond the result stays
+    bounded. Missing values (``NaT``) are not holidays.
+
+    :param data:
+        A :class:`pandas.Series` of dates, or a :class:`pandas.DataFrame`
+        holding them in **column**. Values that are not datetimes are
+        converted with :func:`pandas.to_datetime`.
+
+    :param column:
+        The column of dates, for a DataFrame.
+
+    :param country:
+        The country, as accepted by :func:`country_holidays`, or a
+        :class:`HolidayBase` instance.
+
+    :param tz:
+        The timezone whose local date is used for timezone-aware
+        timestamps; naive timestamps are taken as local already.
+
+    :param chunk_size:
+        The number of rows converted and joined at a time.
+
+    :return:
+        For a Series, a :class:`pandas.DataFrame` with the same index and
+        the columns ``is_holiday``, ``holiday_name`` (categorical, missing
+        for days that are not holidays) and ``is_substitute``; for a
+        DataFrame, a copy of it with these columns added.
+
+    Example:
+
+    >>> import pandas as pd
+    >>> from holidays import annotate
+    >>> days = pd.Series(pd.to_datetime(
+    ...     ['2024-09-16 15:00', '2024-10-08 14:59', None], utc=True
+    ... ))
+    >>> annotate(days)
+       is_holiday holiday_name  is_substitute
+    0        True           추석          False
+    1       False          NaN          False
+    2       False          NaN          False
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        if column is None:
+            raise ValueError("column must be given for a DataFrame")
+        values = data[column]
+    else:
+        values = data
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    base = (
+        country
+        if isinstance(country, HolidayBase)
+        else country_holidays(country)
+    )
+
+    epoch = date(1970, 1, 1).toordinal()
+    size = len(values)
+    days = np.empty(size, dtype=np.int32)
+    # The distinct days (and -1 for missing values), sorted.
+    uniques = np.empty(0, dtype=np.int32)
+    for start in range(0, size, chunk_size):
+        chunk = _day_ordinals(values.iloc[start : start + chunk_size], tz)
+        days[start : start + chunk_size] = chunk
+        uniques = np.union1d(uniques, chunk)
+    if base.expand:
+        valid = uniques[uniques > 0].astype(np.int64)
+        years = np.unique(
+            (valid - epoch).astype("datetime64[D]").astype("datetime64[Y]")
+        )
+        base.populate_years((years.astype(np.int64) + 1970).tolist())
+
+    names = [
+        dict.__getitem__(base, date.fromordinal(ordinal))
+        for ordinal in base._ordinals
+    ]
+    categories = sorted(set(names))
+    category_codes = {name: code for code, name in enumerate(categories)}
+    language = 1 if base.en_name else 0
+    suffixes = tuple(
+        suffix[language] for suffix in base.substitute_suffixes
+    )
+    substitutes = np.array(
+        [
+            bool(suffixes)
+            and any(part.endswith(suffixes) for part in name.split(", "))
+            for name in categories
+        ],
+        dtype=bool,
+    )
+
+    # The name code and substitute flag of every distinct day, -1 and False
+    # for the days that are not holidays and for missing values.
+    dtype = np.min_scalar_type(-max(len(categories), 1))
+    unique_codes = np.full(len(uniques), -1, dtype=dtype)
+    ordinals = np.asarray(base._ordinals, dtype=np.int64)
+    if len(ordinals):
+        found = np.searchsorted(ordinals, uniques)
+        np.minimum(found, len(ordinals) - 1, out=found)
+        matched = ordinals[found] == uniques
+        unique_codes[matched] = [
+            category_codes[names[index]] for index in found[matched]
+        ]
+    unique_substitutes = np.zeros(len(uniques), dtype=bool)
+    unique_holidays = unique_codes >= 0
+    unique_substitutes[unique_holidays] = substitutes[
+        unique_codes[unique_holidays]
+    ]
+
+    codes = np.empty(size, dtype=dtype)
+    is_substitute = np.empty(size, dtype=bool)
+    for start in range(0, size, chunk_size):
+        positions = np.searchsorted(uniques, days[start : start + chunk_size])
+        codes[start : start + chunk_size] = unique_codes[positions]
+        is_substitute[start : start + chunk_size] = unique_substitutes[
+            positions
+        ]
+    del days
+    is_holiday = codes >= 0
+    columns = {
+        "is_holiday": is_holiday,
+        "holiday_name": pd.Categorical.from_codes(codes, categories),
+        "is_substitute": is_substitute,
+    }
+    if isinstance(data, pd.DataFrame):
+        return data.assign(**columns)
+    return pd.DataFrame(columns, index=values.index)
+
+
 #def workdays(base, year) :
 #    
 #    if year>=2005 :
@@ -330,32 +597,170 @@ def count_holidays(base, year, include_sun = False, include_sat = False) : #1 ye
     
 
 
-def years_graph(start, end, sat = False, sun = False) :
-    
-    years = list(range(start,end+1)) #x축
-    num = [] #y축
-
-    for year in range(start,end+1) :
-        temp = count_holidays(country_holidays('Korea',years = year),year, include_sat = sat, include_sun = sun)
-        num.append(temp)
-                          
-    plt.figure(figsize= (20,12))
-    plt.bar(x = years, height = num, color = '#FF92FD')
-    plt.ylim((60,72))
-    plt.show()
+def _weekend_flags(sat, sun) :
+    #count_holidays only counts Saturdays along with Sundays
+    return {'include_sat' : bool(sat and sun), 'include_sun' : bool(sun)}
+
+
+def _years_off_days(stats, sat, sun) :
+    """Return the days off of every year of the yearly **stats**, which
+    must count the weekend days as :func:`count_holidays` does for **sat**
+    and **sun**."""
+    weekend = _weekend_flags(sat, sun)
+    if stats.attrs.get('weekend') != weekend :
+        raise ValueError(
+            'stats must count the weekend days as holiday_stats('
+            + ', '.join(f'{flag}={value}' for flag, value in weekend.items())
+            + ') does'
+        )
+    return tuple(stats['off_days'].tolist())
+
+
+@lru_cache(maxsize=64)
+def _years_graph_data(start, end, sat, sun, version) :
+    stats = holiday_stats(start, end, **_weekend_flags(sat, sun))
+    return _years_off_days(stats, sat, sun)
+
+
+@lru_cache(maxsize=64)
+def _months_graph_data(year, version) :
+    return tuple(holiday_stats(year, year, freq = 'M')['holidays'].tolist())
+
+
+@lru_cache(maxsize=64)
+def _render_bars(x, height, color, title, ylim, format, version) :
+    """Render a bar chart to PNG or SVG bytes with matplotlib's Agg
+    renderer, without pyplot, so no display is needed."""
+    import io
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize = (20,12))
+    ax = fig.subplots()
+    ax.bar(x = list(x), height = list(height), color = color)
+    if ylim is not None :
+        ax.set_ylim(ylim)
+    if title is not None :
+        ax.set_title(title, fontsize = 20)
+    buffer = io.BytesIO()
+    # No creation date, so that the same chart gives the same bytes.
+    metadata = {'Date' : None} if format == 'svg' else None
+    fig.savefig(buffer, format = format, metadata = metadata)
+    return buffer.getvalue()
+
+
+def _graph_output(x, height, color, title, ylim, format, path) :
+    """Show the chart with pyplot if neither **format** nor **path** is
+    given, else render it (from the cache if it was rendered before) and
+    write it to **path** or return its bytes."""
+    if format is None and path is None :
+        import matplotlib.pyplot as plt
+
+        plt.figure(figsize= (20,12))
+        plt.bar(x = list(x), height = list(height), color = color)
+        if ylim is not None :
+            plt.ylim(ylim)
+        if title is not None :
+            plt.title(title, fontsize = 20)
+        plt.show()
+        return None
+
+    if format is None :
+        format = os.path.splitext(str(path))[1].lstrip('.').lower() or 'png'
+    if format not in ('png', 'svg') :
+        raise ValueError(f"format must be 'png' or 'svg', not {format!r}")
+    data = _render_bars(
+        tuple(x), tuple(height), color, title, ylim, format,
+        holidays.__version__,
+    )
+    if path is None :
+        return data
+    with open(path, 'wb') as f :
+        f.write(data)
+    return path
+
+
+def years_graph(start, end, sat = False, sun = False, stats = None, format = None, path = None) :
+    """
+    Plot the number of days off (holidays, plus weekend days as counted by
+    :func:`count_holidays`) of every year from **start** to **end**.
+
+    :param stats:
+        The yearly statistics from :func:`holiday_stats` for the span, to
+        plot instead of calculating them. They must count the weekend days
+        the same way, as ``holiday_stats(start, end, include_sat=sat and
+        sun, include_sun=sun)`` does, else a :class:`ValueError` is raised.
+
+    :param format:
+        ``'png'`` or ``'svg'`` to return the chart as bytes.
+
+    :param path:
+        A file to write the chart to, in **format** or the format of its
+        extension.
+
+    :return:
+        The bytes of the chart, the path it was written to, or None if it
+        was shown with :func:`matplotlib.pyplot.show` (when neither
+        **format** nor **path** is given).
+
+    Charts are rendered without a display and cached by their parameters
+    and the library version, as is the data they are computed from.
+    """
+    years = tuple(range(start,end+1)) #x축
+    if stats is None :
+        num = _years_graph_data(start, end, sat, sun, holidays.__version__) #y축
+    else :
+        num = _years_off_days(stats, sat, sun)
+    return _graph_output(years, num, '#FF92FD', None, (60,72), format, path)
     
 
-def months_graph(year) :
-    years = list(range(1,13)) #x축
-    num = [] #y축
+def months_graph(year, stats = None, format = None, path = None) :
+    """
+    Plot the number of holidays of every month of **year**.
+
+    :param stats:
+        The monthly statistics from :func:`holiday_stats` for the year (or
+        for a span including it), to plot instead of calculating them.
+
+    See :func:`years_graph` for **format**, **path** and the return value.
+    """
+    months = tuple(range(1,13)) #x축
+    if stats is None :
+        num = _months_graph_data(year, holidays.__version__) #y축
+    else :
+        year_stats = stats[stats['year'] == year].set_index('month')
+        num = tuple(year_stats['holidays'].reindex(months, fill_value = 0).tolist())
+    title = 'Korean Holidays in {}'.format(year)
+    return _graph_output(months, num, '#B0BF1A', title, None, format, path)
 
-    month_last = {1 : 31, 2 : 28, 3 : 31, 4 : 30, 5 : 31, 6 : 30, 7 : 31, 8 : 31, 9 : 30, 10 : 31, 11 : 30, 12 : 31}
 
-    for month in range(1,13) :
-        temp = len(country_holidays('Korea',years = year)[date(year,month,1):date(year,month,month_last[month])])
-        num.append(temp)
-                          
-    plt.figure(figsize= (20,12))
-    plt.bar(x = years, height = num, color = '#B0BF1A')
-    plt.title('Korean Holidays in {}'.format(year), fontsize = 20)
-    plt.show()
\ No newline at end of file
+def months_graphs(start, end, format = 'png', directory = None) :
+    """
+    Render :func:`months_graph` for every year from **start** to **end**
+    from one populated calendar.
+
+    :param format:
+        ``'png'`` or ``'svg'``.
+
+    :param directory:
+        A directory to write the charts to, as ``<year>.<format>``.
+
+    :return:
+        The bytes of each chart, or the path it was written to, by year.
+    """
+    stats = holiday_stats(start, end, freq = 'M')
+    graphs = {}
+    for year in range(start, end + 1) :
+        path = None
+        if directory is not None :
+            path = os.path.join(directory, f'{year}.{format}')
+        graphs[year] = months_graph(year, stats = stats, format = format, path = path)
+    return graphs
+
+
+def graph_cache_clear() :
+    """Drop the rendered charts and chart data cached by
+    :func:`years_graph` and :func:`months_graph`."""
+    _years_graph_data.cache_clear()
+    _months_graph_data.cache_clear()
+    _render_bars.cache_clear()
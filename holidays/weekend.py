@@ -0,0 +1,100 @@
+"""Weekend days by weekday arithmetic.
+
+The days of a weekday in a span of years form an arithmetic progression of
+day ordinals (:meth:`datetime.date.toordinal`), so they are returned as a
+:class:`range` and counted in constant time, without building a
+:class:`datetime.date` per day. The multi-year functions return NumPy
+arrays.
+"""
+
+from datetime import date
+from typing import Any, Iterable, List, Optional
+
+from holidays.constants import WEEKEND
+
+
+def _first_ordinal(year: int) -> int:
+    return date(year, 1, 1).toordinal()
+
+
+def weekday_range(
+    start: int, weekday: int, end: Optional[int] = None
+) -> range:
+    """Return the day ordinals of every **weekday** from January 1 of year
+    **start** to December 31 of year **end** (**start** by default).
+
+    >>> from holidays.constants import SUN
+    >>> len(weekday_range(2023, SUN))
+    53
+    >>> date.fromordinal(weekday_range(2023, SUN)[0])
+    datetime.date(2023, 1, 1)
+    """
+    first = _first_ordinal(start)
+    stop = _first_ordinal((start if end is None else end) + 1)
+    # date.fromordinal(1) is a Monday, so an ordinal's weekday is
+    # (ordinal - 1) % 7.
+    first += (weekday - (first - 1)) % 7
+    return range(first, stop, 7)
+
+
+def weekday_count(year: int, weekday: int) -> int:
+    """Return the number of **weekday** days in **year** (52 or 53)."""
+    return len(weekday_range(year, weekday))
+
+
+def weekend_ranges(
+    start: int, end: Optional[int] = None, weekend: Iterable[int] = WEEKEND
+) -> List[range]:
+    """Return the day ordinals of the **weekend** days of the years
+    **start** to **end** (**start** by default), one range per weekday."""
+    return [weekday_range(start, weekday, end) for weekday in weekend]
+
+
+def _year_starts(start: int, end: int) -> Any:
+    import numpy as np
+
+    # The day ordinal of January 1 of each year (proleptic Gregorian).
+    previous = np.arange(start - 1, end, dtype=np.int64)
+    return (
+        365 * previous
+        + previous // 4
+        - previous // 100
+        + previous // 400
+        + 1
+    )
+
+
+def weekday_counts(start: int, end: int, weekday: int) -> Any:
+    """Return a NumPy array of the number of **weekday** days in each year
+    from **start** to **end**.
+
+    >>> from holidays.constants import SAT
+    >>> weekday_counts(2020, 2023, SAT)
+    array([52, 52, 53, 52])
+    """
+    import numpy as np
+
+    firsts = _year_starts(start, end + 1)
+    lengths = np.diff(firsts)
+    offsets = (weekday - (firsts[:-1] - 1)) % 7
+    return 52 + (offsets < lengths - 364).astype(np.int64)
+
+
+def weekend_counts(
+    start: int, end: int, weekend: Iterable[int] = WEEKEND
+) -> Any:
+    """Return a NumPy array of the number of **weekend** days in each year
+    from **start** to **end**."""
+    return sum(weekday_counts(start, end, weekday) for weekday in weekend)
+
+
+def weekday_dates(start: int, end: int, weekday: int) -> Any:
+    """Return a NumPy ``datetime64[D]`` array of every **weekday** day of the
+    years **start** to **end**."""
+    import numpy as np
+
+    days = weekday_range(start, weekday, end)
+    epoch = date(1970, 1, 1).toordinal()
+    return np.arange(
+        days.start - epoch, days.stop - epoch, 7, dtype=np.int64
+    ).astype("datetime64[D]")
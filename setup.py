@@ -19,6 +19,7 @@ setuptools.setup(
     url="https://github.com/rabbitcarrot20/korean_holiday_calendar",
     project_urls = project_urls_
     packages=setuptools.find_packages(),
+    package_data={"holidays": ["data/*.bin"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
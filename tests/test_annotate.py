@@ -0,0 +1,46 @@
+import unittest
+from datetime import date, timedelta
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional
+    pd = None
+
+from holidays import KR, annotate
+
+
+@unittest.skipUnless(pd, "pandas is not installed")
+class TestAnnotate(unittest.TestCase):
+    def test_matches_calendar(self):
+        kr = KR(years=range(2019, 2022))
+        days = [date(2019, 1, 1) + timedelta(days=i) for i in range(1000)]
+        values = pd.Series(pd.to_datetime(days + days[::-7] + [None]))
+        for chunk_size in (1, 7, 10_000):
+            with self.subTest(chunk_size=chunk_size):
+                result = annotate(values, country=kr, chunk_size=chunk_size)
+                expected = [kr.get(day) for day in values.dt.date[:-1]]
+                self.assertEqual(
+                    result["is_holiday"].tolist(),
+                    [name is not None for name in expected] + [False],
+                )
+                names = result["holiday_name"].astype(object)
+                self.assertEqual(
+                    names.where(names.notna(), None).tolist(),
+                    expected + [None],
+                )
+                self.assertEqual(
+                    result["is_substitute"].tolist(),
+                    [bool(name and "대체공휴일" in name) for name in expected]
+                    + [False],
+                )
+
+    def test_distant_dates(self):
+        values = pd.Series(
+            pd.to_datetime(["1700-01-01", "2020-01-01", "2200-01-01"])
+        )
+        result = annotate(values, country=KR(years=2020, expand=False))
+        self.assertEqual(result["is_holiday"].tolist(), [False, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
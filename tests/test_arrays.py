@@ -0,0 +1,40 @@
+import unittest
+from datetime import date, timedelta
+
+from holidays import KR
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestLookupArray(unittest.TestCase):
+    def test_matches_scalar_lookups(self):
+        kr = KR()
+        days = [date(2019, 12, 20) + timedelta(days=i) for i in range(400)]
+        values = np.array(days + [None], dtype="datetime64[D]")
+        self.assertEqual(
+            kr.is_holiday_array(values).tolist(),
+            [day in kr for day in days] + [False],
+        )
+        self.assertEqual(
+            kr.holiday_names_array(values).tolist(),
+            [kr.get(day) for day in days] + [None],
+        )
+        self.assertEqual(sorted(kr.years), [2019, 2020, 2021])
+
+    def test_distant_sentinels(self):
+        kr = KR(years=2020, expand=False)
+        values = np.array(
+            ["0001-01-01", "2020-01-01", "2020-01-02", "9999-12-31"],
+            dtype="datetime64[D]",
+        )
+        self.assertEqual(
+            kr.is_holiday_array(values).tolist(), [False, True, False, False]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from datetime import date, timedelta
+
+from holidays import KR
+
+
+class TestAddBusinessDays(unittest.TestCase):
+    def setUp(self):
+        self.reference = KR(years=range(1950, 2051))
+
+    def _walk(self, day, n):
+        step = 1 if n > 0 else -1
+        left = abs(n)
+        while left:
+            day += timedelta(days=step)
+            if day.weekday() < 5 and day not in self.reference:
+                left -= 1
+        return day
+
+    def test_forward_near_last_year(self):
+        kr = KR()
+        day = date(2049, 6, 1)
+        self.assertEqual(kr.add_business_days(day, 300), self._walk(day, 300))
+        self.assertEqual(max(kr.years), 2050)
+
+    def test_backward_near_first_year(self):
+        kr = KR()
+        day = date(1951, 6, 1)
+        self.assertEqual(
+            kr.add_business_days(day, -300), self._walk(day, -300)
+        )
+        self.assertEqual(min(kr.years), 1950)
+
+    def test_large_steps_match_walk(self):
+        for day, n in (
+            (date(2040, 3, 15), 2400),
+            (date(2040, 3, 15), -2400),
+            (date(2050, 12, 30), -1),
+            (date(1950, 1, 2), 1),
+        ):
+            with self.subTest(day=day, n=n):
+                self.assertEqual(
+                    KR().add_business_days(day, n), self._walk(day, n)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
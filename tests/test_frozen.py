@@ -0,0 +1,39 @@
+import pickle
+import unittest
+from datetime import date
+
+from holidays import KR
+from holidays.holiday_base import HolidayBase
+
+
+class LongName(HolidayBase):
+    country = "ZL1"
+
+    def _populate(self, year):
+        self[date(year, 1, 1)] = "Long name " * 1000
+
+
+class TestFrozenHolidays(unittest.TestCase):
+    def test_names_of_the_calendar_only(self):
+        kr = KR(years=2024)
+        frozen = kr.freeze()
+        LongName(years=2024).freeze()
+        self.assertEqual(sorted(frozen._names), sorted(set(kr.values())))
+        self.assertEqual(dict(frozen.items()), dict(kr.items()))
+
+    def test_same_names_shared(self):
+        first = KR(years=2024).freeze()
+        second = KR(years=range(2023, 2025)).freeze()
+        self.assertIs(first["2024-09-17"], second["2024-09-17"])
+
+    def test_footprint_counts_names(self):
+        frozen = LongName(years=2024).freeze()
+        self.assertGreater(frozen.memory_footprint(), 10000)
+
+    def test_pickle(self):
+        frozen = KR(years=range(2020, 2025), en_name=True).freeze()
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+try:
+    import matplotlib  # noqa: F401
+    import pandas  # noqa: F401
+except ImportError:  # the charts need matplotlib and pandas
+    matplotlib = None
+
+from holidays import holiday_stats, years_graph
+
+
+@unittest.skipUnless(matplotlib, "matplotlib or pandas is not installed")
+class TestYearsGraph(unittest.TestCase):
+    def test_stats_counted_like_the_cached_data(self):
+        for sat in (False, True):
+            for sun in (False, True):
+                with self.subTest(sat=sat, sun=sun):
+                    stats = holiday_stats(
+                        2020, 2022, include_sat=sat and sun, include_sun=sun
+                    )
+                    cached = years_graph(2020, 2022, sat, sun, format="svg")
+                    self.assertEqual(
+                        years_graph(
+                            2020, 2022, sat, sun, stats=stats, format="svg"
+                        ),
+                        cached,
+                    )
+
+    def test_stats_counting_other_weekend_days(self):
+        # Saturdays only count along with Sundays.
+        stats = holiday_stats(2020, 2022, include_sat=True)
+        with self.assertRaises(ValueError):
+            years_graph(2020, 2022, sat=True, stats=stats, format="svg")
+
+
+if __name__ == "__main__":
+    unittest.main()
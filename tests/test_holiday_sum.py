@@ -0,0 +1,49 @@
+import unittest
+from datetime import date
+
+from holidays import KR
+from holidays.holiday_base import HolidayBase
+
+
+class NewYear(HolidayBase):
+    country = "ZA1"
+
+    def _populate(self, year):
+        self[date(year, 1, 1)] = "A new year"
+
+
+class Christmas(HolidayBase):
+    country = "ZB1"
+
+    def _populate(self, year):
+        self[date(year, 1, 1)] = "B new"
+        self[date(year, 12, 25)] = "Christmas"
+
+
+class TestMergedNames(unittest.TestCase):
+    # The names of a date in several operands, in the order they used to be
+    # merged in when each year calculated merged all the holidays of the
+    # operands.
+
+    def test_operands_calculating_the_years(self):
+        holidays = KR(years=[2020, 2021], en_name=True) + KR()
+        self.assertEqual(holidays["2020-01-01"], "New Year's Day, 신정")
+        self.assertEqual(holidays["2022-01-01"], "New Year's Day, 신정")
+
+    def test_operands_that_had_the_year_first(self):
+        holidays = KR(years=2020) + NewYear(years=[2019, 2021]) + Christmas()
+        self.assertEqual(holidays["2019-01-01"], "신정, A new year, B new")
+        self.assertEqual(holidays["2020-01-01"], "B new, 신정, A new year")
+        self.assertEqual(holidays["2020-12-25"], "Christmas, 기독탄신일")
+
+    def test_nested_sums(self):
+        holidays = Christmas(years=2021) + NewYear(years=range(2019, 2022))
+        holidays += KR()
+        self.assertEqual(holidays["2019-01-01"], "B new, A new year, 신정")
+        self.assertEqual(holidays["2020-01-01"], "신정, B new, A new year")
+        self.assertEqual(holidays["2021-01-01"], "신정, B new, A new year")
+        self.assertEqual(holidays["2020-12-25"], "기독탄신일, Christmas")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import unittest
+from datetime import date
+
+from holidays import KR
+
+# The holidays of KR(years=range(1950, 2051)) before Korea was expressed as
+# rules, by setting, as {"YYYY-MM-DD": name}.
+BASELINE = os.path.join(
+    os.path.dirname(__file__), "data", "kr_1950_2050.json"
+)
+
+
+class TestKoreaBaseline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(BASELINE, encoding="utf-8") as file:
+            cls.baseline = json.load(file)
+
+    def test_same_holidays_as_baseline(self):
+        for en_name in (False, True):
+            for observed in (True, False):
+                with self.subTest(en_name=en_name, observed=observed):
+                    kr = KR(
+                        years=range(1950, 2051),
+                        en_name=en_name,
+                        observed=observed,
+                    )
+                    expected = self.baseline[
+                        f"en_name={en_name},observed={observed}"
+                    ]
+                    self.assertEqual(
+                        {day.isoformat(): name for day, name in kr.items()},
+                        expected,
+                    )
+
+    def test_years_calculated_one_by_one(self):
+        expected = self.baseline["en_name=False,observed=True"]
+        kr = KR()
+        for day, name in expected.items():
+            self.assertEqual(kr.get(date.fromisoformat(day)), name)
+        self.assertEqual(len(kr), len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
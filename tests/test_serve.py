@@ -0,0 +1,142 @@
+import json
+import unittest
+from datetime import date, timedelta
+
+from holidays import KR
+from holidays.serve import HolidayIndex
+
+
+class TestHolidayIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.index = HolidayIndex(start=2020, end=2021)
+        cls.reference = KR(years=range(2019, 2023))
+
+    def is_business_day(self, day):
+        return day.weekday() < 5 and day not in self.reference
+
+    def walk(self, day, n):
+        step = 1 if n >= 0 else -1
+        if n == 0 and self.is_business_day(day):
+            return day
+        left = abs(n) or 1
+        while left:
+            day += timedelta(days=step)
+            left -= self.is_business_day(day)
+        return day
+
+    def get(self, target):
+        return self.index.answer("GET", target, b"")
+
+    def post(self, path, queries):
+        return self.index.answer("POST", path, json.dumps(queries).encode())
+
+    def assertTableNotGrown(self):
+        business = self.index._business
+        self.assertEqual(
+            (business._first_year, business._last_year), (2020, 2021)
+        )
+
+    def test_get_holiday(self):
+        self.assertEqual(
+            self.get("/holiday?date=2020-01-01&lang=en"),
+            (
+                200,
+                {
+                    "date": "2020-01-01",
+                    "holiday": True,
+                    "name": "New Year's Day",
+                    "business_day": False,
+                },
+            ),
+        )
+
+    def test_get_errors(self):
+        self.assertEqual(self.get("/nowhere")[0], 404)
+        self.assertEqual(self.index.answer("PUT", "/holiday", b"")[0], 405)
+        self.assertEqual(
+            self.get("/holiday?date=2022-01-01"),
+            (400, {"error": "date out of range (2020-2021): 2022-01-01"}),
+        )
+        self.assertEqual(self.get("/business_day?date=2020-01-01&n=x")[0], 400)
+
+    def test_business_day_within_range(self):
+        for day, n in (
+            (date(2021, 12, 20), 9),
+            (date(2020, 1, 10), -6),
+            (date(2021, 12, 31), 0),
+            (date(2020, 1, 1), 0),
+        ):
+            with self.subTest(day=day, n=n):
+                status, result = self.get(
+                    f"/business_day?date={day.isoformat()}&n={n}"
+                )
+                self.assertEqual(status, 200)
+                self.assertEqual(
+                    result["result"], self.walk(day, n).isoformat()
+                )
+        self.assertTableNotGrown()
+
+    def test_business_day_out_of_range(self):
+        for day, n in (
+            (date(2021, 12, 20), 30),
+            (date(2021, 12, 20), 10),
+            (date(2020, 1, 10), -7),
+            (date(2021, 12, 31), 1),
+        ):
+            with self.subTest(day=day, n=n):
+                self.assertEqual(
+                    self.get(f"/business_day?date={day.isoformat()}&n={n}"),
+                    (400, {"error": "Result out of range (2020-2021)"}),
+                )
+        self.assertTableNotGrown()
+
+    def test_business_days_to_end(self):
+        status, result = self.get(
+            "/business_days?start=2021-12-01&end=2022-01-01"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            result["count"],
+            sum(
+                self.is_business_day(date(2021, 12, 1) + timedelta(days=i))
+                for i in range(31)
+            ),
+        )
+        self.assertTableNotGrown()
+
+    def test_post(self):
+        status, results = self.post(
+            "/business_day",
+            [
+                {"date": "2021-12-20", "n": 30},
+                {"date": "2020-09-29", "n": 1},
+                {"date": "2020-13-01"},
+                "2020-01-01",
+            ],
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            results,
+            [
+                {"error": "Result out of range (2020-2021)"},
+                {"date": "2020-09-29", "n": 1, "result": "2020-10-05"},
+                {"error": "Invalid date: '2020-13-01'"},
+                {"error": "Query must be a JSON object"},
+            ],
+        )
+        self.assertTableNotGrown()
+
+    def test_post_errors(self):
+        self.assertEqual(
+            self.index.answer("POST", "/holiday", b"{"),
+            (400, {"error": "Body is not valid JSON"}),
+        )
+        self.assertEqual(
+            self.post("/holiday", {"date": "2020-01-01"}),
+            (400, {"error": "Body must be a JSON array"}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
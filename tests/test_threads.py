@@ -0,0 +1,160 @@
+"""Stress one lazily expanding KR() calendar shared by many threads.
+
+The threads look up random dates of random years (get, in, get_range,
+is_business_day, add_business_days, business_days_between) while the
+calendar calculates the years on demand, with a very short thread switch
+interval to provoke races. Every answer is checked against a calendar
+calculated up front in one thread, and every year must be calculated
+exactly once. Runs with the shared year cache disabled and enabled.
+"""
+
+import random
+import sys
+import threading
+import unittest
+from collections import Counter
+from datetime import date, timedelta
+
+from holidays import KR, year_cache
+from holidays.holiday_base import HolidayBase
+
+START, END = 1950, 2049
+THREADS = 16
+QUERIES = 300
+
+
+class CountingKR(KR):
+    """KR counting how many times each year is calculated."""
+
+    def __init__(self, *args, **kwargs):
+        self.calculated = Counter()
+        self.counter_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _populate_years(self, years, workers=None):
+        with self.counter_lock:
+            self.calculated.update(years)
+        super()._populate_years(years, workers)
+
+
+class SpillingHolidays(HolidayBase):
+    """Sets a date of the next year, and reads the previous year, while
+    calculating a year from 2000 to 2020."""
+
+    country = "ZZ"
+
+    def _populate(self, year):
+        self[date(year, 6, 1)] = "June"
+        if year < 2020:
+            self[date(year + 1, 1, 2)] = "Spill"
+        if year > 2000 and date(year - 1, 6, 1) not in self:
+            raise AssertionError(f"{year - 1} seen incomplete")
+
+
+def worker(kr, seed, expected, is_business_day, errors):
+    rng = random.Random(seed)
+    try:
+        for _ in range(QUERIES):
+            day = date(rng.randint(START, END), 1, 1) + timedelta(
+                days=rng.randrange(365)
+            )
+            kind = rng.randrange(5)
+            if kind == 0:
+                got, want = kr.get(day), expected.get(day)
+            elif kind == 1:
+                got, want = day in kr, day in expected
+            elif kind == 2:
+                stop = day + timedelta(days=rng.randrange(1, 60))
+                got = kr.get_range(day, stop)
+                want = sorted(d for d in expected if day <= d < stop)
+            elif kind == 3:
+                got, want = kr.is_business_day(day), is_business_day(day)
+            else:
+                n = rng.randrange(1, 20)
+                got = kr.add_business_days(day, n)
+                want, left = day, n
+                while left:
+                    want += timedelta(days=1)
+                    left -= is_business_day(want)
+                if got == want:
+                    got = kr.business_days_between(day, got)
+                    want = sum(
+                        is_business_day(day + timedelta(days=i))
+                        for i in range((want - day).days)
+                    )
+            if got != want:
+                errors.append((kind, day, got, want))
+    except BaseException as e:  # reported by the main thread
+        errors.append(e)
+
+
+def run_threads(target, count):
+    pool = [
+        threading.Thread(target=target, args=(seed,)) for seed in range(count)
+    ]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+class TestSharedCalendar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = dict(KR(years=range(START, END + 2)).items())
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        self.cache_size = year_cache.maxsize
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        year_cache.maxsize = self.cache_size
+        year_cache.clear()
+
+    def is_business_day(self, day):
+        return day.weekday() < 5 and day not in self.expected
+
+    def test_answers_and_years_calculated_once(self):
+        for cache_size in (0, 1024):
+            with self.subTest(cache_size=cache_size):
+                year_cache.maxsize = cache_size
+                year_cache.clear()
+                kr = CountingKR()
+                errors = []
+                run_threads(
+                    lambda seed: worker(
+                        kr,
+                        seed,
+                        self.expected,
+                        self.is_business_day,
+                        errors,
+                    ),
+                    THREADS,
+                )
+                self.assertEqual(errors, [])
+                self.assertEqual(
+                    [y for y, n in kr.calculated.items() if n > 1], []
+                )
+
+    def test_years_needed_while_calculating(self):
+        calendar = SpillingHolidays()
+        errors = []
+
+        def lookup(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(50):
+                    year = rng.randint(2000, 2020)
+                    if calendar.get(date(year, 6, 1)) != "June":
+                        errors.append(year)
+            except BaseException as e:
+                errors.append(e)
+
+        run_threads(lookup, THREADS)
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()